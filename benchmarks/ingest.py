@@ -0,0 +1,118 @@
+"""
+CSV ingest time of the current readers against the previous row-by-row implementation
+
+The previous implementation is reproduced below: read_csv built a Series per row with iterrows, and
+read_multipath_csv/read_multipath_energies built a DataFrame per path with groupby.
+
+Run with: python benchmarks/ingest.py [n_rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from reaction_web import Molecule, Path
+from reaction_web.tools.generate_paths import (
+    enumeration_factory,
+    read_csv,
+    read_multipath_csv,
+    read_multipath_energies,
+)
+
+
+def write_csv(filename: str, n_rows: int, n_steps: int = 40) -> None:
+    """
+    Write a shuffled csv of at least n_rows rows, for paths along two r-groups with n_steps molecules each
+    """
+    n_labels = int(np.ceil(np.sqrt(n_rows / n_steps)))
+    labels = [f"R{i}" for i in range(n_labels)]
+    r1, r2, step = (grid.ravel() for grid in np.meshgrid(labels, labels, np.arange(n_steps), indexing="ij"))
+    df = pd.DataFrame({"name": [f"mol{i}" for i in step], "step": step, "r1": r1, "r2": r2})
+    df["energy"] = np.random.default_rng(0).random(len(df))
+    df.sample(frac=1, random_state=0).to_csv(filename, index=False)
+
+
+def old_read_df(infile: str) -> tuple[pd.DataFrame, dict[str, tuple[str, ...]]]:
+    """
+    Previous read_multipath_df, without the checks added since
+    """
+    df = pd.read_csv(infile, skipinitialspace=True).convert_dtypes(infer_objects=True)
+    df.sort_values(["r1", "r2", "step"], inplace=True)
+    return df, {indicator: tuple(df[indicator].unique()) for indicator in ["r1", "r2"]}
+
+
+def old_read_csv(infile: str) -> list[Molecule]:
+    """
+    Previous read_csv, one Series per row
+    """
+    df = pd.read_csv(infile, skipinitialspace=True).convert_dtypes(infer_objects=True)
+    return [Molecule(data["name"], data["energy"]) for _, data in df.iterrows()]
+
+
+def old_read_multipath_csv(infile: str) -> dict[tuple[str, ...], Path]:
+    """
+    Previous read_multipath_csv, one DataFrame per path
+    """
+    df, pi_dict = old_read_df(infile)
+    return {
+        names: Path.from_energies(data["name"], data["energy"], str(names)) for names, data in df.groupby(list(pi_dict))
+    }
+
+
+def old_read_multipath_energies(infile: str) -> np.ndarray:
+    """
+    Previous read_multipath_energies, one DataFrame per path
+    """
+    df, pi_dict = old_read_df(infile)
+    indexers = [{label: i for i, label in enumerate(labels)} for labels in pi_dict.values()]
+    groups = df.groupby(list(pi_dict))
+    species = tuple(next(iter(groups))[1]["name"])
+
+    energies = np.full((*map(len, indexers), len(species)), np.nan)
+    for names, data in groups:
+        energies[tuple(indexer[n] for indexer, n in zip(indexers, names))] = data["energy"].to_numpy(dtype=float)
+    return energies
+
+
+def timed(function: Callable[[], object]) -> float:
+    """
+    Seconds taken by a single call
+    """
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main(n_rows: int = 1_000_000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "paths.csv")
+        write_csv(filename, n_rows)
+        print(f"{len(pd.read_csv(filename))} rows")
+
+        benchmarks = {
+            "read_csv": (lambda: old_read_csv(filename), lambda: read_csv(filename)),
+            "read_multipath_csv": (lambda: old_read_multipath_csv(filename), lambda: read_multipath_csv(filename)),
+            "read_multipath_energies": (
+                lambda: old_read_multipath_energies(filename),
+                lambda: read_multipath_energies(filename),
+            ),
+        }
+        for name, (old, new) in benchmarks.items():
+            print(f"{name:>32}: {timed(old):7.2f} s -> {timed(new):7.2f} s")
+
+        streamed = timed(lambda: enumeration_factory(filename, dense=True, chunksize=2**18))
+        print(f"{'streamed in chunks of 2^18 rows':>32}: {streamed:7.2f} s")
+        start = time.perf_counter()
+        lazy = enumeration_factory(filename, lazy=True)
+        elapsed = time.perf_counter() - start
+        indexed = timed(lambda: lazy[0, 0])
+        print(f"{'enumeration_factory(lazy=True)':>32}: {elapsed:7.2f} s, then {indexed * 1e3:.2f} ms per indexed Path")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
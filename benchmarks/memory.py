@@ -0,0 +1,41 @@
+"""
+Memory and construction time of the core objects
+
+Run with: python benchmarks/memory.py [n_paths]
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from reaction_web import Path
+
+
+def build_paths(n_paths: int, n_steps: int = 5) -> list[Path]:
+    """
+    Build Paths the same way pathify does, with freshly created names for every row
+    """
+    rng = np.random.default_rng(0)
+    energies = rng.random((n_paths, n_steps))
+    names = [[f"mol{i}" for i in range(n_steps)] for _ in range(n_paths)]
+    return [Path.from_energies(path_names, path_energies) for path_names, path_energies in zip(names, energies)]
+
+
+def main(n_paths: int = 100_000) -> None:
+    start = time.perf_counter()
+    build_paths(n_paths)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    paths = build_paths(n_paths)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    n_reactions = sum(map(len, paths))
+    print(f"{n_paths} paths ({n_reactions} reactions): {current / 2**20:.1f} MiB in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,63 @@
+"""
+Pickle size and time of Paths, Webs and Enumerations (e.g. when sent to worker processes)
+
+Webs and object Enumerations pickle as flat records (see storage.to_records), compared with pickling their Paths as
+nested Path, Reaction and Molecule objects.
+
+Run with: python benchmarks/pickling.py [n_paths]
+"""
+
+import pickle
+import sys
+import time
+
+import numpy as np
+
+from reaction_web import Enumeration, Path, Web
+
+
+def build_paths(n_paths: int, n_steps: int = 6) -> list[Path]:
+    """
+    Build Paths the same way pathify does, with freshly created Molecules for every row
+    """
+    rng = np.random.default_rng(0)
+    energies = rng.random((n_paths, n_steps))
+    names = [f"mol{i}" for i in range(n_steps)]
+    return [Path.from_energies(names, path_energies, f"path{i}") for i, path_energies in enumerate(energies)]
+
+
+def measure(item, repeat: int = 3) -> tuple[int, float, float]:
+    """
+    Size of the pickle, and best time to dump and load it
+    """
+    dumps, loads = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = pickle.dumps(item)
+        dumps.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        pickle.loads(data)
+        loads.append(time.perf_counter() - start)
+    return len(data), min(dumps), min(loads)
+
+
+def main(n_paths: int = 10_000) -> None:
+    paths = build_paths(n_paths)
+    array = np.empty(n_paths, dtype=object)
+    for i, path in enumerate(paths):  # Paths are sequences, avoid numpy unpacking them
+        array[i] = path
+
+    items = {
+        "Enumeration (records)": Enumeration(array, {"r1": tuple(path.name for path in paths)}),
+        "Web (records)": Web(paths),
+        "list of Paths (objects)": paths,
+        "single Path (objects)": paths[0],
+    }
+    for name, item in items.items():
+        size, dump, load = measure(item)
+        print(f"{name:>24}: {size / 2**10:9.1f} KiB, dumps {dump * 1e3:8.2f} ms, loads {load * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
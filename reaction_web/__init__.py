@@ -1,10 +1,34 @@
 # isort:skip_file
-from .molecule import Molecule
+from .molecule import Molecule, FrozenMolecule
 from .reaction import Reaction, EReaction
 from .path import Path
+from .stoichiometry import StoichiometryMatrix
 from .web import Web
+from .path_array import PathArray
+from .lazy import LazyPathArray, AdditiveEnergies
 from .enumeration import Enumeration
+from .additive import AdditiveModel
+from .network import Network
+from .species import SpeciesTable
 from .chem_translate import translate
 from .plot import diagram, heatmap
 
-__all__ = ["Molecule", "Reaction", "EReaction", "Path", "Web", "Enumeration", "translate", "diagram", "heatmap"]
+__all__ = [
+    "Molecule",
+    "FrozenMolecule",
+    "Reaction",
+    "EReaction",
+    "Path",
+    "StoichiometryMatrix",
+    "Web",
+    "PathArray",
+    "LazyPathArray",
+    "AdditiveEnergies",
+    "Enumeration",
+    "AdditiveModel",
+    "Network",
+    "SpeciesTable",
+    "translate",
+    "diagram",
+    "heatmap",
+]
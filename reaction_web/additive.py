@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Mapping, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .enumeration import Enumeration
+from .lazy import AdditiveEnergies
+
+Pair = tuple[int, int]
+
+
+@dataclass
+class AdditiveModel:
+    """
+    Additive r-group model of the energies of an Enumeration, the energy of each species is a base energy plus a
+    contribution from the label along each dimension (and optionally from each pair of labels)
+
+    Fit to a sparse subset of the cells so that only a fraction of the grid has to be calculated, the remaining cells
+    are predicted.
+
+    >>> path_names = {"r1": ("H", "F"), "r2": ("H", "C", "I")}
+    >>> observed = {("H", "H"): [0, 1], ("H", "C"): [0, 2], ("H", "I"): [0, 3], ("F", "H"): [0, 2]}
+    >>> model = AdditiveModel.fit(path_names, observed)
+    >>> model.predict([("F", "I")])
+    array([[0., 4.]])
+
+    :param path_names: labels along each dimension
+    :param base: energy of each species shared by all cells, shape (n_steps,)
+    :param contributions: contribution of each label to the energy of each species, shape (n_labels, n_steps) for
+        each dimension
+    :param pairwise: contribution of each pair of labels, shape (n_labels_i, n_labels_j, n_steps) for each pair of
+        dimensions (i, j)
+    :param observed: indices of the cells that were fit, shape (n_observed, ndim)
+    :param residuals: observed - fitted energies of the observed cells, shape (n_observed, n_steps)
+    :param leverage: diagonal of the hat matrix for each observed cell, shape (n_observed,)
+    """
+
+    path_names: dict[str, tuple[str, ...]]
+    base: np.ndarray
+    contributions: tuple[np.ndarray, ...]
+    pairwise: dict[Pair, np.ndarray] = field(default_factory=dict)
+    observed: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=int))
+    residuals: np.ndarray = field(default_factory=lambda: np.empty((0, 0)))
+    leverage: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+    @classmethod
+    def fit(
+        cls,
+        path_names: dict[str, tuple[str, ...]],
+        observed: Mapping[tuple[str, ...], ArrayLike],
+        pairwise: bool | Sequence[tuple[str, str]] = False,
+        penalty: float = 1e-6,
+    ) -> AdditiveModel:
+        """
+        Least-squares fit of the contributions to the observed cells, all steps are fit in a single solve
+
+        Every label must be observed at least once. Pairs of labels that are never observed together have no
+        pairwise contribution, the pairwise terms are weakly penalized so that the additive terms are fit first.
+
+        :param path_names: labels along each dimension
+        :param observed: {labels of the cell: energy of each species}
+        :param pairwise: include pairwise terms for every pair of dimensions (True) or the given pairs of dimensions
+        :param penalty: ridge penalty of the pairwise terms
+        """
+        shape = tuple(map(len, path_names.values()))
+        names = list(path_names)
+        if pairwise is True:
+            pairs = list(combinations(range(len(shape)), 2))
+        else:
+            pairs = [tuple(sorted((names.index(i), names.index(j)))) for i, j in pairwise or []]  # type: ignore
+
+        label_idxs = [{label: i for i, label in enumerate(labels)} for labels in path_names.values()]
+        try:
+            idxs = np.array([[idx[label] for idx, label in zip(label_idxs, labels)] for labels in observed], dtype=int)
+        except KeyError as e:
+            raise KeyError(f"Unknown label {e} in observed") from None
+        energies = np.array([np.asarray(values, dtype=float) for values in observed.values()])
+        if idxs.shape != (len(observed), len(shape)):
+            raise ValueError(f"Expected labels for each of the {len(shape)} dimensions")
+
+        for name, labels, dim_idxs in zip(names, path_names.values(), idxs.T):
+            if missing := set(labels) - {labels[i] for i in dim_idxs}:
+                raise ValueError(f"No observations of {missing} in {name}, unable to fit their contributions")
+
+        X = cls._design(idxs, shape, pairs)  # type: ignore
+        n_additive = 1 + sum(shape)
+        penalties = np.zeros((X.shape[1] - n_additive, X.shape[1]))
+        penalties[:, n_additive:] = np.sqrt(penalty) * np.eye(X.shape[1] - n_additive)
+        A = np.concatenate([X, penalties])
+
+        A_pinv = np.linalg.pinv(A)
+        coefficients = A_pinv[:, : len(X)] @ energies
+        leverage = np.einsum("ij,ji->i", X, A_pinv[:, : len(X)])
+
+        base, *rest = np.split(coefficients, np.cumsum([1, *shape, *(shape[i] * shape[j] for i, j in pairs)])[:-1])
+        contributions, pair_coefficients = rest[: len(shape)], rest[len(shape) :]
+        pair_terms = {
+            pair: coefficient.reshape(shape[pair[0]], shape[pair[1]], -1)
+            for pair, coefficient in zip(pairs, pair_coefficients)
+        }
+
+        return cls(
+            path_names,
+            base[0],
+            tuple(contributions),
+            pair_terms,  # type: ignore
+            idxs,
+            energies - X @ coefficients,
+            leverage,
+        )
+
+    @staticmethod
+    def _design(idxs: np.ndarray, shape: tuple[int, ...], pairs: Sequence[Pair]) -> np.ndarray:
+        """
+        One-hot design matrix of the intercept, the label along each dimension, and each pair of labels
+        """
+        offsets = np.cumsum([1, *shape, *(shape[i] * shape[j] for i, j in pairs)])
+        X = np.zeros((len(idxs), offsets[-1]))
+        X[:, 0] = 1
+        rows = np.arange(len(idxs))
+        for dim in range(len(shape)):
+            X[rows, offsets[dim] + idxs[:, dim]] = 1
+        for offset, (i, j) in zip(offsets[len(shape) :], pairs):
+            X[rows, offset + idxs[:, i] * shape[j] + idxs[:, j]] = 1
+        return X
+
+    def __repr__(self) -> str:
+        return f"<AdditiveModel {tuple(self.path_names)} {self.shape} ({len(self.observed)} observed)>"
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(map(len, self.path_names.values()))
+
+    @property
+    def rmse(self) -> np.ndarray:
+        """
+        Root-mean-square residual of each species over the observed cells
+        """
+        return np.sqrt((self.residuals**2).mean(axis=0))
+
+    @property
+    def loo_residuals(self) -> np.ndarray:
+        """
+        Leave-one-out residuals of the observed cells (from the leverage, without refitting), NaN for cells that
+        determine their own prediction (e.g. the only observation of a label)
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(
+                np.isclose(self.leverage, 1)[:, None], np.nan, self.residuals / (1 - self.leverage[:, None])
+            )
+
+    @property
+    def loo_rmse(self) -> np.ndarray:
+        """
+        Root-mean-square leave-one-out residual of each species, an estimate of the error of the predictions
+        """
+        return np.sqrt(np.nanmean(self.loo_residuals**2, axis=0))
+
+    @property
+    def energies(self) -> AdditiveEnergies | np.ndarray:
+        """
+        Predicted energies of every cell, shape (*shape, n_steps)
+
+        Evaluated lazily (AdditiveEnergies) unless there are pairwise terms.
+        """
+        additive = AdditiveEnergies(self.base, self.contributions)
+        if not self.pairwise:
+            return additive
+
+        energies = np.array(additive)
+        for (i, j), terms in self.pairwise.items():
+            shape = [1] * len(self.shape) + [terms.shape[-1]]
+            shape[i], shape[j] = terms.shape[:2]
+            energies += terms.reshape(shape)
+        return energies
+
+    def predict(self, labels: Sequence[tuple[str, ...]]) -> np.ndarray:
+        """
+        Predicted energies of the given cells
+
+        :param labels: labels of each cell
+        :return: energy of each species, shape (n_cells, n_steps)
+        """
+        label_idxs = [{label: i for i, label in enumerate(names)} for names in self.path_names.values()]
+        idxs = np.array([[idx[label] for idx, label in zip(label_idxs, cell)] for cell in labels], dtype=int)
+        idxs = idxs.reshape(-1, len(self.shape))
+
+        energies = self.base + sum(contribution[idxs[:, d]] for d, contribution in enumerate(self.contributions))
+        for (i, j), terms in self.pairwise.items():
+            energies = energies + terms[idxs[:, i], idxs[:, j]]
+        return np.asarray(energies).reshape(len(idxs), -1)
+
+    def enumeration(
+        self,
+        species: Sequence[str],
+        ne: Sequence[int] | None = None,
+        ref_pot: Sequence[float] | None = None,
+        units: str | None = None,
+        keep_observed: bool = True,
+    ) -> Enumeration:
+        """
+        Dense Enumeration of the predicted energies
+
+        :param species: names of the species at each step
+        :param ne: number of electrons generated by each reaction
+        :param ref_pot: reference potential of each reaction
+        :param units: units of the energies
+        :param keep_observed: use the observed energies instead of the predictions for the observed cells,
+            otherwise the energies of a purely additive model are evaluated lazily
+        """
+        energies = self.energies
+        if keep_observed and len(self.observed):
+            energies = np.array(energies)
+            energies[tuple(self.observed.T)] += self.residuals
+        return Enumeration.from_energies(energies, self.path_names, species, ne, ref_pot, units)  # type: ignore
@@ -0,0 +1,76 @@
+import numpy as np
+from numpy.typing import ArrayLike
+
+
+def potential_energies(energies: ArrayLike, ne: ArrayLike, u: ArrayLike, us: ArrayLike) -> np.ndarray:
+    """
+    Reaction energies evaluated at each of a series of applied potentials
+
+    >>> potential_energies([1, 2], [1, 0], [0, 0], [0, 1, 2])
+    array([[ 1.,  2.],
+           [ 0.,  2.],
+           [-1.,  2.]])
+
+    :param energies: reaction energies at the current applied potentials, shape (..., n_steps)
+    :param ne: number of electrons generated by each reaction, broadcastable to energies
+    :param u: applied potential that the energies were evaluated at, broadcastable to energies
+    :param us: applied potentials at which to evaluate the energies, shape (n_u,)
+    :return: energies at each potential, shape (..., n_u, n_steps)
+    """
+    energies, ne, u = np.broadcast_arrays(*map(np.asarray, (energies, ne, u)))
+    us = np.asarray(us, dtype=float)[:, None]
+
+    return energies[..., None, :] - (us - u[..., None, :]) * ne[..., None, :]
+
+
+def potential_window(energies: ArrayLike, ne: ArrayLike, u: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Range of applied potentials at which every reaction is downhill
+
+    Reactions that generate electrons (ne > 0) set the lower bound, those that absorb electrons (ne < 0) set the
+    upper bound. Both bounds are nan if no potential makes every reaction downhill, and unbounded sides are +-inf.
+
+    >>> potential_window([[1, -1, -4], [0.3, -0.1, 0], [1, 1, 0]], [[1, 0, -2], [-1, -1, 0], [1, 0, 2]], 0)
+    (array([  1., -inf,  nan]), array([ 2. , -0.3,  nan]))
+
+    :param energies: reaction energies at the current applied potentials, shape (..., n_steps)
+    :param ne: number of electrons generated by each reaction, broadcastable to energies
+    :param u: applied potential that the energies were evaluated at, broadcastable to energies
+    :return: lower and upper bounds for each path, each with shape (...)
+    """
+    energies, ne, u = np.broadcast_arrays(*map(np.asarray, (energies, ne, u)))
+    energies = energies.astype(float)
+
+    # energy(U) = zero_energies - U * ne
+    zero_energies = energies + u * ne
+    onsets = np.divide(zero_energies, ne, out=np.zeros_like(energies), where=ne != 0)
+
+    lower = np.where(ne > 0, onsets, -np.inf).max(axis=-1)
+    upper = np.where(ne < 0, onsets, np.inf).min(axis=-1)
+    chemical_downhill = np.where(ne == 0, zero_energies <= 0, True).all(axis=-1)
+
+    attainable = chemical_downhill & (lower <= upper)
+    return np.where(attainable, lower, np.nan), np.where(attainable, upper, np.nan)
+
+
+def limiting_potential(energies: ArrayLike, ne: ArrayLike, u: ArrayLike) -> np.ndarray:
+    """
+    Limiting potential of each path in the direction it is driven by the applied potential (see potential_window)
+
+    The lowest applied potential at which every reaction is downhill, except for reductive paths (every
+    electrochemical reaction absorbs electrons, ne < 0) where it is the highest. nan if no potential makes every
+    reaction downhill, -inf if a path without electrochemical reactions is downhill.
+
+    >>> limiting_potential([[1, -1, 2], [1, 1, 0], [0.3, -0.1, 0]], [[1, 0, 2], [1, 0, 2], [-1, -1, 0]], 0)
+    array([ 1. ,  nan, -0.3])
+
+    :param energies: reaction energies at the current applied potentials, shape (..., n_steps)
+    :param ne: number of electrons generated by each reaction, broadcastable to energies
+    :param u: applied potential that the energies were evaluated at, broadcastable to energies
+    :return: limiting potential for each path, shape (...)
+    """
+    lower, upper = potential_window(energies, ne, u)
+    ne = np.broadcast_to(ne, np.broadcast_shapes(np.shape(energies), np.shape(ne), np.shape(u)))
+    reductive = (ne < 0).any(axis=-1) & ~(ne > 0).any(axis=-1)
+
+    return np.where(reductive, upper, lower)
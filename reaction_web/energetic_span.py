@@ -0,0 +1,74 @@
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .tools.helper import energy_conversion
+
+BOLTZMANN_PLANCK = 2.083661912e10
+"""Boltzmann constant over Planck constant (1/(s K))"""
+GAS_CONSTANT = 8.314462618e-3
+"""Gas constant (kJ/(mol K))"""
+
+
+def energetic_span(relative_energies: ArrayLike) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Energetic span of catalytic cycles, the largest energy difference between a TOF-determining transition state
+    (TDTS) and intermediate (TDI), adding the cycle energy if the TDTS precedes the TDI
+
+    Every state of the cycle is considered as both a potential TDTS and TDI. Evaluated in O(n_states) using the
+    cumulative minimum of the states preceding and following each potential TDTS.
+
+    >>> energetic_span([0, 5, -10, 4, -2])
+    (array(14.), array(2), array(3))
+    >>> energetic_span([0, 5, -10, -5, -20])
+    (array(5.), array(0), array(1))
+
+    :param relative_energies: cumulative energy along each cycle, the last state is the start of the next cycle,
+        shape (..., n_states + 1), masked (trailing) values are ignored
+    :return: span, index of the TDI, and index of the TDTS of each cycle, shape (...)
+    """
+    mask = np.ma.getmaskarray(relative_energies)  # type: ignore
+    energies = np.ma.getdata(relative_energies).astype(float)
+    idxs = np.arange(energies.shape[-1])
+
+    # the last state is the first state of the next cycle
+    last = (~mask).sum(axis=-1, keepdims=True) - 1
+    cycle = np.take_along_axis(energies, last, axis=-1)
+    mask = mask | (idxs >= last)
+    intermediates = np.where(mask, np.inf, energies)
+    transition_states = np.where(mask, -np.inf, energies)
+
+    # lowest intermediate preceding (or at) each state
+    preceding = np.minimum.accumulate(intermediates, axis=-1)
+    preceding_idxs = np.maximum.accumulate(np.where(intermediates <= preceding, idxs, 0), axis=-1)
+
+    # lowest intermediate following each state
+    following = np.minimum.accumulate(intermediates[..., ::-1], axis=-1)[..., ::-1]
+    following_idxs = np.minimum.accumulate(np.where(intermediates <= following, idxs, idxs[-1])[..., ::-1], axis=-1)
+    following = np.concatenate([following[..., 1:], np.full_like(following[..., :1], np.inf)], axis=-1)
+    following_idxs = np.concatenate([following_idxs[..., ::-1][..., 1:], following_idxs[..., :1]], axis=-1)
+
+    forward_spans = transition_states - preceding
+    backward_spans = transition_states - following + cycle
+    spans = np.maximum(forward_spans, backward_spans)
+
+    tdts = spans.argmax(axis=-1)[..., None]
+    tdi = np.take_along_axis(np.where(backward_spans > forward_spans, following_idxs, preceding_idxs), tdts, axis=-1)
+    span = np.take_along_axis(spans, tdts, axis=-1)
+
+    return span[..., 0], tdi[..., 0], tdts[..., 0]
+
+
+def turnover_frequency(span: ArrayLike, temperature: float = 298.15, units: str = "eV") -> np.ndarray:
+    """
+    Apparent turnover frequency from the energetic span, TOF = k_B T / h exp(-span / RT)
+
+    >>> round(float(turnover_frequency(0.75)), 3)
+    1.305
+
+    :param span: energetic span of each cycle
+    :param temperature: temperature (K)
+    :param units: units of the span
+    :return: turnover frequency (1/s)
+    """
+    span = np.asarray(span, dtype=float) * energy_conversion(units, "kJ/mol")
+    return BOLTZMANN_PLANCK * temperature * np.exp(-span / (GAS_CONSTANT * temperature))
@@ -1,11 +1,27 @@
 from __future__ import annotations
 
+import json
+import os
 from dataclasses import dataclass
-from typing import Iterator
+from functools import cached_property
+from typing import Any, Callable, Iterator, Sequence
 
 import numpy as np
+from numpy.typing import ArrayLike
 
+from .electrochemistry import limiting_potential, potential_energies
+from .energetic_span import energetic_span, turnover_frequency
+from .lazy import AdditiveEnergies, LazyPathArray
+from .parallel import apply_path, map_paths, n_workers, reduce_enumeration
 from .path import Path
+from .path_array import PathArray, normalize_key, outer_index, select_labels
+from .tools.helper import energy_conversion
+
+CHUNK_SIZE = 2**22
+"""Maximum number of energies read at once when reducing a dense Enumeration"""
+
+# name of a per-path metric method, a reduction of an Enumeration, or an array of values for each path
+Metric = str | Callable[["Enumeration"], np.ndarray] | np.ndarray
 
 
 @dataclass
@@ -13,20 +29,186 @@ class Enumeration:
     """
     A collection of reaction paths that all have the same form
 
+    Missing combinations (e.g. failed calculations) are allowed, they are None in an object ndarray and NaN in a dense
+    PathArray. They are skipped by iteration-based functions and are NaN (or -1 for indices) in reductions.
+
+    :param paths: array of Paths, either an object ndarray, a dense PathArray, or a LazyPathArray
     :param path_names:
         {"r1": ("H", "C"), "r2": ("H", "B", "I")}
+    :param units: units of the energies (see tools.helper.energy_conversions), None if unspecified
     """
 
-    paths: np.ndarray
+    paths: np.ndarray | PathArray | LazyPathArray
     path_names: dict[str, tuple[str, ...]]
+    units: str | None = None
+
+    @classmethod
+    def from_energies(
+        cls,
+        energies: np.ndarray,
+        path_names: dict[str, tuple[str, ...]],
+        species: Sequence[str],
+        ne: Sequence[int] | None = None,
+        ref_pot: Sequence[float] | None = None,
+        units: str | None = None,
+    ) -> Enumeration:
+        """
+        Generate a dense Enumeration, Paths are only generated on demand
+
+        :param energies: energies of the species at each step, shape (*shape, n_steps)
+        :param path_names: labels along each dimension
+        :param species: names of the species at each step
+        :param ne: number of electrons generated by each reaction
+        :param ref_pot: reference potential of each reaction
+        :param units: units of the energies
+        """
+        paths = PathArray(energies, tuple(species), tuple(path_names.values()), (), ne, ref_pot)  # type: ignore
+        return cls(paths, path_names, units)
+
+    @classmethod
+    def from_function(
+        cls,
+        function: Callable[[tuple[str, ...]], Path | None],
+        path_names: dict[str, tuple[str, ...]],
+        cache_size: int | None = 0,
+        units: str | None = None,
+    ) -> Enumeration:
+        """
+        Generate a lazy Enumeration, Paths are only generated by the function when indexed, iterated, or reduced
+
+        :param function: generates the Path for the path_names of every dimension, e.g. function(("H", "C", "I"))
+        :param path_names: labels along each dimension
+        :param cache_size: number of generated Paths to cache, 0 to disable and None for no limit
+        :param units: units of the energies
+        """
+        return cls(LazyPathArray(function, tuple(path_names.values()), (), cache_size), path_names, units)
+
+    @classmethod
+    def from_contributions(
+        cls,
+        base: Sequence[float],
+        contributions: dict[str, ArrayLike],
+        species: Sequence[str],
+        ne: Sequence[int] | None = None,
+        ref_pot: Sequence[float] | None = None,
+        units: str | None = None,
+    ) -> Enumeration:
+        """
+        Generate a lazy Enumeration whose energies are the sum of a base and a contribution from each path_name
+
+        Only the indexed energies are evaluated, the full tensor is only built when reduced.
+
+        :param base: energy of each species shared by all paths, shape (n_steps,)
+        :param contributions: {dimension: {path_name: contribution to the energy of each species}}
+        :param species: names of the species at each step
+        :param ne: number of electrons generated by each reaction
+        :param ref_pot: reference potential of each reaction
+        :param units: units of the energies
+        """
+        path_names = {name: tuple(contribution) for name, contribution in contributions.items()}  # type: ignore
+        energies = AdditiveEnergies(
+            np.asarray(base),
+            [np.array(list(contribution.values())) for contribution in contributions.values()],  # type: ignore
+        )
+        paths = PathArray(energies, tuple(species), tuple(path_names.values()), (), ne, ref_pot)  # type: ignore
+        return cls(paths, path_names, units)  # type: ignore
+
+    @classmethod
+    def from_npy(cls, filename: str, mmap_mode: str | None = "r") -> Enumeration:
+        """
+        Load a dense Enumeration saved with to_npy, memory-mapping the energies so that only the accessed
+        pages are read from disk
+
+        :param filename: .npy file of the energies, the metadata is read from the .json sidecar
+        :param mmap_mode: mode for np.load, None to read the energies into memory
+        """
+        with open(os.path.splitext(filename)[0] + ".json") as f:
+            metadata = json.load(f)
+
+        energies = np.load(filename, mmap_mode=mmap_mode)  # type: ignore
+        path_names = {path_name: tuple(subs) for path_name, subs in metadata["path_names"].items()}
+        return cls.from_energies(
+            energies, path_names, metadata["species"], metadata["ne"], metadata["ref_pot"], metadata.get("units")
+        )
+
+    def to_npy(self, filename: str) -> None:
+        """
+        Save a dense Enumeration as a .npy file of the energies and a .json sidecar of the metadata
+            (path_names, species, ne, ref_pot, and units), the energies are written one chunk at a time
+
+        :param filename: .npy file to write the energies to
+        """
+        if not isinstance(self.paths, PathArray):
+            raise TypeError("Only dense Enumerations can be saved as .npy")
+
+        paths = self.paths
+        if isinstance(paths.energies, np.memmap) and paths.energies.filename == os.path.abspath(filename):
+            # already memory-mapped to the file (e.g. streamed from a csv), only the metadata is missing
+            paths.energies.flush()
+        else:
+            dtype = paths.energies.dtype if isinstance(paths.energies, np.ndarray) else float
+            energies = np.lib.format.open_memmap(filename, mode="w+", dtype=dtype, shape=(*self.shape, paths.n_steps))
+            for start, stop in self._chunk_bounds():
+                energies[start:stop] = paths.energies[start:stop]
+            energies.flush()
+            del energies
+
+        metadata = {
+            "path_names": self.path_names,
+            "species": paths.species,
+            "ne": paths.ne.tolist(),  # type: ignore
+            "ref_pot": paths.ref_pot.tolist(),  # type: ignore
+            "units": self.units,
+        }
+        with open(os.path.splitext(filename)[0] + ".json", "w") as f:
+            json.dump(metadata, f)
+
+    def save(self, filename: str) -> None:
+        """
+        Save to binary files (see storage), Enumerations of Paths through the same species are stored as a dense
+            .npy (as with to_npy) that loads as a dense Enumeration, others are stored as an .npz of records
+
+        :param filename: where to save, the extension is replaced
+        """
+        from .storage import save
+
+        save(self, filename)
+
+    @classmethod
+    def load(cls, filename: str, mmap_mode: str | None = "r") -> Enumeration:
+        """
+        Load an Enumeration saved with Enumeration.save (or to_npy)
+
+        :param filename: file that was saved, the extension is ignored
+        :param mmap_mode: mode to memory-map dense energies with (see np.load), None to read them into memory
+        """
+        from .storage import load
+
+        enm = load(filename, mmap_mode)
+        if not isinstance(enm, cls):
+            raise TypeError(f"Expected {filename} to contain an Enumeration, got {type(enm).__name__}")
+        return enm
 
     def __post_init__(self):
         path_names_shape = tuple(map(len, self.path_names.values()))
         if path_names_shape != self.paths.shape:
             raise ValueError(
-                "Expected paths and path_names to have the same shape, got {paths.shape=} != {paths_names_shape=}"
+                f"Expected paths and path_names to have the same shape, got {self.paths.shape=} != {path_names_shape=}"
             )
 
+    def __reduce__(self) -> tuple:
+        """
+        Pickle object arrays of Paths as flat arrays (see storage.to_records) instead of nested objects,
+        dense and lazy Enumerations are pickled as is (without the cached label lookups)
+        """
+        if not isinstance(self.paths, np.ndarray):
+            return Enumeration, (self.paths, self.path_names, self.units)
+
+        from .storage import rebuild, to_records
+
+        header = {"path_names": self.path_names, "units": self.units}
+        return rebuild, ("Enumeration", to_records(list(self.paths.flat)), header)
+
     def __repr__(self) -> str:
         return f"<Enumeration {tuple(self.path_names)} {self.shape}>"
 
@@ -52,26 +234,67 @@ class Enumeration:
         """
         return len(self.paths)
 
-    def __getitem__(self, idx: str | int) -> Enumeration | Path:
+    def __getitem__(self, idx: Any) -> Enumeration | Path:
+        """
+        Get an Enumeration/Path by indexing each dimension
+
+        Each dimension can be indexed with a path_name (str), index (int), slice, boolean mask, or a sequence of
+        path_names/indices. Dimensions indexed with a path_name or int are removed, returning a Path if none remain.
+        The underlying data is shared (not copied) unless an irregularly spaced sequence is used.
+        """
+        idxs = idx if isinstance(idx, tuple) else (idx,)
+        if len(idxs) > self.ndim:
+            raise IndexError(f"Too many indices for Enumeration of dimension {self.ndim}")
+        key = normalize_key(tuple(map(self._label_to_index, self.path_names, idxs)), self.shape)
+        path_names = {
+            path_name: select_labels(subs, k)
+            for (path_name, subs), k in zip(self.path_names.items(), key)
+            if not isinstance(k, int)
+        }
+
+        item = outer_index(self.paths, key) if isinstance(self.paths, np.ndarray) else self.paths[key]
+
+        return Enumeration(item, path_names, self.units) if path_names else item  # type: ignore
+
+    def sel(self, **path_names: Any) -> Enumeration | Path:
         """
-        Get an Enumeration/Path via its path_name (str) or index (int)
+        Get an Enumeration/Path by indexing dimensions by name, unspecified dimensions are kept whole
+            e.g. enm.sel(r1="H", r3=["C", "N"])
+
+        :param path_names: index for each dimension (see __getitem__)
         """
-        (path_name, subs), *tail = self.path_names.items()
-        if isinstance(idx, str):
-            if idx not in subs:
-                raise KeyError("{idx=} is not contained in Enumeration")
-            idx = subs.index(idx)
+        if unknown := set(path_names) - set(self.path_names):
+            raise KeyError(f"{unknown} are not dimensions of the Enumeration")
+
+        return self[tuple(path_names.get(path_name, slice(None)) for path_name in self.path_names)]
 
-        item = self.paths[idx]
+    @cached_property
+    def _label_indices(self) -> dict[str, dict[str, int]]:
+        """
+        Hashed lookup of the index of each path_name along each dimension
+        """
+        return {path_name: {sub: i for i, sub in enumerate(subs)} for path_name, subs in self.path_names.items()}
 
-        return Enumeration(item, dict(tail)) if tail else item
+    def _label_to_index(self, path_name: str, idx: Any) -> Any:
+        """
+        Convert path_names (str) along a dimension to indices
+        """
+        indices = self._label_indices[path_name]
+        try:
+            if isinstance(idx, str):
+                return indices[idx]
+            if isinstance(idx, (list, tuple)) and any(isinstance(i, str) for i in idx):
+                return [indices[i] if isinstance(i, str) else i for i in idx]
+        except KeyError as err:
+            raise KeyError(f"{err.args[0]!r} is not contained in {path_name} of the Enumeration") from None
+        return idx
 
     def __iter__(self) -> Iterator[Enumeration] | Iterator[Path]:
         if self.ndim == 1:
-            yield from self.paths  # Iterator[Path]
+            yield from self.paths  # type: ignore  # Iterator[Path]
         else:
             head, *tail = self.path_names.items()
-            yield from (Enumeration(item, dict(tail)) for item in self.paths)  # Iterator[Enumeration]
+            yield from (Enumeration(item, dict(tail), self.units) for item in self.paths)  # type: ignore  # Iterator[Enumeration]
 
     @property
     def shape(self) -> tuple[int, ...]:
@@ -80,3 +303,317 @@ class Enumeration:
     @property
     def ndim(self) -> int:
         return self.paths.ndim
+
+    def energies(self) -> np.ndarray:
+        """
+        Energies of the reactions in every path, shape (*shape, n_reactions)
+        """
+        if isinstance(self.paths, PathArray):
+            return np.diff(self.paths.energies, axis=-1) - self.paths.ref_pot * self.paths.ne  # type: ignore
+
+        energies = [path.energies if path is not None else None for path in self.paths.flat]
+        if len({len(e) for e in energies if e is not None}) > 1:
+            raise ValueError("Expected all Paths in the Enumeration to have the same length.")
+        n_reactions = next((len(e) for e in energies if e is not None), 0)
+        missing = np.full(n_reactions, np.nan)
+        return np.array([missing if e is None else e for e in energies]).reshape(*self.shape, n_reactions)
+
+    def relative_energies(self) -> np.ndarray:
+        """
+        Cumulative energy along every path, shape (*shape, n_reactions + 1)
+        """
+        if isinstance(self.paths, PathArray) and not self.paths.electrochemical:
+            return self.paths.energies - self.paths.energies[..., :1]
+
+        energies = self.energies()
+        return np.concatenate([np.zeros((*self.shape, 1)), np.cumsum(energies, axis=-1)], axis=-1)
+
+    def min(self) -> np.ndarray:
+        """
+        Minimum achieved along each path
+        """
+        return self._reduce(lambda enm: enm.relative_energies().min(axis=-1))
+
+    def max(self) -> np.ndarray:
+        """
+        Maximum achieved along each path
+        """
+        return self._reduce(lambda enm: enm.relative_energies().max(axis=-1))
+
+    def argmin(self) -> np.ndarray:
+        """
+        Index of the minimum achieved along each path, -1 for missing paths
+        """
+        return self._reduce(lambda enm: _nanarg(enm.relative_energies(), np.argmin))
+
+    def argmax(self) -> np.ndarray:
+        """
+        Index of the maximum achieved along each path, -1 for missing paths
+        """
+        return self._reduce(lambda enm: _nanarg(enm.relative_energies(), np.argmax))
+
+    def barrier(self) -> np.ndarray:
+        """
+        Largest single reaction energy along each path
+        """
+        return self._reduce(lambda enm: enm.energies().max(axis=-1))
+
+    def step(self, step: int) -> np.ndarray:
+        """
+        Energy of a specific reaction in each path
+        """
+        return self._reduce(lambda enm: enm.energies()[..., step])
+
+    def relative_step(self, step: int) -> np.ndarray:
+        """
+        Cumulative energy at a specific point in each path
+        """
+        return self._reduce(lambda enm: enm.relative_energies()[..., step])
+
+    def map(self, function: Callable[[Path], Any], workers: int | None = 1) -> np.ndarray:
+        """
+        Apply a function to every Path, optionally across a pool of worker processes
+
+        Dense energies are passed to the workers through shared memory and the Paths are generated in the workers.
+        With multiple workers, the function must be picklable (e.g. defined at the module level).
+
+        :param function: function to generate a value from each Path
+        :param workers: number of worker processes, 1 to run in this process, None for all available cores
+        :return: values with the shape of the Enumeration, NaN for missing paths
+        """
+        if workers == 1:
+            return np.array([apply_path(function, path) for path in self.paths.flat]).reshape(self.shape)
+        return map_paths(self.paths, function, workers).reshape(self.shape)
+
+    def reduce(self, function: Callable[[Enumeration], np.ndarray], workers: int | None = 1) -> np.ndarray:
+        """
+        Apply a vectorized reduction to chunks of the 0-th dimension, optionally across a pool of worker processes
+            e.g. enm.reduce(lambda sub: sub.energies()[..., -2:].sum(axis=-1))
+
+        Dense energies are passed to the workers through shared memory.
+        With multiple workers, the function must be picklable (e.g. defined at the module level).
+
+        :param function: reduction of an Enumeration to an array with its shape as the leading dimensions
+        :param workers: number of worker processes, 1 to run in this process, None for all available cores
+        :return: concatenated results of the chunks
+        """
+        if workers == 1:
+            return self._reduce(function)
+        return reduce_enumeration(self, function, list(self._chunk_bounds(4 * n_workers(workers))), workers)
+
+    def topk(
+        self, metric: Metric, k: int, largest: bool = False
+    ) -> tuple[list[tuple[str, ...]], np.ndarray, np.ndarray]:
+        """
+        Find the k paths with the smallest (or largest) metric, evaluating one chunk at a time
+
+        Paths with a nan metric are skipped.
+
+        :param metric: name of a per-path metric (e.g. "max"), a reduction of an Enumeration to an array with its
+            shape (e.g. lambda enm: enm.step(1)), or an array of values with the shape of the Enumeration
+        :param k: number of paths to find
+        :param largest: find the largest values instead of the smallest
+        :return: path_names of each path, indices of each path with shape (k, ndim), and the metric values,
+            sorted from best to worst
+        """
+        if k < 0:
+            raise ValueError(f"Expected k to be non-negative, got {k=}")
+
+        indices, values = np.empty(0, dtype=int), np.empty(0)
+        for start, chunk in self._metric_chunks(metric):
+            flat = chunk.ravel()
+            keep = np.flatnonzero(~np.isnan(flat))
+            if len(keep) > k:
+                keep = keep[np.argpartition(-flat[keep] if largest else flat[keep], k - 1)[:k]] if k else keep[:0]
+            indices = np.concatenate([indices, keep + start * int(np.prod(self.shape[1:]))])
+            values = np.concatenate([values, flat[keep]])
+
+            if len(values) > k:  # bound the memory to 2k candidates
+                best = np.argpartition(-values if largest else values, k - 1)[:k] if k else slice(0)
+                indices, values = indices[best], values[best]
+
+        order = np.argsort(-values if largest else values, kind="stable")
+        return self._located(indices[order], values[order])
+
+    def where(
+        self, metric: Metric, threshold: float, largest: bool = False
+    ) -> tuple[list[tuple[str, ...]], np.ndarray, np.ndarray]:
+        """
+        Find the paths with a metric below (or above) a threshold, evaluating one chunk at a time
+
+        :param metric: name of a per-path metric, reduction of an Enumeration, or array of values (see topk)
+        :param threshold: only paths with a metric below the threshold are found
+        :param largest: find paths with a metric above the threshold instead
+        :return: path_names of each path, indices of each path with shape (n, ndim), and the metric values,
+            in row-major order
+        """
+        indices, values = [], []
+        for start, chunk in self._metric_chunks(metric):
+            flat = chunk.ravel()
+            keep = np.flatnonzero(flat > threshold if largest else flat < threshold)
+            indices.append(keep + start * int(np.prod(self.shape[1:])))
+            values.append(flat[keep])
+
+        return self._located(np.concatenate([np.empty(0, dtype=int), *indices]), np.concatenate([[], *values]))
+
+    def _metric_chunks(self, metric: Metric) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        Evaluate a metric for each chunk of the 0-th dimension
+
+        :return: iterator of the start of each chunk and the metric values of the chunk
+        """
+        for start, stop in self._chunk_bounds():
+            if isinstance(metric, str):
+                values = getattr(self[start:stop], metric)()
+            elif callable(metric):
+                values = metric(self[start:stop])  # type: ignore
+            else:
+                values = np.asarray(metric)[start:stop]
+            yield start, np.asarray(values, dtype=float)
+
+    def _located(
+        self, flat_indices: np.ndarray, values: np.ndarray
+    ) -> tuple[list[tuple[str, ...]], np.ndarray, np.ndarray]:
+        """
+        path_names and indices of paths from their flat (row-major) indices
+        """
+        indices = np.stack(np.unravel_index(flat_indices, self.shape), axis=-1)
+        labels = [tuple(subs[i] for subs, i in zip(self.path_names.values(), idx)) for idx in indices]
+        return labels, indices, values
+
+    def _reduce(self, function: Callable[[Enumeration], np.ndarray]) -> np.ndarray:
+        """
+        Apply a per-path reduction to one chunk of the 0-th dimension at a time, bounding the peak memory of
+        dense (e.g. memory-mapped) Enumerations
+
+        :param function: reduction of an Enumeration to an array with its shape as the leading dimensions
+        """
+        if not isinstance(self.paths, PathArray):
+            return function(self)
+
+        chunks = [function(self[start:stop]) for start, stop in self._chunk_bounds()]  # type: ignore
+        return np.concatenate(chunks) if chunks else function(self)
+
+    def _chunk_bounds(self, min_chunks: int = 1) -> Iterator[tuple[int, int]]:
+        """
+        Start and stop of each chunk of the 0-th dimension, with at most CHUNK_SIZE energies (or Paths) per chunk
+
+        :param min_chunks: minimum number of chunks (if the 0-th dimension is long enough)
+        """
+        n_steps = self.paths.n_steps if isinstance(self.paths, PathArray) else 1
+        size = max(1, CHUNK_SIZE // max(1, int(np.prod(self.shape[1:])) * n_steps))
+        size = min(size, max(1, -(-len(self) // min_chunks)))
+        for start in range(0, len(self), size):
+            yield start, min(start + size, len(self))
+
+    def energetic_span(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Energetic span of each path as a catalytic cycle (see energetic_span.energetic_span)
+
+        :return: span, and the indices of the TDI and TDTS in the relative energies of each path (-1 for missing
+            paths), shape (*shape)
+        """
+        spans = self._reduce(lambda enm: np.stack(energetic_span(enm.relative_energies()), axis=-1))
+        missing = np.isnan(spans[..., 0])
+        tdi, tdts = (np.where(missing, -1, spans[..., i]).astype(int) for i in (1, 2))
+        return spans[..., 0], tdi, tdts
+
+    def turnover_frequency(self, temperature: float = 298.15, units: str | None = None) -> np.ndarray:
+        """
+        Apparent turnover frequency (1/s) of each path as a catalytic cycle from its energetic span
+
+        :param temperature: temperature (K)
+        :param units: units of the energies, defaults to the units of the Enumeration (or eV if unspecified)
+        """
+        return turnover_frequency(self.energetic_span()[0], temperature, units or self.units or "eV")
+
+    def potential_energies(self, us: ArrayLike) -> np.ndarray:
+        """
+        Energies of the reactions in every path at each of a series of applied potentials
+
+        :param us: applied potentials, shape (n_u,)
+        :return: energies with shape (*shape, n_u, n_reactions)
+        """
+        return potential_energies(self.energies(), *self._electrochemistry(), us)
+
+    def limiting_potential(self) -> np.ndarray:
+        """
+        Lowest applied potential at which every reaction in each path is downhill, highest for reductive paths (see
+            electrochemistry.limiting_potential), nan if unattainable
+        """
+        return self._reduce(lambda enm: limiting_potential(enm.energies(), *enm._electrochemistry()))
+
+    def _electrochemistry(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Number of electrons and applied potential of each reaction, broadcastable to energies()
+        """
+        if isinstance(self.paths, PathArray):
+            return self.paths.ne, np.zeros(1)  # type: ignore
+
+        paths = list(self.paths.flat)
+        n_reactions = next((len(path) for path in paths if path is not None), 0)
+        ne = np.array([path.ne if path is not None else np.zeros(n_reactions) for path in paths])
+        u = np.array([path.u if path is not None else np.zeros(n_reactions) for path in paths])
+        return ne.reshape(*self.shape, n_reactions), u.reshape(*self.shape, n_reactions)
+
+    def missing(self) -> np.ndarray:
+        """
+        Mask of the missing paths, shape (*shape)
+        """
+        if isinstance(self.paths, PathArray):
+            return self._reduce(lambda enm: np.isnan(enm.paths.energies[...]).any(axis=-1))  # type: ignore
+        if isinstance(self.paths, LazyPathArray):  # generates every Path
+            return np.array([path is None for path in self.paths.flat], dtype=bool).reshape(self.shape)
+        return np.equal(self.paths, None)  # type: ignore
+
+    @property
+    def dense(self) -> bool:
+        """
+        Whether the Paths are stored as a dense energy tensor
+        """
+        return isinstance(self.paths, PathArray)
+
+    def convert(self, units: str) -> Enumeration:
+        """
+        Copy of the Enumeration with the energies converted to the given units, with a single multiplication of
+        dense energy tensors
+
+        The energies are copied rather than converted in place, as they may be shared with other Enumerations (e.g.
+        from indexing).
+
+        :param units: units to convert to (see tools.helper.energy_conversions)
+        """
+        from .storage import scale_paths
+
+        if self.units is None:
+            raise ValueError("Unable to convert an Enumeration without units, set Enumeration.units first")
+        factor = energy_conversion(self.units, units)
+
+        paths: np.ndarray | PathArray
+        if isinstance(self.paths, PathArray):
+            if self.paths.electrochemical:
+                raise ValueError("Unable to convert electrochemical Enumerations, their reference potentials are in V")
+            energies = self.paths.energies
+            if isinstance(energies, AdditiveEnergies):
+                energies = AdditiveEnergies(energies.base * factor, [c * factor for c in energies.contributions])
+            else:
+                energies = np.multiply(energies, factor)
+            array = self.paths
+            paths = PathArray(energies, array.species, array.labels, array.fixed, array.ne, array.ref_pot)
+        elif isinstance(self.paths, LazyPathArray):
+            raise ValueError("Unable to convert lazily generated Paths, convert them in the generating function")
+        else:
+            paths = np.empty(self.paths.size, dtype=object)
+            for i, path in enumerate(scale_paths(list(self.paths.flat), factor)):  # avoid numpy unpacking Paths
+                paths[i] = path
+            paths = paths.reshape(self.paths.shape)
+
+        return Enumeration(paths, self.path_names, units)
+
+
+def _nanarg(energies: np.ndarray, arg: Callable[..., np.ndarray]) -> np.ndarray:
+    """
+    argmin/argmax along the last axis, -1 where the energies are missing (NaN)
+    """
+    missing = np.isnan(energies).any(axis=-1)
+    return np.where(missing, -1, arg(np.where(np.isnan(energies), 0, energies), axis=-1))
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import product
+from typing import Any, Callable, Iterator, Sequence
+
+import numpy as np
+
+from .path import Path
+from .path_array import index_labels, normalize_key
+
+
+@dataclass
+class LazyPathArray:
+    """
+    An ndarray-like collection of Paths that are generated on demand by a function
+
+    :param function: generates the Path for the labels of every dimension, e.g. function(("H", "C", "I")),
+        None for missing paths
+    :param labels: labels along each dimension
+    :param fixed: labels for every dimension of the original array, None for dimensions that have not been indexed
+    :param cache_size: number of generated Paths to keep in a least-recently-used cache
+        (shared by all views of the array), 0 to disable and None for no limit
+    """
+
+    function: Callable[[tuple[str, ...]], Path | None]
+    labels: tuple[tuple[str, ...], ...]
+    fixed: tuple[str | None, ...] = ()
+    cache_size: int | None = 0
+    _generate: Callable[[tuple[str, ...]], Path | None] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.labels = tuple(map(tuple, self.labels))
+        self.fixed = self.fixed or (None,) * self.ndim
+        if self.fixed.count(None) != self.ndim:
+            raise ValueError(f"Expected fixed to have a None for each of the {self.ndim} dimensions.")
+
+        self._generate = self.function if self.cache_size == 0 else lru_cache(self.cache_size)(self.function)
+
+    def __getstate__(self) -> dict:
+        """
+        Pickle without the cache of generated Paths (lru_cache wrappers are not picklable), rebuilt when unpickled
+        """
+        return {name: value for name, value in self.__dict__.items() if name != "_generate"}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._generate = self.function if self.cache_size == 0 else lru_cache(self.cache_size)(self.function)
+
+    def __repr__(self) -> str:
+        return f"<LazyPathArray {self.shape}>"
+
+    def __len__(self) -> int:
+        """
+        Length of the 0-th dimension
+        """
+        return self.shape[0]
+
+    def __getitem__(self, idx: Any) -> LazyPathArray | Path:
+        """
+        Index each dimension with an int, slice, boolean mask, or sequence of ints
+
+        A Path is generated if all dimensions are indexed with ints, otherwise a lazy view is returned.
+        """
+        labels, fixed = index_labels(normalize_key(idx, self.shape), self.labels, self.fixed)
+
+        if not labels:
+            return self._generate(fixed)  # type: ignore
+
+        view = LazyPathArray(self.function, labels, fixed, 0)
+        view._generate = self._generate
+        return view
+
+    def __iter__(self) -> Iterator[LazyPathArray] | Iterator[Path]:
+        for i in range(len(self)):
+            yield self[i]  # type: ignore
+
+    @property
+    def flat(self) -> Iterator[Path]:
+        """
+        Iterate over all Paths in row-major order (mirrors np.ndarray.flat)
+        """
+        for idxs in product(*map(range, self.shape)):
+            yield self[idxs]  # type: ignore
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(map(len, self.labels))
+
+    @property
+    def ndim(self) -> int:
+        return len(self.labels)
+
+
+@dataclass
+class AdditiveEnergies:
+    """
+    Energy tensor that is the sum of a base energy and a contribution from the label along each dimension
+
+    Only the requested elements are evaluated when indexed, the full tensor is only built when converted to an array.
+
+    >>> energies = AdditiveEnergies([0, 1], [[[0, 0], [0, 2]], [[0, 0], [0, 3], [0, 4]]])
+    >>> energies.shape
+    (2, 3, 2)
+    >>> energies[1, 2]
+    array([0., 7.])
+    >>> energies[:, 1, -1]
+    array([4., 6.])
+
+    :param base: energy of each step shared by all paths, shape (n_steps,)
+    :param contributions: contribution of each label to the energy of each step, shape (n_labels, n_steps) for each
+        dimension
+    """
+
+    base: np.ndarray
+    contributions: Sequence[np.ndarray]
+
+    def __post_init__(self):
+        self.base = np.asarray(self.base, dtype=float)
+        self.contributions = tuple(np.asarray(contribution, dtype=float) for contribution in self.contributions)
+        if any(contribution.shape[1:] != self.base.shape for contribution in self.contributions):
+            raise ValueError(f"Expected all contributions to have shape (n_labels, {len(self.base)}).")
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __getitem__(self, idx: Any) -> np.ndarray:
+        """
+        Evaluate the requested elements, indexing each dimension independently
+        """
+        idxs = idx if isinstance(idx, tuple) else (idx,)
+        if any(i is Ellipsis for i in idxs):
+            i = next(j for j, k in enumerate(idxs) if k is Ellipsis)
+            idxs = idxs[:i] + (slice(None),) * (self.ndim - len(idxs) + 1) + idxs[i + 1 :]
+        *key, step_key = normalize_key(idxs, self.shape)
+
+        energies = self.base[step_key]
+        n_dims = sum(not isinstance(k, int) for k in key)
+        dim = 0
+        for contribution, k in zip(self.contributions, key):
+            values = contribution[k][..., step_key]
+            if not isinstance(k, int):
+                values = values.reshape((1,) * dim + values.shape[:1] + (1,) * (n_dims - dim - 1) + values.shape[1:])
+                dim += 1
+            energies = energies + values
+
+        shape = [
+            len(range(n)[k]) if isinstance(k, slice) else len(k)
+            for n, k in zip(self.shape, key)
+            if not isinstance(k, int)
+        ]
+        return np.array(np.broadcast_to(energies, (*shape, *np.shape(self.base[step_key]))))
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return self[...].astype(dtype or float)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return (*(len(contribution) for contribution in self.contributions), len(self.base))
+
+    @property
+    def ndim(self) -> int:
+        return len(self.contributions) + 1
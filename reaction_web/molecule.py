@@ -1,14 +1,98 @@
-from dataclasses import dataclass
+from __future__ import annotations
 
+import sys
+from dataclasses import FrozenInstanceError, dataclass
+from typing import Iterable
 
-@dataclass
+_energy_version = 0
+
+
+def energy_version() -> int:
+    """
+    Counter that is incremented whenever an energy that Reactions depend on changes
+
+    Used to invalidate the energies cached by Reactions, Paths and Webs (and, alongside them, the adjacency built by
+    Networks). Assigning a Molecule energy or a field of these objects invalidates them, but mutating a list of
+    reactants, reactions or paths in place does not, so reassign it instead.
+    """
+    return _energy_version
+
+
+def _bump_energy_version() -> None:
+    """
+    Invalidate all cached energies
+    """
+    global _energy_version
+    _energy_version += 1
+
+
+def _shared_versions(molecules: Iterable[Molecule]) -> tuple[tuple[Molecule, int], ...]:
+    """
+    Versions of the Molecules registered in a SpeciesTable, which are updated without bumping the energy version
+
+    Stored by the cached energies so they can tell whether a shared Molecule was updated (see _updated).
+    """
+    return tuple((molecule, molecule._version) for molecule in molecules if molecule._version is not None)
+
+
+def _updated(shared: tuple[tuple[Molecule, int], ...]) -> bool:
+    """
+    Whether any of the shared Molecules were updated since their versions were stored
+    """
+    return any(molecule._version != version for molecule, version in shared)
+
+
+class _Energy:
+    """
+    Energy of a Molecule stored in its _energy slot, assigning it invalidates all cached energies
+    """
+
+    def __get__(self, molecule: Molecule | None, owner: type | None = None) -> float:
+        if molecule is None:
+            raise AttributeError("energy")  # the energy field has no default
+        return molecule._energy
+
+    def __set__(self, molecule: Molecule, energy: float) -> None:
+        molecule._energy = energy
+        _bump_energy_version()
+
+
+@dataclass(init=False, repr=False)
 class Molecule:
     """
     A molecule, atom, or group of these that have a defined energy
+
+    Note: names are interned, so Molecules generated from large datasets share their name strings.
+
+    The _version of Molecules registered in a SpeciesTable counts their updates (None for other Molecules).
     """
 
+    __slots__ = ("name", "_energy", "_version")
+
     name: str
-    energy: float
+    energy: _Energy = _Energy()
+
+    def __init__(self, name: str, energy: float):
+        # plain slot assignments, construction is not slowed by the invalidation of cached energies
+        self.name = sys.intern(name) if type(name) is str else name
+        self._energy = energy
+        self._version: int | None = None
 
     def __repr__(self) -> str:
         return f"<Mol {self.name} {self.energy:7.4f}>"
+
+
+class FrozenMolecule(Molecule):
+    """
+    An immutable, hashable Molecule (e.g. for reference species shared across many Reactions)
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value) -> None:
+        if name == "energy" or hasattr(self, name):
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        object.__setattr__(self, name, value)
+
+    def __hash__(self) -> int:
+        return hash((self.name, self.energy))
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Sequence
+
+from .path import Path
+from .reaction import Reaction
+from .web import Web
+
+State = tuple[str, ...]
+"""Sorted names of the molecules in a state"""
+
+OBJECTIVES = ("barrier", "max")
+
+
+def state(names: str | Iterable[str]) -> State:
+    """
+    Normalize the names of the molecules in a state, names joined by " + " are split into their molecules
+
+    >>> state("H2O + CO")
+    ('CO', 'H2O')
+    >>> state(["H2O", "H + OH"])
+    ('H', 'H2O', 'OH')
+
+    :param names: names of the molecules
+    """
+    names = [names] if isinstance(names, str) else names
+    return tuple(sorted(part for name in names for part in name.split(" + ")))
+
+
+@dataclass
+class Network:
+    """
+    A reaction network, with states (the set of molecules on either side of a Reaction) as nodes and Reactions as
+    edges, allowing intermediates shared by multiple Paths to only be stored once
+
+    The adjacency is built on initialization and when the reactions are reassigned (see molecule.energy_version).
+
+    :param reactions: Reactions connecting the states
+    :param name: name of the Network
+    """
+
+    reactions: Sequence[Reaction]
+    name: str = ""
+    _edges: defaultdict[State, list[tuple[State, int]]] = field(init=False, repr=False, compare=False)
+    _cycles: dict[State, frozenset[State]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._edges = defaultdict(list)
+        for i, reaction in enumerate(self.reactions):
+            reactants, products = self._states(reaction)
+            self._edges[reactants].append((products, i))
+        self._cycles = {
+            current: component for component in self._components() if len(component) > 1 for current in component
+        }
+
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if name == "reactions" and hasattr(self, "_edges"):
+            self.__post_init__()
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[Path], name: str = "") -> Network:
+        """
+        Generate a Network from Paths (or a Web), merging the intermediates that they share
+
+        Reactions between the same states are merged, keeping the first.
+
+        :param paths: Paths to merge
+        :param name: name of the Network
+        """
+        reactions: dict[tuple[State, State], Reaction] = {}
+        for path in paths:
+            for reaction in path:
+                reactions.setdefault(cls._states(reaction), reaction)
+        return cls(list(reactions.values()), name)
+
+    def __repr__(self) -> str:
+        return f'<Network "{self.name}" ({len(self.states)} states, {len(self)} reactions)>'
+
+    def __len__(self) -> int:
+        """
+        Number of reactions
+        """
+        return len(self.reactions)
+
+    def __iter__(self) -> Iterator[Reaction]:
+        yield from self.reactions
+
+    def __contains__(self, names: str | Iterable[str]) -> bool:
+        """
+        Whether the state is in the Network
+        """
+        return state(names) in self.states
+
+    @property
+    def states(self) -> set[State]:
+        """
+        All states in the Network
+        """
+        return set(self._edges) | {product for edges in self._edges.values() for product, _ in edges}
+
+    def successors(self, names: str | Iterable[str]) -> list[tuple[State, Reaction]]:
+        """
+        States that can be reached from a state in a single Reaction
+
+        :param names: names of the molecules in the state
+        :return: the reached state and the Reaction for each edge
+        """
+        return [(product, self.reactions[i]) for product, i in self._edges.get(state(names), [])]
+
+    def routes(
+        self,
+        source: str | Iterable[str],
+        target: str | Iterable[str],
+        k: int = 1,
+        objective: str = "barrier",
+    ) -> Web:
+        """
+        Find the k best routes from the source state to the target state without enumerating every linear path
+
+        A Dijkstra search over (state, route) labels, where a label is dropped once k settled labels dominate it.
+        Routes are ranked by the objective, then by the number of reactions, and never revisit a state, so a settled
+        label only dominates if it is free to continue every way the label can: the states it visited that are on a
+        cycle through the current state (the only ones a continuation can revisit) must have been visited by the label.
+
+        Objectives:
+            barrier: largest single reaction energy along the route (minimax barrier)
+            max: highest relative energy reached along the route, including the source (c.f. Path.max), a label is
+                dominated by the settled labels with both a lower score and a lower cumulative energy
+
+        The energetic span of the found routes can be compared with Web.energetic_span().
+
+        :param source: names of the molecules in the initial state
+        :param target: names of the molecules in the final state
+        :param k: number of routes to find
+        :param objective: how to rank the routes
+        :return: Web of the routes from best to worst, fewer than k if there are fewer routes
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective {objective!r}, expected one of {OBJECTIVES}")
+
+        source, target = state(source), state(target)
+        energies = [reaction.energy for reaction in self.reactions]
+
+        # label: (score, n_steps, counter, state, cumulative energy, route)
+        # routes are linked lists of (reaction index, state, previous) to share their common prefixes
+        counter = 0
+        heap: list[tuple] = [(float("-inf") if objective == "barrier" else 0.0, 0, counter, source, 0.0, None)]
+        # cumulative energies and visited cycle states of the labels settled at each state, in order of their score
+        settled: defaultdict[State, list[tuple[float, frozenset[State]]]] = defaultdict(list)
+        routes: list[Path] = []
+        while heap and len(routes) < k:
+            score, n_steps, _, current, energy, route = heapq.heappop(heap)
+            if current == target:
+                routes.append(self._path(route))
+                continue
+            visited = self._visited(route, source)
+            if self._dominated(settled[current], energy, visited, k, objective):
+                continue
+            settled[current].append((energy, self._cycles.get(current, frozenset()) & visited))
+
+            for product, i in self._edges.get(current, []):
+                if product in visited:
+                    continue
+                cumulative = energy + energies[i]
+                new_score = max(score, energies[i] if objective == "barrier" else cumulative)
+                reached = visited | {product} if product in self._cycles else visited
+                if self._dominated(settled[product], cumulative, reached, k, objective):
+                    continue
+                counter += 1
+                heapq.heappush(heap, (new_score, n_steps + 1, counter, product, cumulative, (i, product, route)))
+
+        return Web(routes, self.name)
+
+    @staticmethod
+    def _dominated(
+        settled: list[tuple[float, frozenset[State]]],
+        cumulative: float,
+        visited: set[State],
+        k: int,
+        objective: str,
+    ) -> bool:
+        """
+        Whether a label is dominated by at least k of the labels settled at its state, which all have a lower score
+
+        A settled label dominates if the cycle states it visited were also visited by the label, so every continuation
+        of the label is open to it. The barrier of the rest of a route does not depend on how the state was reached,
+        but the max does, so for the max it must also have reached the state with a lower cumulative energy.
+
+        :param settled: cumulative energy and visited cycle states of each settled label
+        :param cumulative: cumulative energy of the label
+        :param visited: states visited by the label
+        """
+        n_dominating = 0
+        for energy, cycle in settled:
+            if (objective == "barrier" or energy <= cumulative) and cycle <= visited:
+                n_dominating += 1
+        return n_dominating >= k
+
+    def _path(self, route: tuple | None) -> Path:
+        """
+        Convert a linked list of reaction indices to a Path
+        """
+        reactions = []
+        while route is not None:
+            i, _, route = route
+            reactions.append(self.reactions[i])
+        reactions.reverse()
+
+        names = [" + ".join(self._states(reactions[0])[0])] if reactions else []
+        names += [" + ".join(self._states(reaction)[1]) for reaction in reactions]
+        return Path(reactions, " -> ".join(names))
+
+    def _visited(self, route: tuple | None, source: State) -> set[State]:
+        """
+        States visited along a route
+        """
+        visited = {source}
+        while route is not None:
+            _, product, route = route
+            visited.add(product)
+        return visited
+
+    def _components(self) -> list[frozenset[State]]:
+        """
+        Strongly connected components of the states (Tarjan's algorithm, iterative to support long chains)
+        """
+        index: dict[State, int] = {}
+        lowlink: dict[State, int] = {}
+        stack: list[State] = []
+        on_stack: set[State] = set()
+        components: list[frozenset[State]] = []
+        for root in self.states:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self._edges.get(root, [])))]
+            while work:
+                current, successors = work[-1]
+                for product, _ in successors:
+                    if product not in index:
+                        index[product] = lowlink[product] = len(index)
+                        stack.append(product)
+                        on_stack.add(product)
+                        work.append((product, iter(self._edges.get(product, []))))
+                        break
+                    if product in on_stack:
+                        lowlink[current] = min(lowlink[current], index[product])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[current])
+                    if lowlink[current] == index[current]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == current:
+                                break
+                        components.append(frozenset(component))
+        return components
+
+    @staticmethod
+    def _states(reaction: Reaction) -> tuple[State, State]:
+        """
+        States before and after a Reaction
+        """
+        return state(mol.name for mol in reaction.reactants), state(mol.name for mol in reaction.products)
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, suppress
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Sequence, TypeVar
+
+import numpy as np
+
+from .lazy import LazyPathArray
+from .path import Path
+from .path_array import PathArray
+
+if TYPE_CHECKING:
+    from .enumeration import Enumeration
+
+# (shared memory name, shape, dtype) of an array in shared memory
+SharedSpec = tuple[str, tuple[int, ...], str]
+T = TypeVar("T")
+
+# object sent to each worker process by _initialize
+_worker_item: Any = None
+
+
+def n_workers(workers: int | None) -> int:
+    """
+    Number of worker processes to use, None for all available cores
+    """
+    return workers or os.cpu_count() or 1
+
+
+def split(length: int, n_chunks: int) -> list[tuple[int, int]]:
+    """
+    Split range(length) into at most n_chunks contiguous (start, stop) chunks of near equal size
+
+    >>> split(10, 3)
+    [(0, 4), (4, 8), (8, 10)]
+    """
+    size = max(1, -(-length // n_chunks))
+    return [(start, min(start + size, length)) for start in range(0, length, size)]
+
+
+@contextmanager
+def shared_array(array: Any, chunks: Sequence[tuple[int, int]] = ()) -> Iterator[SharedSpec]:
+    """
+    Copy an array into shared memory (unlinked on exit) so that worker processes can read it without pickling
+
+    :param array: array-like with shape and dtype (e.g. a np.memmap or AdditiveEnergies)
+    :param chunks: (start, stop) chunks of the 0-th dimension to copy at a time, defaults to all at once
+    :yield: specification for apply_shared
+    """
+    dtype = np.dtype(getattr(array, "dtype", float))
+    shape = tuple(array.shape)
+    shm = SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+    try:
+        shared: np.ndarray = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        for start, stop in chunks or [(0, len(shared))]:
+            shared[start:stop] = array[start:stop]
+        del shared
+        yield shm.name, shape, dtype.str
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def apply_shared(spec: SharedSpec, function: Callable[[np.ndarray], T]) -> T:
+    """
+    Call a function on a read-only view of an array in shared memory, the view must not outlive the call
+
+    :param spec: specification from shared_array
+    :param function: function of the array, its result must not reference the array
+    """
+    name, shape, dtype = spec
+    shm = SharedMemory(name=name)
+    try:
+        return function(_view(shm, shape, dtype))
+    finally:
+        with suppress(BufferError):  # the view is still referenced if the function raised
+            shm.close()
+
+
+def apply_path(function: Callable[[Path], T], path: Path | None) -> T | float:
+    """
+    Call a function on a Path, NaN for missing paths
+    """
+    return np.nan if path is None else function(path)
+
+
+def _view(shm: SharedMemory, shape: tuple[int, ...], dtype: str) -> np.ndarray:
+    """
+    Read-only array backed by shared memory
+    """
+    array: np.ndarray = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    array.flags.writeable = False
+    return array
+
+
+def map_paths(
+    paths: Any,
+    function: Callable[[Path], Any],
+    workers: int | None = None,
+) -> np.ndarray:
+    """
+    Apply a function to every Path in a (flat) array of Paths across a process pool
+
+    Dense PathArrays are shared with the workers through shared memory and the Paths are generated in the workers,
+    LazyPathArrays are sent to each worker once and the workers generate the Paths of their chunks of labels, other
+    arrays of Paths are pickled in chunks of flat records (see storage.to_records).
+
+    :param paths: PathArray, LazyPathArray, or object ndarray of Paths
+    :param function: picklable (i.e. module-level) function to apply to each Path
+    :param workers: number of worker processes, None for all available cores
+    :return: array of the results in row-major order, shape (n_paths,)
+    """
+    workers = n_workers(workers)
+    n_paths = int(np.prod(paths.shape))
+    chunks = split(n_paths, 4 * workers)
+
+    if isinstance(paths, LazyPathArray):
+        with ProcessPoolExecutor(workers, initializer=_initialize, initargs=(paths,)) as executor:
+            results = executor.map(_map_lazy, *zip(*((function, *chunk) for chunk in chunks)))
+            return np.array([value for result in results for value in result])
+
+    with ProcessPoolExecutor(workers) as executor:
+        if isinstance(paths, PathArray):
+            with shared_array(paths.energies, split(len(paths), workers)) as spec:
+                metadata = (spec, paths.species, paths.labels, paths.fixed, paths.ne, paths.ref_pot)
+                results = executor.map(_map_shared, *zip(*((function, metadata, *chunk) for chunk in chunks)))
+                values = [value for result in results for value in result]
+        else:
+            from .storage import to_records
+
+            flat = list(paths.flat)
+            records = (to_records(flat[start:stop]) for start, stop in chunks)
+            results = executor.map(_map_pickled, *zip(*((function, chunk) for chunk in records)))
+            values = [value for result in results for value in result]
+
+    return np.array(values)
+
+
+def reduce_enumeration(
+    enm: Enumeration,
+    function: Callable[[Enumeration], np.ndarray],
+    chunks: Sequence[tuple[int, int]],
+    workers: int | None = None,
+) -> np.ndarray:
+    """
+    Apply a reduction to chunks of the 0-th dimension of an Enumeration across a process pool
+
+    Dense Enumerations are shared with the workers through shared memory, lazy Enumerations are sent to each worker
+    once (the Paths are generated in the workers), others are pickled in chunks.
+
+    :param enm: Enumeration to reduce
+    :param function: picklable function reducing an Enumeration to an array with its shape as the leading dimensions
+    :param chunks: (start, stop) chunks of the 0-th dimension
+    :param workers: number of worker processes, None for all available cores
+    :return: concatenated results
+    """
+    if isinstance(enm.paths, LazyPathArray):
+        with ProcessPoolExecutor(n_workers(workers), initializer=_initialize, initargs=(enm,)) as executor:
+            return np.concatenate(list(executor.map(_reduce_lazy, *zip(*((function, *chunk) for chunk in chunks)))))
+
+    with ProcessPoolExecutor(n_workers(workers)) as executor:
+        if isinstance(enm.paths, PathArray):
+            paths = enm.paths
+            with shared_array(paths.energies, chunks) as spec:
+                metadata = (spec, enm.path_names, paths.species, paths.ne, paths.ref_pot, enm.units)
+                results = list(executor.map(_reduce_shared, *zip(*((function, metadata, *chunk) for chunk in chunks))))
+        else:
+            results = list(executor.map(function, (enm[start:stop] for start, stop in chunks)))
+
+    return np.concatenate(results)
+
+
+def _reduce_shared(function: Callable[[Enumeration], np.ndarray], metadata: tuple, start: int, stop: int) -> np.ndarray:
+    """
+    Apply a reduction to the rows [start, stop) of a dense Enumeration in shared memory
+    """
+    from .enumeration import Enumeration
+
+    spec, path_names, species, ne, ref_pot, units = metadata
+    (path_name, subs), *rest = path_names.items()
+    path_names = {path_name: subs[start:stop], **dict(rest)}
+
+    def reduce(energies: np.ndarray) -> np.ndarray:
+        enm = Enumeration.from_energies(energies[start:stop], path_names, species, ne, ref_pot, units)
+        return np.array(function(enm))  # copy out of shared memory
+
+    return apply_shared(spec, reduce)
+
+
+def _map_shared(function: Callable[[Path], Any], metadata: tuple, start: int, stop: int) -> list:
+    """
+    Apply a function to the Paths of a PathArray in shared memory with flat indices [start, stop)
+    """
+    spec, *args = metadata
+
+    def apply(energies: np.ndarray) -> list:
+        paths = PathArray(energies, *args)
+        return [apply_path(function, paths[np.unravel_index(i, paths.shape)]) for i in range(start, stop)]  # type: ignore
+
+    return apply_shared(spec, apply)
+
+
+def _initialize(item: Any) -> None:
+    """
+    Keep an object sent once to each worker process (e.g. a lazy Enumeration with the data of its function)
+    """
+    global _worker_item
+    _worker_item = item
+
+
+def _map_lazy(function: Callable[[Path], Any], start: int, stop: int) -> list:
+    """
+    Apply a function to the Paths of the worker's LazyPathArray with flat indices [start, stop)
+    """
+    paths = _worker_item
+    return [apply_path(function, paths[np.unravel_index(i, paths.shape)]) for i in range(start, stop)]
+
+
+def _reduce_lazy(function: Callable[[Enumeration], np.ndarray], start: int, stop: int) -> np.ndarray:
+    """
+    Apply a reduction to the rows [start, stop) of the worker's lazy Enumeration
+    """
+    return function(_worker_item[start:stop])
+
+
+def _map_pickled(function: Callable[[Path], Any], records: dict[str, np.ndarray]) -> list:
+    """
+    Apply a function to each of the Paths flattened into records (see storage.to_records)
+    """
+    from .storage import from_records
+
+    return [apply_path(function, path) for path in from_records(records)]
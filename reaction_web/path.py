@@ -1,27 +1,119 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from typing import Iterable, Iterator, Sequence
 
+import more_itertools as mit
 import numpy as np
+from numpy.typing import ArrayLike
+
+from .electrochemistry import limiting_potential, potential_energies
+from .energetic_span import energetic_span, turnover_frequency
+from .molecule import Molecule, _bump_energy_version, _updated, energy_version
+from .reaction import EReaction, Reaction
+from .stoichiometry import StoichiometryMatrix
 
-from .reaction import Reaction
+_CACHE = ("_energies", "_relative_energies", "_energy_version", "_shared")
 
 
 @dataclass
 class Path:
     """
     Series of reactions forming a reaction path
+
+    The energies are cached (see molecule.energy_version).
     """
 
     reactions: Sequence[Reaction]
     name: str = ""
     step_sizes: Iterable[float] | None = None
     steps: np.ndarray = field(init=False)
+    _energies: np.ndarray = field(init=False, repr=False, compare=False)
+    _relative_energies: np.ndarray = field(init=False, repr=False, compare=False)
+    _energy_version: int = field(default=-1, init=False, repr=False, compare=False)
+    _shared: tuple = field(default=(), init=False, repr=False, compare=False)
 
     def __post_init__(self):
         step_sizes = self.step_sizes
         self.steps = np.zeros(len(self)) if step_sizes is None else np.array(step_sizes) - 1
         assert len(self.steps) == len(self.reactions)
 
+    def __setattr__(self, name: str, value) -> None:
+        if name == "reactions" and hasattr(self, name):
+            _bump_energy_version()
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_energies(
+        cls,
+        names: Iterable[str],
+        energies: Iterable[float],
+        name: str = "",
+        ne: Sequence[int] | None = None,
+        ref_pot: Sequence[float] | None = None,
+    ) -> Path:
+        """
+        Generate a Path from a series of species and their energies
+
+        >>> Path.from_energies("ABC", [0, 1, -1]).energies
+        array([ 1., -2.])
+
+        :param names: names of the species along the path
+        :param energies: energies of the species along the path
+        :param name: name for the Path
+        :param ne: number of electrons generated by each reaction (EReactions are generated where non-zero)
+        :param ref_pot: reference potential of each reaction
+        """
+        molecules = [Molecule(mol_name, energy) for mol_name, energy in zip(names, energies)]
+        if ne is None:
+            return cls([Reaction([reactant], [product]) for reactant, product in mit.pairwise(molecules)], name)
+
+        ref_pots = [0.0] * len(ne) if ref_pot is None else ref_pot
+        reactions = [
+            EReaction([reactant], [product], int(n), float(pot)) if n else Reaction([reactant], [product])
+            for (reactant, product), n, pot in zip(mit.pairwise(molecules), ne, ref_pots)
+        ]
+        return cls(reactions, name)
+
+    @classmethod
+    def from_steps(
+        cls,
+        names: Sequence[str],
+        energies: Sequence[float],
+        steps: Sequence,
+        name: str = "",
+    ) -> Path:
+        """
+        Generate a Path from a series of molecules, consecutive molecules on the same step (e.g. H2O + *OH) are
+        combined into the reactants and products of multi-molecule Reactions
+
+        >>> Path.from_steps(["A", "B", "C", "D"], [0, 1, -1, 2], [1, 2, 2, 3]).energies
+        array([0., 2.])
+
+        :param names: names of the molecules along the path
+        :param energies: energies of the molecules along the path
+        :param steps: step of each molecule, sorted, each molecule may only appear once per step
+        :param name: name for the Path
+        """
+        bounds = [0, *(i for i in range(1, len(steps)) if steps[i] != steps[i - 1]), len(steps)]
+        if len(bounds) == len(steps) + 1:
+            return cls.from_energies(names, energies, name)
+
+        molecules = [Molecule(mol_name, energy) for mol_name, energy in zip(names, energies)]
+        groups = [molecules[start:stop] for start, stop in mit.pairwise(bounds)]
+        for start, group in zip(bounds, groups):
+            if len({mol.name for mol in group}) != len(group):
+                raise ValueError(f"Duplicated molecules on step {steps[start]}")
+        return cls([Reaction(reactants, products) for reactants, products in mit.pairwise(groups)], name)
+
+    def __getstate__(self) -> dict:
+        """
+        Pickle without the cached energies, the Reactions are pickled as they are so that copies share them and
+        Molecules stay shared between Paths pickled together (Webs, Enumerations, and Enumeration.map pickle Paths
+        in bulk as flat records, see storage.to_records)
+        """
+        return {key: value for key, value in self.__dict__.items() if key not in _CACHE}
+
     def __len__(self) -> int:
         """
         Number of reactions
@@ -53,24 +145,134 @@ class Path:
         """
         Index and value of the minimum achieved along path
         """
-        return min(enumerate(self.relative_energies), key=lambda x: x[1])
+        relative_energies = self.relative_energies
+        idx = int(relative_energies.argmin())
+        return idx, relative_energies[idx]
 
     def max(self) -> tuple[int, float]:
         """
         Index and value of the maximum achieved along path
         """
-        return max(enumerate(self.relative_energies), key=lambda x: x[1])
+        relative_energies = self.relative_energies
+        idx = int(relative_energies.argmax())
+        return idx, relative_energies[idx]
+
+    def potential_energies(self, us: ArrayLike) -> np.ndarray:
+        """
+        Energies of the reactions at each of a series of applied potentials
+
+        :param us: applied potentials, shape (n_u,)
+        :return: energies with shape (n_u, n_reactions)
+        """
+        return potential_energies(self.energies, self.ne, self.u, us)
+
+    def limiting_potential(self) -> float:
+        """
+        Lowest applied potential at which every reaction is downhill, highest for reductive paths (see
+            electrochemistry.limiting_potential), nan if unattainable
+        """
+        return float(limiting_potential(self.energies, self.ne, self.u))
+
+    def energetic_span(self) -> tuple[float, int, int]:
+        """
+        Energetic span of the path as a catalytic cycle (see energetic_span.energetic_span)
+
+        :return: span, and the indices of the TDI and TDTS in relative_energies
+        """
+        span, tdi, tdts = energetic_span(self.relative_energies)
+        return float(span), int(tdi), int(tdts)
+
+    def turnover_frequency(self, temperature: float = 298.15, units: str = "eV") -> float:
+        """
+        Apparent turnover frequency (1/s) of the path as a catalytic cycle from its energetic span
+
+        :param temperature: temperature (K)
+        :param units: units of the energies
+        """
+        return float(turnover_frequency(self.energetic_span()[0], temperature, units))
+
+    def stoichiometry(self) -> StoichiometryMatrix:
+        """
+        Compile the reactions into a stoichiometry matrix for batched energy evaluation
+            e.g. path.stoichiometry() @ energy_sets
+        """
+        return StoichiometryMatrix.from_reactions(self)
+
+    def save(self, filename: str) -> None:
+        """
+        Save to a binary .json + .npz pair (see storage)
+
+        :param filename: where to save, the extension is replaced
+        """
+        from .storage import save
+
+        save(self, filename)
+
+    @classmethod
+    def load(cls, filename: str) -> Path:
+        """
+        Load a Path saved with Path.save
+
+        :param filename: file that was saved, the extension is ignored
+        """
+        from .storage import load
+
+        path = load(filename)
+        if not isinstance(path, cls):
+            raise TypeError(f"Expected {filename} to contain a Path, got {type(path).__name__}")
+        return path
+
+    @property
+    def ne(self) -> np.ndarray:
+        """
+        Number of electrons generated by each reaction (0 for non-electrochemical reactions)
+        """
+        return np.array([r.ne if isinstance(r, EReaction) else 0 for r in self], dtype=int)
+
+    @property
+    def u(self) -> np.ndarray:
+        """
+        Applied potential of each reaction (0 for non-electrochemical reactions)
+        """
+        return np.array([r.u if isinstance(r, EReaction) else 0 for r in self], dtype=float)
 
     @property
     def energies(self) -> np.ndarray:
         """
-        An array of the energies of the reactions
+        An array of the energies of the reactions (read-only)
         """
-        return np.fromiter(map(lambda r: r.energy, self), dtype=float)
+        self._update_energies()
+        return self._energies
 
     @property
     def relative_energies(self) -> np.ndarray:
         """
-        An array of the cumulative energy along the path
+        An array of the cumulative energy along the path (read-only)
         """
-        return np.cumsum([0.0] + [r.energy for r in self])
+        self._update_energies()
+        return self._relative_energies
+
+    def _invalidate_energies(self) -> None:
+        """
+        Force the energies to be recomputed on next access
+        """
+        self._energy_version = -1
+
+    def _update_energies(self) -> None:
+        """
+        Recompute the cached energies if any energy has changed since they were last computed
+        """
+        version = energy_version()
+        if getattr(self, "_energy_version", None) == version and not (self._shared and _updated(self._shared)):
+            return
+
+        energies = np.fromiter(map(lambda r: r.energy, self), dtype=float, count=len(self))
+        relative_energies = np.concatenate([[0.0], np.cumsum(energies)])
+        energies.flags.writeable = False
+        relative_energies.flags.writeable = False
+
+        self._energies = energies
+        self._relative_energies = relative_energies
+        self._energy_version = version
+        # the Reactions were just brought up to date, so their shared Molecule versions are current
+        self._shared = tuple(shared for reaction in self for shared in reaction._shared)
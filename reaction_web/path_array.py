@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Any, Iterator, Sequence
+
+import numpy as np
+
+from .path import Path
+
+Index = int | slice | np.ndarray
+
+
+def normalize_index(idx: Any, length: int) -> Index:
+    """
+    Normalize an index along a single axis of the given length
+
+    Regularly spaced integer and boolean arrays are converted to slices so that indexing returns a view.
+
+    >>> normalize_index(-1, 3)
+    2
+    >>> normalize_index([True, False, True], 3)
+    slice(0, 3, 2)
+    >>> normalize_index([2, 0], 3)
+    array([2, 0])
+
+    :param idx: int, slice, boolean mask, or sequence of ints
+    :param length: length of the axis
+    :return: int, slice, or array of non-negative ints
+    """
+    if isinstance(idx, (int, np.integer)):
+        return range(length)[idx]
+    if isinstance(idx, slice):
+        return idx
+
+    idxs = np.asarray(idx)
+    if idxs.dtype == bool:
+        if idxs.shape != (length,):
+            raise IndexError(f"Boolean index has shape {idxs.shape}, expected ({length},)")
+        idxs = np.flatnonzero(idxs)
+    elif idxs.ndim != 1 or not np.issubdtype(idxs.dtype, np.integer):
+        raise IndexError(f"Unable to index with {idx!r}")
+    idxs = np.arange(length)[idxs]  # bounds check and normalize negative indices
+
+    if len(idxs) == 1:
+        return slice(int(idxs[0]), int(idxs[0]) + 1)
+    if len(idxs) > 1:
+        step = int(idxs[1] - idxs[0])
+        if step > 0 and (np.diff(idxs) == step).all():
+            return slice(int(idxs[0]), int(idxs[-1]) + 1, step)
+    return idxs
+
+
+def outer_index(array: np.ndarray, key: Sequence[Index]) -> np.ndarray:
+    """
+    Index each axis independently (unlike numpy, which broadcasts multiple index arrays together)
+
+    A view is returned unless an array index is needed.
+
+    :param array: array to index
+    :param key: normalized index for each of the leading axes
+    """
+    out = array[tuple(k if isinstance(k, (int, slice)) else slice(None) for k in key)]
+
+    axis = 0
+    for k in key:
+        if isinstance(k, int):
+            continue
+        if isinstance(k, np.ndarray):
+            out = np.take(out, k, axis=axis)
+        axis += 1
+
+    return out
+
+
+def normalize_key(idx: Any, shape: tuple[int, ...]) -> tuple[Index, ...]:
+    """
+    Normalize an index for each of the dimensions of the given shape (see normalize_index)
+
+    :param idx: index or tuple of indices for the leading dimensions, missing dimensions are kept whole
+    :param shape: shape of the indexed array
+    """
+    idxs = idx if isinstance(idx, tuple) else (idx,)
+    if len(idxs) > len(shape):
+        raise IndexError(f"Too many indices for array of dimension {len(shape)}")
+    idxs += (slice(None),) * (len(shape) - len(idxs))
+
+    return tuple(map(normalize_index, idxs, shape))
+
+
+def select_labels(labels: tuple[str, ...], idx: slice | np.ndarray) -> tuple[str, ...]:
+    """
+    Labels remaining after indexing an axis
+    """
+    return labels[idx] if isinstance(idx, slice) else tuple(labels[i] for i in idx)
+
+
+def index_labels(
+    key: Sequence[Index],
+    labels: Sequence[tuple[str, ...]],
+    fixed: Sequence[str | None],
+) -> tuple[tuple[tuple[str, ...], ...], tuple[str | None, ...]]:
+    """
+    Labels of the remaining dimensions and the updated fixed labels after indexing
+
+    :param key: normalized index for each dimension
+    :param labels: labels along each dimension
+    :param fixed: labels for every axis of the original array, None for axes that have not been indexed
+    """
+    free = iter(zip(key, labels))
+    new_fixed: list[str | None] = []
+    new_labels: list[tuple[str, ...]] = []
+    for label in fixed:
+        if label is None:
+            k, axis_labels = next(free)
+            if isinstance(k, int):
+                label = axis_labels[k]
+            else:
+                new_labels.append(select_labels(axis_labels, k))
+        new_fixed.append(label)
+
+    return tuple(new_labels), tuple(new_fixed)
+
+
+@dataclass
+class PathArray:
+    """
+    An ndarray-like collection of Paths backed by a dense energy tensor
+
+    Paths are only generated when indexed or iterated over, allowing large
+    Enumerations to be stored as a single float array. Missing paths are stored as NaN and indexed as None.
+
+    :param energies: energies of the species at each step, shape (*shape, n_steps), may be a np.memmap;
+        an array-like with shape and __getitem__ (e.g. AdditiveEnergies) is evaluated lazily
+    :param species: names of the species at each step
+    :param labels: labels along each axis, used for naming the generated Paths
+    :param fixed: labels for every axis of the original array, None for axes that have not been indexed
+    :param ne: number of electrons generated by each reaction (EReactions are generated where non-zero)
+    :param ref_pot: reference potential of each reaction
+    """
+
+    energies: np.ndarray
+    species: tuple[str, ...]
+    labels: tuple[tuple[str, ...], ...] = ()
+    fixed: tuple[str | None, ...] = ()
+    ne: np.ndarray | None = None
+    ref_pot: np.ndarray | None = None
+
+    def __post_init__(self):
+        if isinstance(self.energies, np.ndarray) or not hasattr(self.energies, "shape"):
+            # keep memory-mapped and reduced precision energies without copying
+            self.energies = np.asanyarray(self.energies)
+            if not np.issubdtype(self.energies.dtype, np.floating):
+                self.energies = self.energies.astype(float)
+        self.species = tuple(self.species)
+
+        if self.energies.ndim < 1:
+            raise ValueError("Expected energies to have a step axis.")
+        if len(self.species) != self.energies.shape[-1]:
+            raise ValueError(f"Expected one species per step, got {len(self.species)=} != {self.energies.shape[-1]=}")
+
+        self.ne = np.zeros(self.n_steps - 1, dtype=int) if self.ne is None else np.asarray(self.ne, dtype=int)
+        self.ref_pot = np.zeros(self.n_steps - 1) if self.ref_pot is None else np.asarray(self.ref_pot, dtype=float)
+        if self.ne.shape != (self.n_steps - 1,) or self.ref_pot.shape != (self.n_steps - 1,):
+            raise ValueError(f"Expected ne and ref_pot to have one value per reaction ({self.n_steps - 1}).")
+
+        if not self.labels:
+            self.labels = tuple(tuple(map(str, range(length))) for length in self.shape)
+        if tuple(map(len, self.labels)) != self.shape:
+            raise ValueError(f"Expected labels to match the shape, got {tuple(map(len, self.labels))} != {self.shape}")
+
+        self.fixed = self.fixed or (None,) * self.ndim
+        if self.fixed.count(None) != self.ndim:
+            raise ValueError(f"Expected fixed to have a None for each of the {self.ndim} dimensions.")
+
+    def __repr__(self) -> str:
+        return f"<PathArray {self.shape} x {self.n_steps}>"
+
+    def __len__(self) -> int:
+        """
+        Length of the 0-th dimension
+        """
+        return self.shape[0]
+
+    def __getitem__(self, idx: Any) -> PathArray | Path | None:
+        """
+        Index each dimension with an int, slice, boolean mask, or sequence of ints
+
+        A Path is generated if all dimensions are indexed with ints (None if any of its energies are NaN),
+        otherwise a view is returned where possible.
+        """
+        key = normalize_key(idx, self.shape)
+        labels, fixed = index_labels(key, self.labels, self.fixed)
+
+        if not labels:
+            energies = self.energies[key]  # type: ignore
+            if np.isnan(energies).any():
+                return None
+            ne, ref_pot = (self.ne, self.ref_pot) if self.electrochemical else (None, None)
+            return Path.from_energies(self.species, energies, str(tuple(fixed)), ne, ref_pot)  # type: ignore
+
+        energies = outer_index(self.energies, key)
+        return PathArray(energies, self.species, labels, fixed, self.ne, self.ref_pot)
+
+    def __iter__(self) -> Iterator[PathArray] | Iterator[Path | None]:
+        for i in range(len(self)):
+            yield self[i]  # type: ignore
+
+    @property
+    def flat(self) -> Iterator[Path | None]:
+        """
+        Iterate over all Paths in row-major order (mirrors np.ndarray.flat), None for missing paths
+        """
+        for idxs in product(*map(range, self.shape)):
+            yield self[idxs]  # type: ignore
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.energies.shape[:-1]
+
+    @property
+    def ndim(self) -> int:
+        return self.energies.ndim - 1
+
+    @property
+    def electrochemical(self) -> bool:
+        """
+        Whether any of the reactions generate electrons
+        """
+        return bool(np.any(self.ne))
+
+    @property
+    def n_steps(self) -> int:
+        """
+        Number of species along each path
+        """
+        return self.energies.shape[-1]
@@ -6,6 +6,7 @@ import numpy as np
 
 from .. import Enumeration, Path, Web, translate
 from .._typing import PLOT
+from ..tools.helper import energy_label
 
 
 def gen_plot(
@@ -112,7 +113,7 @@ def plot_web(
 
     if not plot:
         if style == "stacked":
-            fig, axes = gen_plot(max_len, title, xtickslabels=xtickslabels)
+            fig, axes = gen_plot(max_len, title, ylabel=energy_label(web.units), xtickslabels=xtickslabels)
             axes_flat = [axes] * len(web)
 
         elif style == "subplots":
@@ -131,7 +132,7 @@ def plot_web(
             if xtickslabels:
                 axes_flat[-1].set_xticklabels(xtickslabels)
 
-            axes_flat[0].set_ylabel("Energy")
+            axes_flat[0].set_ylabel(energy_label(web.units))
 
     else:
         fig, axes = plot
@@ -178,13 +179,15 @@ def plot_enumeration(
     if style != "stacked":
         raise NotImplementedError()
 
-    fig, ax = plot or gen_plot(len(enm), title, xtickslabels=xtickslabels)
+    fig, ax = plot or gen_plot(len(enm), title, ylabel=energy_label(enm.units), xtickslabels=xtickslabels)
 
     if plot and title:
         plot[1].set_title(title)
 
     if enm.ndim == 1:
         for path in enm:
+            if path is None:  # missing path
+                continue
             assert isinstance(path, Path)
             plot_path(path, plot=(fig, ax), spread=spread, latexify=latexify)
     else:
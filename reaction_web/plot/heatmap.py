@@ -7,6 +7,7 @@ from numpy.typing import NDArray
 
 from .. import Enumeration, Path, Web, translate
 from .._typing import PLOT, Axes, Figure
+from ..tools.helper import energy_label
 
 
 def gen_heatmap_plot(
@@ -93,6 +94,8 @@ def heatmap_web(
     """
     Generate heatmaps for all paths in Web
 
+    Note: paths shorter than the longest path are left blank past their end, a colorbar is added if the Web has units
+
     :param web: Web to plot
     :param title: title for plot
     :param plot: where to plot the Path
@@ -104,11 +107,8 @@ def heatmap_web(
     :param cmap: colormap for heatmap
     :param latexify: convert names to latex
     """
-    web_length = len(web.paths[0])
-    if not all(web_length == len(p) for p in web.paths):
-        raise ValueError("Can only plot paths with consistent path lengths.")
-
-    data = np.array([path.energies for path in web])
+    data = web.energies
+    web_length = data.shape[1]
 
     if not xtickslabels:
         xtickslabels = list(map(str, range(web_length + 1)))
@@ -120,11 +120,14 @@ def heatmap_web(
     if title:
         fig.suptitle(title)
 
-    ax.imshow(data, cmap)
+    image = ax.imshow(data, cmap)
+    if web.units:
+        fig.colorbar(image, ax=ax, label=energy_label(web.units))
 
     if showvals:
-        for (j, i), val in np.ndenumerate(data):
-            ax.text(i, j, f"{val:.1f}", ha="center", va="center")
+        for (j, i), val in np.ndenumerate(data.filled(np.nan)):
+            if not np.isnan(val):
+                ax.text(i, j, f"{val:.1f}", ha="center", va="center")
 
     return fig, ax
 
@@ -155,11 +158,45 @@ def heatmap_webs_function(
     :param showvals: show cell values on the heatmap
     :param cmap: colormap for heatmap
     """
+    data = [np.array([function(path) for path in web]) for web in webs]
+
+    return heatmap_webs_values(webs, data, title, plot, xtickslabels, ytickslabels, rotate_ylabels, showvals, cmap)
+
+
+def heatmap_webs_values(
+    webs: Sequence[Web],
+    data: Sequence[NDArray[np.floating]],
+    title: str = "",
+    plot: PLOT | None = None,
+    xtickslabels: Sequence[str] | None = None,
+    ytickslabels: Sequence[str] | None = None,
+    rotate_ylabels: bool = False,
+    showvals: bool = False,
+    cmap="coolwarm",
+    units: str | None = None,
+) -> PLOT:
+    """
+    Generate heatmap from arrays with a value for each Path in the Webs
+
+    Note: each Web is on a different row, with Paths spread across columns, masked values are left blank
+
+    :param webs: Webs to plot
+    :param data: values for each Path in each Web (may be masked arrays)
+    :param title: title for plot
+    :param plot: where to plot the Path
+        e.g. using default canvas (plt) or a subplot (the given axis)
+    :param xtickslabels: labels for the x-ticks
+    :param ytickslabels: labels for the y-ticks
+    :param rotate_ylabels: rotate labels on y-axis
+    :param showvals: show cell values on the heatmap
+    :param cmap: colormap for heatmap
+    :param units: energy units of the values, labels a colorbar if given
+    """
     length = len(webs[0])
     if not all(length == len(web) for web in webs):
         raise ValueError("Can only plot Webs with the same number of Paths")
 
-    data = np.array([[function(path) for path in web] for web in webs])
+    values = np.ma.stack(data)
 
     if not xtickslabels:
         xtickslabels = list(map(str, range(length + 1)))
@@ -168,11 +205,14 @@ def heatmap_webs_function(
 
     fig, ax = plot or gen_heatmap_plot(title, "R1", "R2", xtickslabels, ytickslabels, rotate_ylabels)
 
-    ax.imshow(data, cmap)
+    image = ax.imshow(values, cmap)
+    if units:
+        fig.colorbar(image, ax=ax, label=energy_label(units))
 
     if showvals:
-        for (j, i), val in np.ndenumerate(data):
-            ax.text(i, j, f"{val:.1f}", ha="center", va="center")
+        for (j, i), val in np.ndenumerate(values.filled(np.nan)):
+            if not np.isnan(val):
+                ax.text(i, j, f"{val:.1f}", ha="center", va="center")
 
     return fig, ax
 
@@ -202,12 +242,10 @@ def heatmap_webs_max(
     :param showvals: show cell values on the heatmap
     :param cmap: colormap for heatmap
     """
+    data = [web.relative_energies.max(axis=1) for web in webs]
 
-    def path_max(path: Path) -> float:
-        return path.max()[1]
-
-    return heatmap_webs_function(
-        webs, path_max, title, plot, xtickslabels, ytickslabels, rotate_ylabels, showvals, cmap
+    return heatmap_webs_values(
+        webs, data, title, plot, xtickslabels, ytickslabels, rotate_ylabels, showvals, cmap, webs[0].units
     )
 
 
@@ -236,12 +274,10 @@ def heatmap_webs_min(
     :param showvals: show cell values on the heatmap
     :param cmap: colormap for heatmap
     """
+    data = [web.relative_energies.min(axis=1) for web in webs]
 
-    def path_min(path: Path) -> float:
-        return path.min()[1]
-
-    return heatmap_webs_function(
-        webs, path_min, title, plot, xtickslabels, ytickslabels, rotate_ylabels, showvals, cmap
+    return heatmap_webs_values(
+        webs, data, title, plot, xtickslabels, ytickslabels, rotate_ylabels, showvals, cmap, webs[0].units
     )
 
 
@@ -271,12 +307,10 @@ def heatmap_webs_step(
     :param showvals: show cell values on the heatmap
     :param cmap: colormap for heatmap
     """
+    data = [web.energies[:, step] for web in webs]
 
-    def path_step(path: Path) -> float:
-        return path.energies[step]
-
-    return heatmap_webs_function(
-        webs, path_step, title, plot, xtickslabels, ytickslabels, rotate_ylabels, showvals, cmap
+    return heatmap_webs_values(
+        webs, data, title, plot, xtickslabels, ytickslabels, rotate_ylabels, showvals, cmap, webs[0].units
     )
 
 
@@ -306,12 +340,10 @@ def heatmap_webs_relative_step(
     :param showvals: show cell values on the heatmap
     :param cmap: colormap for heatmap
     """
+    data = [web.relative_energies[:, step] for web in webs]
 
-    def path_relative_step(path: Path) -> float:
-        return path.relative_energies[step]
-
-    return heatmap_webs_function(
-        webs, path_relative_step, title, plot, xtickslabels, ytickslabels, rotate_ylabels, showvals, cmap
+    return heatmap_webs_values(
+        webs, data, title, plot, xtickslabels, ytickslabels, rotate_ylabels, showvals, cmap, webs[0].units
     )
 
 
@@ -322,17 +354,52 @@ def heatmap_enumeration_function(
     plot: PLOT | None = None,
     showvals: bool = False,
     cmap="coolwarm",
+    workers: int | None = 1,
 ) -> PLOT:
     """
     Generate heatmap from a value in each Path in the Enumeration
 
+    Note: calls function on every Path, prefer the vectorized heatmap_enumeration_* functions when available
+
     :param enumeration: Enumeration to plot
+    :param function: function to generate a value from each Path
     :param title: title for plot
     :param plot: where to plot the Path
         e.g. using default canvas (plt) or a subplot (the given axis)
     :param showvals: show cell values on the heatmap
     :param cmap: colormap for heatmap
+    :param workers: number of worker processes to call the function in (see Enumeration.map)
+    """
+    values = enm.map(function, workers).astype(float)
+    return heatmap_enumeration_values(enm, values, title, plot, showvals, cmap)
+
+
+def heatmap_enumeration_values(
+    enm: Enumeration,
+    values: NDArray[np.floating],
+    title: str = "",
+    plot: PLOT | None = None,
+    showvals: bool = False,
+    cmap="coolwarm",
+    units: str | None = None,
+) -> PLOT:
     """
+    Generate heatmap from an array of values for each Path in the Enumeration
+
+    :param enumeration: Enumeration to plot
+    :param values: array of values with the same shape as the Enumeration
+    :param title: title for plot
+    :param plot: where to plot the Path
+        e.g. using default canvas (plt) or a subplot (the given axis)
+    :param showvals: show cell values on the heatmap
+    :param cmap: colormap for heatmap
+    :param units: energy units of the values, labels a colorbar if given
+    """
+    if values.shape != enm.shape:
+        raise ValueError(
+            f"Expected values to have the same shape as the Enumeration, got {values.shape} != {enm.shape}"
+        )
+
     labels = list(enm.path_names.values())
     fig, axes = plot or gen_subplots(enm.shape[:-2], labels=labels[:-2])[:2]
 
@@ -346,21 +413,110 @@ def heatmap_enumeration_function(
         *head, m, n = enm.shape
         n_heatmaps = int(np.prod(head))  # np.prod returns 1.0 for an empty iterable
 
-    data_l_m_n = np.fromiter(map(function, enm.paths.flat), dtype=float).reshape(n_heatmaps, m, n)
-    vmin = data_l_m_n.min()
-    vmax = data_l_m_n.max()
+    data_l_m_n = values.reshape(n_heatmaps, m, n)
+    vmin = np.nanmin(data_l_m_n)  # missing paths (NaN) are left blank
+    vmax = np.nanmax(data_l_m_n)
 
     for ax, data in zip(axes.flat, data_l_m_n):  # type: ignore
         gen_heatmap_plot(xtickslabels=labels[-1], ytickslabels=labels[-2], plot=(fig, ax))
-        ax.imshow(data, cmap, vmin=vmin, vmax=vmax)
+        image = ax.imshow(data, cmap, vmin=vmin, vmax=vmax)
 
         if showvals:
             for (j, i), val in np.ndenumerate(data):
+                if np.isnan(val):
+                    continue
                 ax.text(i, j, f"{val:.1f}", ha="center", va="center")
 
+    if units:
+        fig.colorbar(image, ax=axes, label=energy_label(units))
+
     return fig, axes
 
 
+def heatmap_enumeration_max(
+    enm: Enumeration,
+    title: str = "",
+    plot: PLOT | None = None,
+    showvals: bool = False,
+    cmap="coolwarm",
+) -> PLOT:
+    """
+    Generate heatmap from the max of each Path in the Enumeration
+
+    :param enumeration: Enumeration to plot
+    :param title: title for plot
+    :param plot: where to plot the Path
+        e.g. using default canvas (plt) or a subplot (the given axis)
+    :param showvals: show cell values on the heatmap
+    :param cmap: colormap for heatmap
+    """
+    return heatmap_enumeration_values(enm, enm.max(), title, plot, showvals, cmap, enm.units)
+
+
+def heatmap_enumeration_min(
+    enm: Enumeration,
+    title: str = "",
+    plot: PLOT | None = None,
+    showvals: bool = False,
+    cmap="coolwarm",
+) -> PLOT:
+    """
+    Generate heatmap from the min of each Path in the Enumeration
+
+    :param enumeration: Enumeration to plot
+    :param title: title for plot
+    :param plot: where to plot the Path
+        e.g. using default canvas (plt) or a subplot (the given axis)
+    :param showvals: show cell values on the heatmap
+    :param cmap: colormap for heatmap
+    """
+    return heatmap_enumeration_values(enm, enm.min(), title, plot, showvals, cmap, enm.units)
+
+
+def heatmap_enumeration_step(
+    enm: Enumeration,
+    step: int,
+    title: str = "",
+    plot: PLOT | None = None,
+    showvals: bool = False,
+    cmap="coolwarm",
+) -> PLOT:
+    """
+    Generate heatmap from a specific step for each Path in the Enumeration
+
+    :param enumeration: Enumeration to plot
+    :param step: reaction to plot
+    :param title: title for plot
+    :param plot: where to plot the Path
+        e.g. using default canvas (plt) or a subplot (the given axis)
+    :param showvals: show cell values on the heatmap
+    :param cmap: colormap for heatmap
+    """
+    return heatmap_enumeration_values(enm, enm.step(step), title, plot, showvals, cmap, enm.units)
+
+
+def heatmap_enumeration_relative_step(
+    enm: Enumeration,
+    step: int,
+    title: str = "",
+    plot: PLOT | None = None,
+    showvals: bool = False,
+    cmap="coolwarm",
+) -> PLOT:
+    """
+    Generate heatmap from the cumulative energy at a specific step for each Path in the Enumeration
+
+    :param enumeration: Enumeration to plot
+    :param step: point along the path to plot
+    :param title: title for plot
+    :param plot: where to plot the Path
+        e.g. using default canvas (plt) or a subplot (the given axis)
+    :param showvals: show cell values on the heatmap
+    :param cmap: colormap for heatmap
+    """
+    return heatmap_enumeration_values(enm, enm.relative_step(step), title, plot, showvals, cmap, enm.units)
+
+
 def gen_subplots(
     shape: Sequence[int],
     fig: Figure | None = None,
@@ -1,18 +1,57 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Iterator, Sequence
 
-from .molecule import Molecule
+from .molecule import Molecule, _bump_energy_version, _shared_versions, _updated, energy_version
 
+_set = object.__setattr__
 
-@dataclass
-class Reaction:
+
+class _CachedEnergy:
+    """
+    Slots of the cached energy, kept out of the dataclass fields of Reaction
+    """
+
+    __slots__ = ("_energy", "_energy_version", "_shared")
+
+    _energy: float
+    _energy_version: int
+    _shared: tuple[tuple[Molecule, int], ...]
+
+
+@dataclass(slots=True, init=False)
+class Reaction(_CachedEnergy):
     """
     A transformation from reactant to product molecules.
+
+    The energy is cached (see molecule.energy_version).
     """
 
     reactants: Sequence[Molecule]
     products: Sequence[Molecule]
 
+    def __init__(self, reactants: Sequence[Molecule], products: Sequence[Molecule]):
+        # bypass __setattr__, a new Reaction does not invalidate any cached energies
+        _set(self, "reactants", reactants)
+        _set(self, "products", products)
+
+    def __setattr__(self, name: str, value) -> None:
+        _set(self, name, value)
+        if name[0] != "_":
+            _bump_energy_version()
+
+    def __getstate__(self) -> tuple[None, dict]:
+        """
+        Pickle without the cached energy, the energy version is only meaningful within a process
+        """
+        return None, {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def __setstate__(self, state: tuple[None, dict]) -> None:
+        """
+        Restore the fields without invalidating any cached energies
+        """
+        for name, value in state[1].items():
+            _set(self, name, value)
+
     def __str__(self) -> str:
         """
         Reaction equation string
@@ -32,10 +71,27 @@ class Reaction:
         """
         Energy of the reaction (i.e. products - reactants)
         """
-        return sum(map(lambda x: x.energy, self.products)) - sum(map(lambda x: x.energy, self.reactants))
+        version = energy_version()
+        if getattr(self, "_energy_version", None) == version and not (self._shared and _updated(self._shared)):
+            return self._energy
+        energy = self._calc_energy()
+        _set(self, "_energy", energy)
+        _set(self, "_energy_version", version)
+        _set(self, "_shared", _shared_versions((*self.reactants, *self.products)))
+        return energy
 
+    def _invalidate_energy(self) -> None:
+        """
+        Force the energy to be recomputed on next access
+        """
+        self._energy_version = -1
 
-@dataclass
+    def _calc_energy(self) -> float:
+        # the slot behind Molecule.energy, skipping the property on this hot path
+        return sum([mol._energy for mol in self.products]) - sum([mol._energy for mol in self.reactants])
+
+
+@dataclass(slots=True, init=False)
 class EReaction(Reaction):
     """
     Electrochemical reaction wherein electrons are released or absorbed
@@ -51,16 +107,24 @@ class EReaction(Reaction):
     ref_pot: float
     u: float = 0
 
+    def __init__(
+        self, reactants: Sequence[Molecule], products: Sequence[Molecule], ne: int, ref_pot: float, u: float = 0
+    ):
+        _set(self, "reactants", reactants)
+        _set(self, "products", products)
+        _set(self, "ne", ne)
+        _set(self, "ref_pot", ref_pot)
+        _set(self, "u", u)
+
     def __str__(self) -> str:
         """
         Reaction equation string with reference potential
         """
-        return super().__str__() + f" + !{self.ref_pot:.2f}!"
+        return Reaction.__str__(self) + f" + !{self.ref_pot:.2f}!"
 
-    @property
-    def energy(self) -> float:
+    def _calc_energy(self) -> float:
         """
         Energy of the reaction with the reference potential included
             i.e. products - reactants - ref_pot
         """
-        return super().energy - (self.ref_pot + self.u) * self.ne
+        return Reaction._calc_energy(self) - (self.ref_pot + self.u) * self.ne
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Iterator
+
+import numpy as np
+
+from .enumeration import Enumeration
+from .molecule import FrozenMolecule, Molecule, _bump_energy_version
+from .path import Path
+from .path_array import PathArray
+from .reaction import Reaction
+from .web import Web
+
+
+@dataclass
+class SpeciesTable:
+    """
+    Registry of shared reference species (e.g. H2, H2O, H+) with an index of everything that uses them
+
+    Molecules in tracked Reactions, Paths, Webs, and Enumerations are replaced by the shared Molecule with the
+    same name, so updating a species energy only recomputes the affected cached energies and enumeration cells.
+    Objects that hold a shared Molecule without being tracked notice its updated version (see Molecule), but dense
+    Enumerations built after the update must be tracked to receive the update.
+
+    :param molecules: shared Molecules, keyed by name
+    """
+
+    molecules: dict[str, Molecule] = field(default_factory=dict)
+    _reactions: defaultdict[str, list[Reaction]] = field(default_factory=lambda: defaultdict(list), repr=False)
+    _paths: defaultdict[str, list[Path]] = field(default_factory=lambda: defaultdict(list), repr=False)
+    _webs: defaultdict[str, list[Web]] = field(default_factory=lambda: defaultdict(list), repr=False)
+    _arrays: defaultdict[str, list[tuple[PathArray, np.ndarray, np.ndarray]]] = field(
+        default_factory=lambda: defaultdict(list), repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self.molecules)
+
+    def __iter__(self) -> Iterator[Molecule]:
+        yield from self.molecules.values()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.molecules
+
+    def __getitem__(self, name: str) -> Molecule:
+        return self.molecules[name]
+
+    def add(self, molecule: Molecule) -> Molecule:
+        """
+        Register a shared Molecule, returning the already registered Molecule if the name is taken
+        """
+        molecule = self.molecules.setdefault(molecule.name, molecule)
+        if molecule._version is None and not isinstance(molecule, FrozenMolecule):
+            molecule._version = 0
+            _bump_energy_version()  # energies cached before the Molecule was shared do not store its version
+        return molecule
+
+    def track(self, item: Reaction | Path | Web | Enumeration) -> None:
+        """
+        Use the shared Molecules in item and index it for future updates
+
+        :param item: Reaction, Path, Web, or Enumeration that uses the registered species
+        """
+        if isinstance(item, Reaction):
+            self._track_reaction(item)
+        elif isinstance(item, Path):
+            self._track_path(item)
+        elif isinstance(item, Web):
+            for name in set().union(*map(self._track_path, item)):
+                self._webs[name].append(item)
+        elif isinstance(item, Enumeration):
+            if isinstance(item.paths, PathArray):
+                self._track_array(item.paths)
+            else:
+                for path in item.paths.flat:
+                    if path is not None:
+                        self.track(path)
+        else:
+            raise TypeError(f"Unable to track {type(item)}")
+
+    def update(self, name: str, energy: float) -> None:
+        """
+        Update the energy of a shared species, only invalidating the energies that depend on it
+
+        :param name: name of the species
+        :param energy: new energy
+        """
+        molecule = self.molecules[name]
+        delta = energy - molecule.energy
+        # skip the global invalidation of every cached energy, untracked holders compare the version instead
+        molecule._energy = energy
+        molecule._version += 1  # type: ignore
+
+        for reaction in self._reactions[name]:
+            reaction._invalidate_energy()
+        for path in self._paths[name]:
+            path._invalidate_energies()
+        for web in self._webs[name]:
+            web._invalidate_energies()
+        for array, steps, counts in self._arrays[name]:
+            # lazily evaluated additive energies only need their shared base updated
+            energies = array.energies if isinstance(array.energies, np.ndarray) else array.energies.base
+            energies[..., steps] += delta * counts
+
+    def _track_path(self, path: Path) -> set[str]:
+        """
+        Replace the registered species in the path with the shared Molecules
+
+        :return: names of the registered species in the path
+        """
+        names: set[str] = set().union(*map(self._track_reaction, path))
+        for name in names:
+            self._paths[name].append(path)
+        return names
+
+    def _track_reaction(self, reaction: Reaction) -> set[str]:
+        """
+        Replace the registered species in the reaction with the shared Molecules
+
+        :return: names of the registered species in the reaction
+        """
+        names = {mol.name for mol in (*reaction.reactants, *reaction.products) if mol.name in self.molecules}
+        if names:
+            reaction.reactants = [self.molecules.get(mol.name, mol) for mol in reaction.reactants]
+            reaction.products = [self.molecules.get(mol.name, mol) for mol in reaction.products]
+            for name in names:
+                self._reactions[name].append(reaction)
+        return names
+
+    def _track_array(self, array: PathArray) -> None:
+        """
+        Index the steps of a dense PathArray that contain registered species
+
+        Steps with multiple species are expected to be named "A + B"
+        """
+        step_counts = [Counter(step.split(" + ")) for step in array.species]
+        for name in self.molecules:
+            steps = np.array([i for i, counts in enumerate(step_counts) if name in counts], dtype=int)
+            if len(steps):
+                counts = np.array([step_counts[i][name] for i in steps], dtype=float)
+                self._arrays[name].append((array, steps, counts))
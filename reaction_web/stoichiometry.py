@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .reaction import EReaction, Reaction
+
+
+@dataclass
+class StoichiometryMatrix:
+    """
+    Sparse (CSR) reaction x species stoichiometry matrix, compiled once so that the reaction energies for many sets
+    of species energies (e.g. functionals, temperatures, or bootstrap samples) are a single product
+
+    >>> from reaction_web import Molecule
+    >>> H, H2 = Molecule("H", 1), Molecule("H2", -1)
+    >>> S = StoichiometryMatrix.from_reactions([Reaction([H, H], [H2])])
+    >>> S.toarray()
+    array([[-2.,  1.]])
+    >>> S @ [[1, 2], [-1, 0]]
+    array([[-3., -4.]])
+
+    :param species: names of the species (columns)
+    :param data: stoichiometric coefficient of each non-zero entry, products positive and reactants negative
+    :param indices: species index of each non-zero entry
+    :param indptr: start of each reaction (row) in data and indices, shape (n_reactions + 1,)
+    :param offsets: constant energy of each reaction (the reference and applied potential term of EReactions)
+    :param energies: current energy of each species
+    """
+
+    species: tuple[str, ...]
+    data: np.ndarray
+    indices: np.ndarray
+    indptr: np.ndarray
+    offsets: np.ndarray
+    energies: np.ndarray
+
+    def __post_init__(self):
+        self.species = tuple(self.species)
+        self.data = np.asarray(self.data, dtype=float)
+        self.indices = np.asarray(self.indices, dtype=int)
+        self.indptr = np.asarray(self.indptr, dtype=int)
+        self.offsets = np.asarray(self.offsets, dtype=float)
+        self.energies = np.asarray(self.energies, dtype=float)
+
+        if len(self.data) != len(self.indices) or self.indptr[-1] != len(self.data):
+            raise ValueError("Expected data and indices to have indptr[-1] entries.")
+        if self.offsets.shape != (self.shape[0],) or self.energies.shape != (self.shape[1],):
+            raise ValueError("Expected an offset for each reaction and an energy for each species.")
+
+    @classmethod
+    def from_reactions(cls, reactions: Iterable[Reaction]) -> StoichiometryMatrix:
+        """
+        Compile Reactions into a stoichiometry matrix, species are identified by name
+
+        Repeated molecules (e.g. [H, H]) are combined and molecules on both sides cancel.
+
+        :param reactions: Reactions to compile (rows)
+        """
+        species: dict[str, int] = {}
+        energies: list[float] = []
+        data: list[int] = []
+        indices: list[int] = []
+        indptr = [0]
+        offsets = []
+
+        for reaction in reactions:
+            coefficients: Counter[int] = Counter()
+            for sign, molecules in ((-1, reaction.reactants), (1, reaction.products)):
+                for molecule in molecules:
+                    i = species.setdefault(molecule.name, len(species))
+                    if i == len(energies):
+                        energies.append(molecule.energy)
+                    elif energies[i] != molecule.energy:
+                        raise ValueError(f"{molecule.name} has multiple energies: {energies[i]} and {molecule.energy}")
+                    coefficients[i] += sign
+
+            for i, coefficient in coefficients.items():
+                if coefficient:
+                    indices.append(i)
+                    data.append(coefficient)
+            indptr.append(len(data))
+            offsets.append((reaction.ref_pot + reaction.u) * reaction.ne if isinstance(reaction, EReaction) else 0)
+
+        return cls(tuple(species), data, indices, indptr, offsets, energies)  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"<StoichiometryMatrix {self.shape}>"
+
+    def __matmul__(self, energies: ArrayLike) -> np.ndarray:
+        """
+        Reaction energies for sets of species energies
+
+        :param energies: energies of the species, shape (n_species,) or (n_species, n_sets)
+        :return: reaction energies, shape (n_reactions,) or (n_reactions, n_sets)
+        """
+        energies = np.asarray(energies, dtype=float)
+        if energies.shape[:1] != (self.shape[1],):
+            raise ValueError(f"Expected energies for {self.shape[1]} species, got {energies.shape=}")
+
+        terms = self.data.reshape(-1, *(1,) * (energies.ndim - 1)) * energies[self.indices]
+        out = np.zeros((self.shape[0], *energies.shape[1:]))
+        rows = np.flatnonzero(np.diff(self.indptr))  # np.add.reduceat misbehaves for empty rows
+        if len(rows):
+            out[rows] = np.add.reduceat(terms, self.indptr[rows], axis=0)
+
+        return out - self.offsets.reshape(-1, *(1,) * (energies.ndim - 1))
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        (number of reactions, number of species)
+        """
+        return len(self.indptr) - 1, len(self.species)
+
+    def reaction_energies(self, energies: ArrayLike | Mapping[str, ArrayLike] | None = None) -> np.ndarray:
+        """
+        Reaction energies, defaulting to the current species energies
+
+        :param energies: energies of the species with shape (n_species[, n_sets]), or keyed by species name where
+            missing species use their current energy
+        """
+        if energies is None:
+            return self @ self.energies
+        if isinstance(energies, Mapping):
+            energies = self.species_energies(energies)
+        return self @ energies
+
+    def species_energies(self, energies: Mapping[str, ArrayLike]) -> np.ndarray:
+        """
+        Array of species energies, using the current energy for species that are not given
+
+        :param energies: energies of the species keyed by name, each scalar or shape (n_sets,)
+        :return: energies with shape (n_species[, n_sets])
+        """
+        if unknown := set(energies) - set(self.species):
+            raise KeyError(f"{unknown} are not species of the StoichiometryMatrix")
+
+        n_sets = np.broadcast_shapes(*(np.shape(values) for values in energies.values()))
+        out = np.empty((self.shape[1], *n_sets))
+        for i, (name, current) in enumerate(zip(self.species, self.energies)):
+            out[i] = energies.get(name, current)
+        return out
+
+    def toarray(self) -> np.ndarray:
+        """
+        Dense stoichiometry matrix, shape (n_reactions, n_species)
+        """
+        out = np.zeros(self.shape)
+        rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        out[rows, self.indices] = self.data
+        return out
@@ -0,0 +1,290 @@
+"""
+Binary storage of Paths, Webs, and Enumerations
+
+Each object is stored as a .json header (type, labels, units, ...) next to its arrays:
+    dense: a .npy of the energies of the species at each step, memory-mapped when loaded (see Enumeration.to_npy)
+    records: an uncompressed .npz of the molecules, reactions, and paths, rebuilt into objects when loaded
+
+Enumerations whose Paths are all chains of single-molecule reactions through the same species are stored densely,
+others (and Webs and Paths) are stored as records.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Mapping, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .enumeration import Enumeration
+from .molecule import FrozenMolecule, Molecule
+from .path import Path
+from .path_array import PathArray
+from .reaction import EReaction, Reaction
+from .web import Web
+
+VERSION = 1
+
+
+def save(item: Path | Web | Enumeration, filename: str) -> None:
+    """
+    Save a Path, Web, or Enumeration
+
+    :param item: object to save
+    :param filename: where to save, the extension is replaced with .json and .npy/.npz
+    """
+    stem = os.path.splitext(filename)[0]
+    header: dict = {"version": VERSION, "type": type(item).__name__}
+
+    if isinstance(item, Enumeration):
+        header |= {"path_names": item.path_names, "units": item.units}
+        if isinstance(item.paths, PathArray):
+            return _save_dense(item, stem, header)
+
+        paths = list(item.paths.flat)
+        if dense := _densify(paths):
+            energies, species, ne, ref_pot = dense
+            enm = Enumeration.from_energies(energies.reshape(*item.shape, -1), item.path_names, species, ne, ref_pot)
+            return _save_dense(enm, stem, header)
+    elif isinstance(item, Web):
+        header |= {"name": item.name, "units": item.units}
+        paths = list(item.paths)
+    elif isinstance(item, Path):
+        paths = [item]
+    else:
+        raise TypeError(f"Unable to save {type(item)}")
+
+    header["format"] = "records"
+    np.savez(stem + ".npz", **to_records(paths))  # type: ignore
+    with open(stem + ".json", "w") as f:
+        json.dump(header, f)
+
+
+def load(filename: str, mmap_mode: str | None = "r") -> Path | Web | Enumeration:
+    """
+    Load a Path, Web, or Enumeration saved with save (or Enumeration.to_npy)
+
+    :param filename: file that was saved, the extension is ignored
+    :param mmap_mode: mode to memory-map dense energies with (see np.load), None to read them into memory
+    """
+    stem = os.path.splitext(filename)[0]
+    with open(stem + ".json") as f:
+        header = json.load(f)
+
+    if header.get("format", "dense") == "dense":
+        return Enumeration.from_npy(stem + ".npy", mmap_mode)
+
+    with np.load(stem + ".npz") as records:
+        return rebuild(header["type"], records, header)
+
+
+def _save_dense(enm: Enumeration, stem: str, header: dict) -> None:
+    """
+    Save a dense Enumeration as a .npy of its energies
+    """
+    enm.to_npy(stem + ".npy")
+    with open(stem + ".json") as f:
+        metadata = json.load(f)
+    with open(stem + ".json", "w") as f:
+        json.dump(metadata | header | {"format": "dense"}, f)
+
+
+def _densify(paths: Sequence[Path | None]) -> tuple[np.ndarray, list[str], list[int], list[float]] | None:
+    """
+    Energies of the species at each step if every Path is a chain of single-molecule reactions through the same
+    species (and reference potentials), otherwise None
+    """
+    if not paths or any(path is None or not len(path) or np.any(path.steps) for path in paths):
+        return None
+
+    first = paths[0]
+    assert first is not None
+    species = [first[0].reactants[0].name] if first[0].reactants else []
+    ne = [reaction.ne if isinstance(reaction, EReaction) else 0 for reaction in first]
+    ref_pot = [reaction.ref_pot if isinstance(reaction, EReaction) else 0.0 for reaction in first]
+
+    energies = np.empty((len(paths), len(first) + 1))
+    for i, path in enumerate(paths):
+        if len(path) != len(first):  # type: ignore
+            return None
+        previous = None
+        for j, reaction in enumerate(path):  # type: ignore
+            if len(reaction.reactants) != 1 or len(reaction.products) != 1:
+                return None
+            (reactant,), (product,) = reaction.reactants, reaction.products
+            if previous is not None and reactant is not previous:
+                return None
+            if isinstance(reaction, EReaction):
+                if reaction.u or (reaction.ne, reaction.ref_pot) != (ne[j], ref_pot[j]) or not reaction.ne:
+                    return None
+            elif ne[j]:
+                return None
+            if i == 0 and j:
+                species.append(reactant.name)
+            elif i and reactant.name != species[j]:
+                return None
+            energies[i, j] = reactant.energy
+            previous = product
+        if i == 0:
+            species.append(previous.name)  # type: ignore
+        elif previous.name != species[-1]:  # type: ignore
+            return None
+        energies[i, -1] = previous.energy  # type: ignore
+
+    return energies, species, ne, ref_pot
+
+
+def to_records(paths: Sequence[Path | None]) -> dict[str, np.ndarray]:
+    """
+    Flatten Paths into compact arrays of their molecules, reactions, and paths
+
+    Molecules shared between reactions (or Paths) are stored once, their names are indices into a table of the
+    unique names, and only the parameters of EReactions and non-default step sizes are stored.
+
+    :param paths: Paths to flatten, None for missing paths
+    :return: {name: array} (e.g. for np.savez or pickling)
+    """
+    molecules: dict[int, int] = {}
+    names: dict[str, int] = {}
+    mol_names: list[int] = []
+    mol_energies: list[float] = []
+    frozen: list[int] = []
+    members: list[int] = []
+    sizes: list[tuple[int, int]] = []
+    electrochemical: list[tuple[int, int, float, float]] = []
+    lengths: list[int] = []
+    path_names: list[str] = []
+    steps: list[np.ndarray] = []
+
+    for path in paths:
+        if path is None:
+            lengths.append(-1)
+            path_names.append("")
+            continue
+
+        for reaction in path:
+            for molecule in (*reaction.reactants, *reaction.products):
+                if (i := molecules.setdefault(id(molecule), len(molecules))) == len(mol_energies):
+                    mol_names.append(names.setdefault(molecule.name, len(names)))
+                    mol_energies.append(molecule.energy)
+                    if isinstance(molecule, FrozenMolecule):
+                        frozen.append(i)
+                members.append(i)
+            if isinstance(reaction, EReaction):
+                electrochemical.append((len(sizes), reaction.ne, reaction.ref_pot, reaction.u))
+            sizes.append((len(reaction.reactants), len(reaction.products)))
+        lengths.append(len(path))
+        path_names.append(path.name)
+        steps.append(path.steps)
+
+    all_steps = np.concatenate([np.zeros(0), *steps])
+    e_idxs, ne, ref_pot, u = zip(*electrochemical) if electrochemical else ((), (), (), ())
+    return {
+        "species": np.array(list(names), dtype=str),
+        "mol_names": _compact(mol_names),
+        "mol_energies": np.array(mol_energies, dtype=float),
+        "frozen": _compact(frozen),
+        "members": _compact(members),
+        "sizes": _compact(sizes).reshape(-1, 2),
+        "electrochemical": _compact(e_idxs),
+        "ne": np.array(ne, dtype=int),
+        "ref_pot": np.array(ref_pot, dtype=float),
+        "u": np.array(u, dtype=float),
+        "lengths": np.array(lengths, dtype=np.int32),
+        "names": np.array(path_names, dtype=str),
+        "steps": all_steps if all_steps.any() else np.zeros(0),
+    }
+
+
+def from_records(records: Mapping[str, ArrayLike]) -> list[Path | None]:
+    """
+    Rebuild Paths from the arrays of to_records
+
+    :param records: {name: array} from to_records (e.g. an NpzFile), or lists of their values
+    """
+    arrays = {key: np.asarray(values) for key, values in records.items()}
+    species = arrays["species"].tolist()
+    frozen = np.zeros(len(arrays["mol_energies"]), dtype=bool)
+    frozen[arrays["frozen"].astype(int)] = True
+    molecules = [
+        (FrozenMolecule if is_frozen else Molecule)(species[name], energy)
+        for name, energy, is_frozen in zip(
+            arrays["mol_names"].tolist(), arrays["mol_energies"].tolist(), frozen.tolist()
+        )
+    ]
+
+    sizes = arrays["sizes"].astype(int).reshape(-1, 2)
+    electrochemistry = dict(
+        zip(
+            arrays["electrochemical"].tolist(),
+            zip(arrays["ne"].tolist(), arrays["ref_pot"].tolist(), arrays["u"].tolist()),
+        )
+    )
+    members = [molecules[i] for i in arrays["members"].tolist()]
+    bounds = np.cumsum([0, *sizes.sum(axis=1)]).tolist()
+    reactions: list[Reaction] = []
+    for i, (start, n_reactants, stop) in enumerate(zip(bounds, sizes[:, 0].tolist(), bounds[1:])):
+        reactants, products = members[start : start + n_reactants], members[start + n_reactants : stop]
+        if i in electrochemistry:
+            reactions.append(EReaction(reactants, products, *electrochemistry[i]))
+        else:
+            reactions.append(Reaction(reactants, products))
+
+    steps = arrays["steps"]
+    paths: list[Path | None] = []
+    start = 0
+    for length, name in zip(arrays["lengths"].tolist(), arrays["names"].tolist()):
+        if length < 0:
+            paths.append(None)
+            continue
+        step_sizes = steps[start : start + length] + 1 if len(steps) else None
+        paths.append(Path(reactions[start : start + length], name, step_sizes))
+        start += length
+
+    return paths
+
+
+def rebuild(type_name: str, records: Mapping[str, ArrayLike], header: dict) -> Path | Web | Enumeration:
+    """
+    Rebuild a Path, Web, or Enumeration from its records and header (see save and load)
+
+    :param type_name: name of the type to rebuild
+    :param records: {name: array} from to_records
+    :param header: name and units of a Web, or path_names and units of an Enumeration
+    """
+    paths = from_records(records)
+    if type_name == "Path":
+        return paths[0]  # type: ignore
+    if type_name == "Web":
+        return Web(paths, header["name"], header["units"])  # type: ignore
+
+    path_names = {path_name: tuple(subs) for path_name, subs in header["path_names"].items()}
+    array = np.empty(len(paths), dtype=object)
+    for i, path in enumerate(paths):  # Paths are sequences, avoid numpy unpacking them
+        array[i] = path
+    return Enumeration(array.reshape(tuple(map(len, path_names.values()))), path_names, header["units"])
+
+
+def scale_paths(paths: Sequence[Path | None], factor: float) -> list[Path | None]:
+    """
+    Copy the Paths with the energies of their Molecules scaled (e.g. to convert units) in a single multiplication of
+    their records, Molecules shared between the Paths stay shared with each other but not with the originals
+
+    :param paths: Paths to scale, None for missing paths
+    :param factor: factor to multiply the energies by
+    """
+    records = to_records(paths)
+    if len(records["electrochemical"]):
+        raise ValueError("Unable to scale EReactions, their reference and applied potentials are in V")
+    records["mol_energies"] = records["mol_energies"] * factor
+    return from_records(records)
+
+
+def _compact(values: Sequence) -> np.ndarray:
+    """
+    Array of non-negative integers with the smallest sufficient unsigned dtype
+    """
+    array = np.array(values, dtype=int)
+    return array.astype(np.min_scalar_type(array.max(initial=0)))
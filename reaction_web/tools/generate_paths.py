@@ -1,32 +1,86 @@
+import glob
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from itertools import product
-from typing import Sequence
+from typing import Iterator, Sequence
 
-import more_itertools as mit
 import numpy as np
 import pandas as pd
 from natsort import natsorted
 
-from .. import Enumeration, Molecule, Path, Reaction
+from .. import Enumeration, Molecule, Path
+from ..parallel import n_workers
 
 
 def enumeration_factory(
-    infile: str,
+    infile: str | Sequence[str],
     energy: str = "energy",
     name: str = "name",
     path_indicators: Sequence[str] | str = "r-groups",
+    dense: bool = False,
+    units: str | None = None,
+    allow_missing: bool = False,
+    lazy: bool = False,
+    chunksize: int | None = None,
+    out: str | None = None,
+    workers: int | None = None,
     **csv_kwargs,
 ) -> Enumeration:
-    paths_dict, pi_dict = read_multipath_csv(infile, energy=energy)
+    """
+    Read a csv with multiple paths and generate an Enumeration
+
+    :param infile: file to read, or a glob pattern or sequence of files (see csv_files)
+    :param energy: column to use for molecule energy
+    :param name: column to use for molecule name
+    :param path_indicators: columns that indicate paths
+    :param dense: store the energies in a dense tensor, only generating Paths on demand
+    :param units: units of the energies in the csv
+    :param allow_missing: allow combinations of path_indicators to be missing from the csv (e.g. failed
+        calculations), otherwise raise a KeyError
+    :param lazy: only generate each Path (from the columns of the csv) when it is indexed, iterated, or reduced
+    :param chunksize: read a dense Enumeration this many rows at a time (see stream_multipath_energies)
+    :param out: .npy file to memory-map the energies of a dense Enumeration to, saved with its metadata so that
+        it can be reloaded with Enumeration.from_npy
+    :param workers: number of processes to parse multiple files with, None for all available cores
+    :param csv_kwargs: parameters for csv parsing
+    """
+    if dense and (chunksize or out):
+        energies, species, pi_dict = stream_multipath_energies(
+            infile, energy, name, path_indicators, allow_missing, chunksize or 2**20, out, **csv_kwargs
+        )
+        enumeration = Enumeration.from_energies(energies, pi_dict, species, units=units)
+        if out:
+            enumeration.to_npy(out)
+        return enumeration
+
+    if dense:
+        energies, species, pi_dict = read_multipath_energies(
+            infile, energy, name, path_indicators, allow_missing, workers, **csv_kwargs
+        )
+        return Enumeration.from_energies(energies, pi_dict, species, units=units)
 
-    shape = tuple(len(vals) for vals in pi_dict.values())
-    paths = np.zeros(shape, dtype=object)
-    for values, idxs in zip(
-        product(*pi_dict.values()),
-        product(*map(range, shape)),
-    ):
-        paths[idxs] = paths_dict[values]
+    if lazy:
+        df, pi_dict = read_multipath_df(infile, energy, name, path_indicators, workers, **csv_kwargs)
+        bounds = path_bounds(df, list(pi_dict))
+        if not allow_missing and len(bounds) != np.prod(list(map(len, pi_dict.values()))):
+            missing = next(values for values in product(*pi_dict.values()) if values not in bounds)
+            raise KeyError(f"Missing path {missing}")
+        function = partial(_generate_path, df["name"].tolist(), df["energy"].tolist(), df["step"].tolist(), bounds)
+        return Enumeration.from_function(function, pi_dict, units=units)
 
-    return Enumeration(paths, pi_dict)
+    paths_dict, pi_dict = read_multipath_csv(infile, energy, name, path_indicators, workers, **csv_kwargs)
+
+    # only the paths present are placed, missing paths are left as None
+    indexers = [{label: i for i, label in enumerate(labels)} for labels in pi_dict.values()]
+    paths = np.full(tuple(map(len, indexers)), None, dtype=object)
+    for values, path in paths_dict.items():
+        paths[tuple(indexer[value] for indexer, value in zip(indexers, values))] = path
+
+    if not allow_missing and len(paths_dict) != paths.size:
+        missing = next(values for values in product(*pi_dict.values()) if values not in paths_dict)
+        raise KeyError(f"Missing path {missing}")
+
+    return Enumeration(paths, pi_dict, units)
 
 
 def read_csv(infile: str, energy: str = "energy", name: str = "name", **csv_kwargs) -> list[Molecule]:
@@ -44,32 +98,310 @@ def read_csv(infile: str, energy: str = "energy", name: str = "name", **csv_kwar
     assert isinstance(df, pd.DataFrame)
     df = df.convert_dtypes(infer_objects=True)
 
-    return [Molecule(data[name], data[energy]) for _, data in df.iterrows()]
+    # pull the columns out as lists rather than constructing a Series for every row
+    return [Molecule(mol_name, mol_energy) for mol_name, mol_energy in zip(df[name].tolist(), df[energy].tolist())]
 
 
 def read_multipath_csv(
-    infile: str,
+    infile: str | Sequence[str],
     energy: str = "energy",
     name: str = "name",
     path_indicators: Sequence[str] | str = "r-groups",
+    workers: int | None = None,
     **csv_kwargs,
 ) -> tuple[dict[tuple[str, ...], Path], dict[str, tuple[str, ...]]]:
     """
-    Read molecule data in a CSV and convert into paths
-
-    Note:
-        Only utilizes step data to sort, no combination yet available
+    Read molecule data in a CSV and convert into paths, molecules on the same step of a path are combined into
+    multi-molecule Reactions
 
-    :param infile: file to read
+    :param infile: file to read, or a glob pattern or sequence of files (see csv_files)
     :param energy: column to use for molecule energy
     :param name: column to use for molecule name
     :param path_indicators: columns that indicate paths
+    :param workers: number of processes to parse multiple files with, None for all available cores
     :param csv_kwargs: parameters for csv parsing
     :return: Paths generated from data and the unique values seen in each path_indicator column
     """
+    df, pi_dict = read_multipath_df(infile, energy, name, path_indicators, workers, **csv_kwargs)
+
+    return read_paths(df, list(pi_dict)), pi_dict
+
+
+def read_multipath_energies(
+    infile: str | Sequence[str],
+    energy: str = "energy",
+    name: str = "name",
+    path_indicators: Sequence[str] | str = "r-groups",
+    allow_missing: bool = False,
+    workers: int | None = None,
+    **csv_kwargs,
+) -> tuple[np.ndarray, tuple[str, ...], dict[str, tuple[str, ...]]]:
+    """
+    Read molecule data in a CSV into a dense energy tensor
+
+    Each path_indicator and the step are factorized into integer codes, the energies of the molecules on the same
+    step of a path are summed (np.add.reduceat over the sorted rows), and the sums are scattered into the tensor at
+    their computed indices in a single pass. The species at each step are named by joining the sorted names of its
+    molecules (e.g. "*OH + H2O"), every path must have the same molecules on each step. Paths missing any steps are
+    missing (NaN).
+
+    :param infile: file to read, or a glob pattern or sequence of files (see csv_files)
+    :param energy: column to use for molecule energy
+    :param name: column to use for molecule name
+    :param path_indicators: columns that indicate paths
+    :param allow_missing: fill missing paths with NaN, otherwise raise a KeyError
+    :param workers: number of processes to parse multiple files with, None for all available cores
+    :param csv_kwargs: parameters for csv parsing
+    :return: energies with shape (*path_indicator_shape, n_steps), the species at each step,
+        and the unique values seen in each path_indicator column
+    """
+    df, pi_dict = read_multipath_df(infile, energy, name, path_indicators, workers, **csv_kwargs)
+    shape = tuple(map(len, pi_dict.values()))
+
+    # the frame is sorted, so factorizing in order of appearance matches the order of the labels in pi_dict
+    codes = [pd.factorize(df[indicator])[0] for indicator in pi_dict]
+    step_codes, steps = pd.factorize(df["step"], sort=True)
+    cells = np.ravel_multi_index(codes, shape) if len(df) else np.zeros(0, dtype=int)
+
+    # the rows are sorted by path and step, so the molecules on each step of a path are contiguous
+    keys = cells * len(steps) + step_codes
+    starts = np.flatnonzero(np.diff(keys, prepend=-1)) if len(df) else np.zeros(0, dtype=int)
+    stops = [*starts[1:].tolist(), len(df)]
+
+    # the molecules on each step of the first path
+    names = df["name"].astype(str).tolist()
+    first_groups = np.unique(step_codes[starts], return_index=True)[1].tolist()
+    compositions = [tuple(sorted(names[starts[i] : stops[i]])) for i in first_groups]
+    species = tuple(" + ".join(composition) for composition in compositions)
+
+    # sum the molecules on each step of a path and scatter the sums into the tensor in one vectorized assignment
+    energies = np.full(int(np.prod(shape)) * len(steps), np.nan)
+    added = _add_molecules(
+        energies, keys, step_codes, names, df["energy"].to_numpy(dtype=float), compositions, pi_dict, steps
+    )
+    _check_compositions(added, compositions, pi_dict, steps)
+    energies = energies.reshape(*shape, len(steps))
+
+    if not allow_missing:
+        incomplete = np.flatnonzero(np.isnan(energies).any(axis=-1))
+        if len(incomplete):
+            raise KeyError(f"Missing path {_cell_labels(pi_dict, incomplete[0])} ({len(incomplete)} incomplete paths)")
+
+    return energies, species, pi_dict
+
+
+def stream_multipath_energies(
+    infile: str | Sequence[str],
+    energy: str = "energy",
+    name: str = "name",
+    path_indicators: Sequence[str] | str = "r-groups",
+    allow_missing: bool = False,
+    chunksize: int = 2**20,
+    out: str | None = None,
+    **csv_kwargs,
+) -> tuple[np.ndarray, tuple[str, ...], dict[str, tuple[str, ...]]]:
+    """
+    Read molecule data in a CSV into a dense energy tensor one chunk of rows at a time (see read_multipath_energies)
+
+    The csv is read twice: first only the path_indicator, step, and name columns to collect the labels, then the
+    energies of each chunk are summed by path and step and added into the tensor. The peak memory is bounded by the
+    chunk size and the tensor, which can be memory-mapped to a .npy file for csvs larger than memory.
+
+    Unlike read_multipath_energies, the labels of each path_indicator are sorted (the same order for csvs with
+    every path). The molecules on each step of a path are tracked as a bitmask (an additional unsigned integer per
+    energy, usually one byte) to check them against the species of the step. Multiple files are read one after
+    another.
+
+    :param infile: file to read, or a glob pattern or sequence of files (see csv_files)
+    :param energy: column to use for molecule energy
+    :param name: column to use for molecule name
+    :param path_indicators: columns that indicate paths
+    :param allow_missing: fill missing paths with NaN, otherwise raise a KeyError
+    :param chunksize: number of rows to read at a time
+    :param out: .npy file to memory-map the tensor to, otherwise it is kept in memory
+    :param csv_kwargs: parameters for csv parsing
+    :return: energies with shape (*path_indicator_shape, n_steps), the species at each step,
+        and the unique values seen in each path_indicator column
+    """
     csv_kwargs = {"skipinitialspace": True} | csv_kwargs
-    df = pd.read_csv(infile, **csv_kwargs)  # type: ignore
-    assert isinstance(df, pd.DataFrame)
+    files = csv_files(infile)
+    columns = pd.read_csv(files[0], nrows=0, **csv_kwargs).columns  # type: ignore
+    assert energy in columns
+    assert name in columns
+    if path_indicators == "r-groups":
+        path_indicators = find_r_groups(pd.DataFrame(columns=columns))
+    else:
+        for indicator in path_indicators:
+            assert indicator in columns
+    path_indicators = list(path_indicators)
+
+    labels: list[set] = [set() for _ in path_indicators]
+    step_names: dict = {}
+    first_cells = None  # path_indicators and step of the first row of each step
+    for chunk in _read_chunks(files, [*path_indicators, "step", name], chunksize, **csv_kwargs):
+        for seen, indicator in zip(labels, path_indicators):
+            seen.update(chunk[indicator].unique().tolist())
+
+        # the names of all molecules on each step of the path of its first row
+        firsts = chunk.drop_duplicates("step")
+        firsts = firsts[~firsts["step"].isin(step_names)][[*path_indicators, "step"]]
+        step_names |= {step: [] for step in firsts["step"].tolist()}
+        first_cells = firsts if first_cells is None else pd.concat([first_cells, firsts])
+        matches = chunk.merge(first_cells, on=[*path_indicators, "step"])
+        for step, mol_name in zip(matches["step"].tolist(), matches[name].tolist()):
+            step_names[step].append(str(mol_name))
+
+    pi_dict = {indicator: tuple(sorted(seen)) for indicator, seen in zip(path_indicators, labels)}
+    steps = sorted(step_names)
+    compositions = [tuple(sorted(step_names[step])) for step in steps]
+    species = tuple(" + ".join(composition) for composition in compositions)
+    shape = (*map(len, pi_dict.values()), len(steps))
+
+    if out is None:
+        energies = np.full(shape, np.nan)
+    else:
+        energies = np.lib.format.open_memmap(out, mode="w+", dtype=float, shape=shape)
+        energies[...] = np.nan
+    flat = energies.reshape(-1)
+
+    added = None
+    for chunk in _read_chunks(files, [*path_indicators, "step", name, energy], chunksize, **csv_kwargs):
+        codes = [pd.Categorical(chunk[indicator], categories=pi_dict[indicator]).codes for indicator in pi_dict]
+        step_codes = pd.Categorical(chunk["step"], categories=steps).codes
+        keys = np.ravel_multi_index((*codes, step_codes), shape)
+
+        # the molecules on the same step of a path may be split across chunks
+        names = chunk[name].astype(str).tolist()
+        added = _add_molecules(
+            flat, keys, step_codes, names, chunk[energy].to_numpy(dtype=float), compositions, pi_dict, steps, added
+        )
+    if added is not None:
+        _check_compositions(added, compositions, pi_dict, steps)
+
+    if isinstance(energies, np.memmap):
+        energies.flush()
+
+    if not allow_missing:
+        incomplete = np.flatnonzero(np.isnan(energies).any(axis=-1))
+        if len(incomplete):
+            raise KeyError(f"Missing path {_cell_labels(pi_dict, incomplete[0])} ({len(incomplete)} incomplete paths)")
+
+    return energies, species, pi_dict
+
+
+def _add_molecules(
+    flat: np.ndarray,
+    keys: np.ndarray,
+    step_codes: np.ndarray,
+    names: list[str],
+    energies: np.ndarray,
+    compositions: Sequence[tuple[str, ...]],
+    pi_dict: dict[str, tuple[str, ...]],
+    steps: Sequence,
+    added: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Add the energies of molecules into the flattened tensor, summing the molecules on the same step of a path
+        (np.add.reduceat over the rows sorted by their flat index)
+
+    Each molecule must be in the composition of its step, and may only be added once to each path.
+
+    :param flat: flattened tensor, NaN where nothing has been added
+    :param keys: flat index of each molecule
+    :param step_codes: index of the step of each molecule
+    :param names: name of each molecule
+    :param energies: energy of each molecule
+    :param compositions: sorted names of the molecules on each step
+    :param added: bitmask of the molecules of the composition already added at each flat index
+    :return: updated bitmask of the added molecules
+    """
+    if max(map(len, compositions), default=0) > 62:
+        raise ValueError("Unable to combine more than 62 molecules on a step")
+    if added is None:
+        added = np.zeros(len(flat), dtype=np.min_scalar_type((1 << max(map(len, compositions), default=0)) - 1))
+
+    # position of each molecule in the composition of its step, unknown names (code -1) index the last column
+    mol_names = sorted({mol_name for composition in compositions for mol_name in composition})
+    table = np.full((len(compositions), len(mol_names) + 1), -1, dtype=np.int64)
+    for step, composition in enumerate(compositions):
+        table[step, [mol_names.index(mol_name) for mol_name in composition]] = np.arange(len(composition))
+    positions = table[step_codes, pd.Index(mol_names).get_indexer(names)]
+    if len(unexpected := np.flatnonzero(positions < 0)):
+        i = int(unexpected[0])
+        cell, step = divmod(int(keys[i]), len(steps))
+        raise ValueError(
+            f"{len(unexpected)} molecules differ from the species of their step, e.g. {names[i]} on step "
+            f"{steps[step]} of {_cell_labels(pi_dict, cell)}, expected {' + '.join(compositions[step])}"
+        )
+
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    starts = np.flatnonzero(np.diff(keys, prepend=-1))
+    group_keys = keys[starts]
+    bits = np.left_shift(1, positions[order])
+    group_bits = np.bitwise_or.reduceat(bits, starts)
+
+    # a molecule added twice sets the same bit twice, in this chunk or in a previous one
+    duplicated = (np.add.reduceat(bits, starts) != group_bits) | (added[group_keys] & group_bits != 0)
+    if len(duplicates := np.flatnonzero(duplicated)):
+        cell, step = divmod(int(group_keys[duplicates[0]]), len(steps))
+        raise ValueError(
+            f"{len(duplicates)} duplicated (path, step, name) rows, e.g. {_cell_labels(pi_dict, cell)} step "
+            f"{steps[step]}"
+        )
+    added[group_keys] |= group_bits.astype(added.dtype)
+
+    sums = np.add.reduceat(energies[order], starts)
+    previous = flat[group_keys]
+    flat[group_keys] = np.where(np.isnan(previous), sums, previous + sums)
+    return added
+
+
+def _check_compositions(
+    added: np.ndarray, compositions: Sequence[tuple[str, ...]], pi_dict: dict[str, tuple[str, ...]], steps: Sequence
+) -> None:
+    """
+    Check that every step of a path that is present has all of the molecules of its composition (see _add_molecules)
+    """
+    complete = np.array([(1 << len(composition)) - 1 for composition in compositions], dtype=added.dtype)
+    added = added.reshape(-1, len(steps))
+    if len(partial := np.flatnonzero(((added != 0) & (added != complete)).ravel())):
+        cell, step = divmod(int(partial[0]), len(steps))
+        raise ValueError(
+            f"{len(partial)} (path, step) pairs are missing molecules of the species of their step, e.g. "
+            f"{_cell_labels(pi_dict, cell)} step {steps[step]}, expected {' + '.join(compositions[step])}"
+        )
+
+
+def _cell_labels(pi_dict: dict[str, tuple[str, ...]], cell: int) -> tuple[str, ...]:
+    """
+    Labels of a cell from its flat index
+    """
+    idxs = np.unravel_index(cell, tuple(map(len, pi_dict.values())))
+    return tuple(labels[i] for labels, i in zip(pi_dict.values(), idxs))
+
+
+def read_multipath_df(
+    infile: str | Sequence[str],
+    energy: str = "energy",
+    name: str = "name",
+    path_indicators: Sequence[str] | str = "r-groups",
+    workers: int | None = None,
+    **csv_kwargs,
+) -> tuple[pd.DataFrame, dict[str, tuple[str, ...]]]:
+    """
+    Read molecule data in a CSV, sorted by path and step
+
+    :param infile: file to read, or a glob pattern or sequence of files (see csv_files)
+    :param energy: column to use for molecule energy
+    :param name: column to use for molecule name
+    :param path_indicators: columns that indicate paths
+    :param workers: number of processes to parse multiple files with, None for all available cores
+    :param csv_kwargs: parameters for csv parsing
+    :return: DataFrame with standardized column names and the unique values seen in each path_indicator column
+    """
+    csv_kwargs = {"skipinitialspace": True} | csv_kwargs
+    df = _read_csvs(csv_files(infile), workers, **csv_kwargs)
     assert energy in df.columns
     assert name in df.columns
     df.rename(columns={energy: "energy", name: "name"}, inplace=True)
@@ -80,37 +412,121 @@ def read_multipath_csv(
     else:
         for indicator in path_indicators:
             assert indicator in df.columns
-    df.sort_values(list(path_indicators) + ["step"], inplace=True)
+    # stable, so that molecules on the same step stay in the order of the csv
+    df.sort_values(list(path_indicators) + ["step"], inplace=True, kind="stable")
+
+    duplicated = df.duplicated([*path_indicators, "step", "name"])
+    if duplicated.any():
+        row = df[duplicated].iloc[0]
+        raise ValueError(
+            f"{duplicated.sum()} duplicated (path, step, name) rows, e.g. "
+            f"{tuple(row[indicator] for indicator in path_indicators)} step {row['step']} {row['name']}"
+        )
+
+    pi_dict = {indicator: tuple(df[indicator].unique().tolist()) for indicator in path_indicators}
+
+    return df, pi_dict
+
+
+def csv_files(infile: str | Sequence[str]) -> list[str]:
+    """
+    Files to read from a file, a glob pattern (natsorted), or a sequence of files and glob patterns
+
+    The order of the files does not matter, the rows are sorted by path and step after reading.
+    """
+    files = []
+    for pattern in [infile] if isinstance(infile, str) else infile:
+        if not glob.has_magic(pattern):
+            files.append(pattern)
+        elif matches := natsorted(glob.glob(pattern)):
+            files.extend(matches)
+        else:
+            raise FileNotFoundError(f"No files match {pattern}")
+    if not files:
+        raise ValueError("No files to read")
+    return files
+
+
+def _read_csvs(files: Sequence[str], workers: int | None = None, **csv_kwargs) -> pd.DataFrame:
+    """
+    Read csvs into a single DataFrame, parsing the files in parallel processes
+    """
+    workers = min(n_workers(workers), len(files))
+    if workers == 1:
+        frames = [pd.read_csv(file, **csv_kwargs) for file in files]
+    else:
+        with ProcessPoolExecutor(workers) as executor:
+            frames = list(executor.map(partial(pd.read_csv, **csv_kwargs), files))
+    return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]  # type: ignore
 
-    paths = read_paths(df, path_indicators)
-    pi_dict = {indicator: tuple(df[indicator].unique()) for indicator in path_indicators}
 
-    return paths, pi_dict
+def _read_chunks(files: Sequence[str], columns: list[str], chunksize: int, **csv_kwargs) -> Iterator[pd.DataFrame]:
+    """
+    Read the columns of csvs one chunk of rows at a time
+    """
+    for file in files:
+        yield from pd.read_csv(file, usecols=columns, chunksize=chunksize, **csv_kwargs)  # type: ignore
 
 
 def read_paths(df: pd.DataFrame, path_indicators: Sequence[str]) -> dict[tuple[str, ...], Path]:
     """
-    Read data into separate paths, named by the group
+    Read data into separate paths, named by the group, molecules on the same step are combined (see Path.from_steps)
     """
+    names, energies, steps = df["name"].tolist(), df["energy"].tolist(), df["step"].tolist()
     return {
-        names: pathify(path_data, str(names))  # keep open
-        for names, path_data in df.groupby(list(path_indicators))  # keep open
+        key: Path.from_steps(names[start:stop], energies[start:stop], steps[start:stop], str(key))
+        for key, (start, stop) in path_bounds(df, path_indicators).items()
     }
 
 
+def path_bounds(df: pd.DataFrame, path_indicators: Sequence[str]) -> dict[tuple[str, ...], tuple[int, int]]:
+    """
+    Rows of each path in a DataFrame sorted by the path_indicators (see read_multipath_df)
+
+    The paths are contiguous, so they are split at the rows where any of the path_indicators change instead of
+    building a DataFrame for each group.
+
+    :return: {values of the path_indicators: (start, stop)}
+    """
+    changed = np.zeros(max(len(df) - 1, 0), dtype=bool)
+    for indicator in path_indicators:
+        column = df[indicator].to_numpy()
+        changed |= column[1:] != column[:-1]
+    bounds = [0, *(np.flatnonzero(changed) + 1).tolist(), len(df)] if len(df) else [0]
+
+    keys = list(zip(*(df[indicator].tolist() for indicator in path_indicators)))
+    return {keys[start]: (start, stop) for start, stop in zip(bounds, bounds[1:])}
+
+
+def _generate_path(
+    names: list[str],
+    energies: list[float],
+    steps: list,
+    bounds: dict[tuple[str, ...], tuple[int, int]],
+    labels: tuple[str, ...],
+) -> Path | None:
+    """
+    Generate the Path of the labels from the columns of a csv, None if it is missing
+    """
+    if labels not in bounds:
+        return None
+    start, stop = bounds[labels]
+    return Path.from_steps(names[start:stop], energies[start:stop], steps[start:stop], str(labels))
+
+
 def pathify(data: pd.DataFrame, name: str = "") -> Path:
     """
     Reads DataFrame and converts to a Path
 
     Notes:
         Assumes all data is sequential and part of the same path
-        Does not currently utilize step data to combine molecules on the same step
+        Consecutive molecules on the same step are combined (see Path.from_steps)
     :param data: Path data
     :param name: Name for the Path
     """
-    molecules = [Molecule(name, energy) for name, energy in zip(data["name"], data["energy"])]
-    reactions = [Reaction([reactant], [product]) for reactant, product in mit.windowed(molecules, 2)]  # type:ignore
-    return Path(reactions, name)
+    if "step" not in data.columns:
+        return Path.from_energies(data["name"].tolist(), data["energy"].tolist(), name)
+    return Path.from_steps(data["name"].tolist(), data["energy"].tolist(), data["step"].tolist(), name)
 
 
 def find_r_groups(data: pd.DataFrame) -> list[str]:
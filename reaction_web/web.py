@@ -1,17 +1,38 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from itertools import chain
 from typing import Iterator, Sequence
 
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .energetic_span import energetic_span, turnover_frequency
+from .molecule import _updated, energy_version
 from .path import Path
+from .stoichiometry import StoichiometryMatrix
+from .tools.helper import energy_conversion
 
 
 @dataclass
 class Web:
     """
     A collection of reaction paths
+
+    The energy matrices are cached (see molecule.energy_version).
+
+    :param paths: Paths in the Web
+    :param name: name of the Web
+    :param units: units of the energies (see tools.helper.energy_conversions), None if unspecified
     """
 
     paths: Sequence[Path]
     name: str = ""
+    units: str | None = None
+    _energies: np.ma.MaskedArray = field(init=False, repr=False, compare=False)
+    _relative_energies: np.ma.MaskedArray = field(init=False, repr=False, compare=False)
+    _cache_key: tuple = field(default=(), init=False, repr=False, compare=False)
+    _shared: tuple = field(default=(), init=False, repr=False, compare=False)
 
     def __iter__(self) -> Iterator[Path]:
         """
@@ -31,6 +52,15 @@ class Web:
     def __str__(self) -> str:
         return f"# {self.name}\n" + "\n\n".join(f"{path.name}:\n{path}" for path in self)
 
+    def __reduce__(self) -> tuple:
+        """
+        Pickle as flat arrays of the energies, name indices, and step sizes (see storage.to_records) instead of
+        nested objects, Molecules shared between Paths stay shared
+        """
+        from .storage import rebuild, to_records
+
+        return rebuild, ("Web", to_records(self.paths), {"name": self.name, "units": self.units})
+
     def __getitem__(self, idx: int) -> Path:
         return self.paths[idx]
 
@@ -38,20 +68,152 @@ class Web:
         """
         Index and value of the minimum achieved on the web path
         """
-        i, (j, val) = min(
-            enumerate(path.min() for path in self),
-            key=lambda x: x[1][1],
-        )
-
-        return (i, j), val
+        relative_energies = self.relative_energies
+        i, j = np.unravel_index(relative_energies.argmin(), relative_energies.shape)
+        return (int(i), int(j)), relative_energies[i, j]
 
     def max(self) -> tuple[tuple[int, int], float]:
         """
         Index and value of the maximimum achieved on the web path
         """
-        i, (j, val) = max(
-            enumerate(path.max() for path in self),
-            key=lambda x: x[1][1],
-        )
+        relative_energies = self.relative_energies
+        i, j = np.unravel_index(relative_energies.argmax(), relative_energies.shape)
+        return (int(i), int(j)), relative_energies[i, j]
+
+    @property
+    def energies(self) -> np.ma.MaskedArray:
+        """
+        Energies of the reactions in each path, padded to the longest path and masked past the end of each path
+
+        :return: masked array with shape (n_paths, max_len)
+        """
+        self._update_energies()
+        return self._energies
+
+    @property
+    def relative_energies(self) -> np.ma.MaskedArray:
+        """
+        Cumulative energy along each path, padded to the longest path and masked past the end of each path
+
+        :return: masked array with shape (n_paths, max_len + 1)
+        """
+        self._update_energies()
+        return self._relative_energies
+
+    def _invalidate_energies(self) -> None:
+        """
+        Force the energy matrices to be recomputed on next access
+        """
+        self._cache_key = ()
+
+    def _update_energies(self) -> None:
+        """
+        Recompute the cached energy matrices if any energy or path has changed since they were last computed
+        """
+        key = (energy_version(), *map(id, self.paths))
+        if self._cache_key == key and not (self._shared and _updated(self._shared)):
+            return
+
+        lengths = np.fromiter(map(len, self.paths), dtype=int, count=len(self.paths))
+        max_len = lengths.max(initial=0)
+        mask = np.arange(max_len) >= lengths[:, None]
+
+        energies = np.zeros((len(self.paths), max_len))
+        energies[~mask] = np.concatenate([path.energies for path in self.paths] or [np.zeros(0)])
+
+        relative_energies = np.zeros((len(self.paths), max_len + 1))
+        np.cumsum(energies, axis=1, out=relative_energies[:, 1:])
+
+        self._energies = np.ma.MaskedArray(energies, mask)
+        self._relative_energies = np.ma.MaskedArray(relative_energies, np.arange(max_len + 1) > lengths[:, None])
+        self._energies.flags.writeable = False
+        self._relative_energies.flags.writeable = False
+        self._cache_key = key
+        self._shared = tuple(shared for path in self.paths for shared in path._shared)
+
+    def potential_energies(self, us: ArrayLike) -> list[np.ndarray]:
+        """
+        Energies of the reactions in each path at each of a series of applied potentials
+
+        :param us: applied potentials, shape (n_u,)
+        :return: energies with shape (n_u, n_reactions) for each path
+        """
+        return [path.potential_energies(us) for path in self]
+
+    def limiting_potential(self) -> np.ndarray:
+        """
+        Lowest applied potential at which every reaction in each path is downhill, highest for reductive paths (see
+            electrochemistry.limiting_potential), nan if unattainable
+        """
+        return np.array([path.limiting_potential() for path in self])
+
+    def energetic_span(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Energetic span of each path as a catalytic cycle (see energetic_span.energetic_span)
+
+        :return: span, and the indices of the TDI and TDTS in the relative energies of each path
+        """
+        return energetic_span(self.relative_energies)
+
+    def turnover_frequency(self, temperature: float = 298.15, units: str | None = None) -> np.ndarray:
+        """
+        Apparent turnover frequency (1/s) of each path as a catalytic cycle from its energetic span
+
+        :param temperature: temperature (K)
+        :param units: units of the energies, defaults to the units of the Web (or eV if unspecified)
+        """
+        return turnover_frequency(self.energetic_span()[0], temperature, units or self.units or "eV")
+
+    def stoichiometry(self) -> StoichiometryMatrix:
+        """
+        Compile the reactions of all paths (in order) into a stoichiometry matrix for batched energy evaluation
+
+        The reaction energies of each path can be recovered with np.split(S @ energies, web.splits).
+        """
+        return StoichiometryMatrix.from_reactions(chain.from_iterable(self))
+
+    @property
+    def splits(self) -> np.ndarray:
+        """
+        Indices separating the reactions of each path in the concatenated reactions (see stoichiometry)
+        """
+        return np.cumsum([len(path) for path in self])[:-1]
+
+    def convert(self, units: str) -> Web:
+        """
+        Copy of the Web with the energies converted to the given units
+
+        The Molecules are copied rather than converted in place, as they may be shared with other Webs.
+
+        :param units: units to convert to (see tools.helper.energy_conversions)
+        """
+        from .storage import scale_paths
+
+        if self.units is None:
+            raise ValueError("Unable to convert a Web without units, set Web.units first")
+
+        return Web(scale_paths(self.paths, energy_conversion(self.units, units)), self.name, units)  # type: ignore
+
+    def save(self, filename: str) -> None:
+        """
+        Save to a binary .json + .npz pair, Molecules shared between Paths are stored once (see storage)
+
+        :param filename: where to save, the extension is replaced
+        """
+        from .storage import save
+
+        save(self, filename)
+
+    @classmethod
+    def load(cls, filename: str) -> Web:
+        """
+        Load a Web saved with Web.save
+
+        :param filename: file that was saved, the extension is ignored
+        """
+        from .storage import load
 
-        return (i, j), val
+        web = load(filename)
+        if not isinstance(web, cls):
+            raise TypeError(f"Expected {filename} to contain a Web, got {type(web).__name__}")
+        return web
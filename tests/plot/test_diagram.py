@@ -59,3 +59,15 @@ def test_plot_web(web):
 def test_plot_enumeration(enm):
     plot_enumeration(enm, title="Enumeration Plot")
     plt.close("all")
+
+
+def test_plot_units(web, enm):
+    assert plot_web(web)[1].get_ylabel() == "Energy"
+
+    web.units = "kcal/mol"
+    assert plot_web(web)[1].get_ylabel() == "Energy (kcal/mol)"
+    assert plot_web(web, style="subplots")[1].flat[0].get_ylabel() == "Energy (kcal/mol)"
+
+    enm.units = "eV"
+    assert plot_enumeration(enm)[1].get_ylabel() == "Energy (eV)"
+    plt.close("all")
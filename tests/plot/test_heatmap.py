@@ -1,4 +1,5 @@
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.pyplot import subplots
 from pytest import fixture, mark, raises
 
@@ -6,6 +7,11 @@ from reaction_web import EReaction, Molecule, Path, Reaction, Web
 from reaction_web.plot.heatmap import (
     gen_subplots,
     heatmap_enumeration_function,
+    heatmap_enumeration_max,
+    heatmap_enumeration_min,
+    heatmap_enumeration_relative_step,
+    heatmap_enumeration_step,
+    heatmap_enumeration_values,
     heatmap_path,
     heatmap_web,
     heatmap_webs_function,
@@ -61,7 +67,8 @@ def test_heatmap_web(web):
     web2 = Web([path2, path3])
 
     heatmap_web(web2, title="Test", showvals=True)
-    plt.close()
+    heatmap_web(web, showvals=True)
+    plt.close("all")
 
 
 def test_heatmap_webs_function(web_list):
@@ -74,7 +81,8 @@ def test_heatmap_webs_function(web_list):
 
 def test_heatmap_webs_max(web_list):
     heatmap_webs_max(web_list, xtickslabels=[1, 2, 3], ytickslabels=["A", "B"], showvals=True)
-    plt.close()
+    heatmap_webs_step(web_list, 3, showvals=True)
+    plt.close("all")
 
     web3 = Web(list(web_list[0])[:2])
     with raises(ValueError):
@@ -134,8 +142,49 @@ def test_gen_subplots_labels(shape, labels):
     plt.close()
 
 
-def test_heatmap_enumeration_function():
-    enm = enumeration_factory("tests/data/enum_2_3_2_3_4.csv")
+@mark.parametrize("dense", [False, True])
+def test_heatmap_enumeration_function(dense):
+    enm = enumeration_factory("tests/data/enum_2_3_2_3_4.csv", dense=dense)
     fig, ax = heatmap_enumeration_function(enm, lambda path: path.max()[1], showvals=True)
 
     plt.close()
+
+
+@mark.parametrize("dense", [False, True])
+def test_heatmap_enumeration_vectorized(dense):
+    enm = enumeration_factory("tests/data/enum_2_3_2_3_4.csv", dense=dense)
+    heatmap_enumeration_max(enm, showvals=True)
+    heatmap_enumeration_min(enm)
+    heatmap_enumeration_step(enm, 1)
+    heatmap_enumeration_relative_step(enm, 2)
+    plt.close("all")
+
+    with raises(ValueError):
+        heatmap_enumeration_values(enm, enm.max()[0])
+
+
+def test_heatmap_units(web_list):
+    fig, _ = heatmap_web(web_list[0])
+    assert len(fig.axes) == 1
+
+    for web in web_list:
+        web.units = "kJ/mol"
+    fig, _ = heatmap_web(web_list[0])
+    assert fig.axes[-1].get_ylabel() == "Energy (kJ/mol)"
+    fig, _ = heatmap_webs_max(web_list)
+    assert fig.axes[-1].get_ylabel() == "Energy (kJ/mol)"
+
+    enm = enumeration_factory("tests/data/enum_2_3_2_3_4.csv", dense=True, units="eV")
+    fig, _ = heatmap_enumeration_max(enm)
+    assert fig.axes[-1].get_ylabel() == "Energy (eV)"
+    plt.close("all")
+
+
+def test_heatmap_enumeration_missing():
+    enm = enumeration_factory("tests/data/enum_2_3_2_3_4.csv", dense=True)
+    enm.paths.energies[0, 0, 0, 0, 0] = np.nan
+    fig, axes = heatmap_enumeration_max(enm, showvals=True)
+    data = axes.flat[0].images[0].get_array()
+    assert np.ma.getmaskarray(np.ma.masked_invalid(data))[0, 0]
+    assert "nan" not in {text.get_text() for text in axes.flat[0].texts}
+    plt.close("all")
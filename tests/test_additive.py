@@ -0,0 +1,83 @@
+from itertools import product
+
+import numpy as np
+from pytest import approx, raises
+
+from reaction_web import AdditiveEnergies, AdditiveModel
+
+PATH_NAMES = {"r1": ("H", "F", "Cl"), "r2": ("H", "C", "N", "O"), "r3": ("A", "B")}
+
+
+def make_energies(interaction=0.0):
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=3)
+    contributions = [rng.normal(size=(n, 3)) for n in map(len, PATH_NAMES.values())]
+    energies = np.array(AdditiveEnergies(base, contributions))
+    energies[..., 1] += interaction * np.outer(np.arange(3), np.arange(4))[..., None]
+    return energies
+
+
+def sample(energies, n, seed=1):
+    cells = list(product(*PATH_NAMES.values()))
+    idxs = list(product(*map(range, energies.shape[:-1])))
+    chosen = np.random.default_rng(seed).choice(len(cells), n, replace=False)
+    return {cells[i]: energies[idxs[i]] for i in chosen}
+
+
+def test_fit():
+    energies = make_energies()
+    observed = sample(energies, 12)
+    model = AdditiveModel.fit(PATH_NAMES, observed)
+
+    assert repr(model) == "<AdditiveModel ('r1', 'r2', 'r3') (3, 4, 2) (12 observed)>"
+    assert isinstance(model.energies, AdditiveEnergies)
+    assert np.array(model.energies) == approx(energies)
+    assert model.rmse == approx(0, abs=1e-10)
+    assert model.predict([("Cl", "O", "B")]) == approx(energies[2, 3, 1][None])
+    assert model.residuals.shape == (12, 3)
+    assert model.leverage.shape == (12,)
+
+    enm = model.enumeration(["X", "Y", "Z"], units="eV", keep_observed=False)
+    assert enm.units == "eV"
+    assert enm.max() == approx(np.max(energies - energies[..., :1], axis=-1))
+
+
+def test_fit_pairwise():
+    energies = make_energies(interaction=0.5)
+    observed = sample(energies, 20)
+
+    additive = AdditiveModel.fit(PATH_NAMES, observed)
+    assert additive.rmse[1] > 0.1
+    assert additive.loo_rmse[1] > additive.rmse[1]
+
+    pairwise = AdditiveModel.fit(PATH_NAMES, observed, pairwise=[("r1", "r2")])
+    assert list(pairwise.pairwise) == [(0, 1)]
+    assert pairwise.pairwise[0, 1].shape == (3, 4, 3)
+    assert pairwise.rmse == approx(0, abs=1e-5)
+    assert isinstance(pairwise.energies, np.ndarray)
+
+    # pairs that were observed are predicted
+    observed_pairs = {cell[:2] for cell in observed}
+    for i, j, k in product(*map(range, energies.shape[:-1])):
+        cell = (PATH_NAMES["r1"][i], PATH_NAMES["r2"][j], PATH_NAMES["r3"][k])
+        if cell[:2] in observed_pairs:
+            assert pairwise.predict([cell])[0] == approx(energies[i, j, k], abs=1e-4)
+
+    assert AdditiveModel.fit(PATH_NAMES, observed, pairwise=True).pairwise.keys() == {(0, 1), (0, 2), (1, 2)}
+
+
+def test_fit_keep_observed():
+    energies = make_energies(interaction=0.5)
+    observed = sample(energies, 10)
+    model = AdditiveModel.fit(PATH_NAMES, observed)
+    enm = model.enumeration(["X", "Y", "Z"])
+    for labels, values in observed.items():
+        assert enm.sel(**dict(zip(PATH_NAMES, labels))).energies == approx(np.diff(values))
+
+
+def test_fit_errors():
+    energies = make_energies()
+    with raises(ValueError):
+        AdditiveModel.fit(PATH_NAMES, {("H", "H", "A"): energies[0, 0, 0], ("F", "C", "B"): energies[1, 1, 1]})
+    with raises(KeyError):
+        AdditiveModel.fit(PATH_NAMES, {("H", "H", "Q"): energies[0, 0, 0]})
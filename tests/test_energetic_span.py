@@ -0,0 +1,72 @@
+import numpy as np
+from pytest import approx, mark
+
+from reaction_web import Path, Web
+from reaction_web.energetic_span import energetic_span, turnover_frequency
+from reaction_web.tools.generate_paths import enumeration_factory
+from reaction_web.tools.helper import energy_conversion
+
+
+def brute_force_span(relative_energies):
+    """
+    O(n^2) energetic span of a single cycle
+    """
+    *states, end = relative_energies
+    return max(states[j] - states[i] + (end if j < i else 0) for i in range(len(states)) for j in range(len(states)))
+
+
+def test_energetic_span():
+    rng = np.random.default_rng(0)
+    relative_energies = rng.normal(size=(50, 7))
+    spans, tdis, tdtss = energetic_span(relative_energies)
+
+    for energies, span, tdi, tdts in zip(relative_energies, spans, tdis, tdtss):
+        assert span == approx(brute_force_span(energies))
+        assert span == approx(energies[tdts] - energies[tdi] + (energies[-1] if tdts < tdi else 0))
+
+    assert energetic_span([0, 1])[0] == approx(0)
+
+
+def test_energetic_span_masked():
+    energies = np.ma.masked_array([[0, 5, -10, 4, -2], [0, 5, -10, -20, 0]], [[0] * 5, [0, 0, 0, 0, 1]])
+    spans, tdis, tdtss = energetic_span(energies)
+    assert spans == approx([14, 5])
+    assert tdis.tolist() == [2, 0]
+    assert tdtss.tolist() == [3, 1]
+
+
+def test_turnover_frequency():
+    assert turnover_frequency(0) == approx(6.21e12, rel=1e-3)
+    assert turnover_frequency(0.75) == approx(
+        turnover_frequency(0.75 * energy_conversion("eV", "kJ/mol"), units="kJ/mol")
+    )
+    assert turnover_frequency([0.5, 0.75]) == approx([turnover_frequency(0.5), turnover_frequency(0.75)])
+    assert turnover_frequency(0.75, 350) > turnover_frequency(0.75)
+
+
+def test_Path_energetic_span():
+    path = Path.from_energies("ABCDE", [0, 5, -10, 4, -2])
+    assert path.energetic_span() == (approx(14), 2, 3)
+    assert path.turnover_frequency() == approx(float(turnover_frequency(14)))
+
+
+def test_Web_energetic_span():
+    web = Web([Path.from_energies("ABCDE", [0, 5, -10, 4, -2]), Path.from_energies("ABCD", [0, 5, -10, -20])])
+    spans, tdis, tdtss = web.energetic_span()
+    assert spans == approx([14, 5])
+    assert tdis.tolist() == [2, 0]
+    assert tdtss.tolist() == [3, 1]
+    assert web.turnover_frequency(units="kcal/mol") == approx(turnover_frequency([14, 5], units="kcal/mol"))
+
+
+@mark.parametrize("dense", [False, True])
+def test_Enumeration_energetic_span(dense):
+    enm = enumeration_factory("tests/data/enum_3_4_3.csv", dense=dense)
+    spans, tdis, tdtss = enm.energetic_span()
+    assert spans.shape == tdis.shape == tdtss.shape == enm.shape
+
+    expected = np.array([path.energetic_span() for path in enm.paths.flat]).reshape(*enm.shape, 3)
+    assert spans == approx(expected[..., 0])
+    assert (tdis == expected[..., 1]).all()
+    assert (tdtss == expected[..., 2]).all()
+    assert enm.turnover_frequency(400) == approx(turnover_frequency(spans, 400))
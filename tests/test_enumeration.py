@@ -1,9 +1,13 @@
+import pickle
 from itertools import product
 
+import numpy as np
+import pandas as pd
 from more_itertools import collapse, windowed
-from pytest import fixture, raises
+from pytest import approx, fixture, mark, raises
 
-from reaction_web import Enumeration, Path
+from reaction_web import Enumeration, EReaction, Path, PathArray
+from reaction_web.lazy import AdditiveEnergies
 from reaction_web.tools.generate_paths import enumeration_factory
 
 
@@ -120,3 +124,337 @@ def test_Enumeration_iter_3(data_2_3_2_3_4_enumeration):
 
 def test_Enumeration_shape(data_enumeration):
     assert data_enumeration.shape == (2, 3)
+
+
+@fixture
+def dense_enumeration():
+    return enumeration_factory("tests/data/enum_2_3_2_3_4.csv", dense=True)
+
+
+def test_Enumeration_dense(data_2_3_2_3_4_enumeration, dense_enumeration):
+    assert dense_enumeration.dense
+    assert not data_2_3_2_3_4_enumeration.dense
+    assert repr(dense_enumeration) == repr(data_2_3_2_3_4_enumeration)
+    assert dense_enumeration.shape == (2, 3, 2, 3, 4)
+    assert dense_enumeration.paths.energies.shape == (2, 3, 2, 3, 4, 4)
+
+    for path, dense_path in zip(data_2_3_2_3_4_enumeration.paths.flat, dense_enumeration.paths.flat):
+        assert isinstance(dense_path, Path)
+        assert dense_path.name == path.name
+        assert dense_path.energies == approx(path.energies)
+
+    sub_enm = dense_enumeration["B"]["D"]
+    assert isinstance(sub_enm, Enumeration)
+    assert sub_enm.dense
+    assert sub_enm.shape == (2, 3, 4)
+    path = sub_enm["G"]["I"]["M"]
+    assert isinstance(path, Path)
+    assert path.name == "('B', 'D', 'G', 'I', 'M')"
+    assert [molecule.name for (molecule,) in path[0]] == ["A", "B"]
+
+
+def test_Enumeration_from_energies():
+    energies = np.arange(12.0).reshape(2, 3, 2)
+    enm = Enumeration.from_energies(energies, {"r1": ("A", "B"), "r2": ("C", "D", "E")}, ["X", "Y"])
+    assert enm.shape == (2, 3)
+    assert str(enm["B"]["E"][0]) == "X -> Y"
+    assert enm["B"]["E"].energies == approx([1])
+
+    with raises(ValueError):
+        Enumeration.from_energies(energies, {"r1": ("A", "B"), "r2": ("C", "D")}, ["X", "Y"])
+    with raises(ValueError):
+        Enumeration.from_energies(energies, {"r1": ("A", "B"), "r2": ("C", "D", "E")}, ["X"])
+
+
+@mark.parametrize("dense", [False, True])
+def test_Enumeration_metrics(dense):
+    enm = enumeration_factory("tests/data/enum_3_4_3.csv", dense=dense)
+    paths = list(enm.paths.flat)
+
+    def expected(function):
+        return np.array([function(path) for path in paths]).reshape(enm.shape)
+
+    assert enm.energies().shape == (3, 4, 3, 3)
+    assert enm.relative_energies().shape == (3, 4, 3, 4)
+    assert enm.max() == approx(expected(lambda path: path.max()[1]))
+    assert enm.min() == approx(expected(lambda path: path.min()[1]))
+    assert (enm.argmax() == expected(lambda path: path.max()[0])).all()
+    assert (enm.argmin() == expected(lambda path: path.min()[0])).all()
+    assert enm.barrier() == approx(expected(lambda path: path.energies.max()))
+    assert enm.step(1) == approx(expected(lambda path: path.energies[1]))
+    assert enm.relative_step(-1) == approx(expected(lambda path: path.relative_energies[-1]))
+
+
+def test_Enumeration_chunked(monkeypatch):
+    enm = enumeration_factory("tests/data/enum_3_4_3.csv", dense=True)
+    expected = [enm.max(), enm.argmin(), enm.step(1), enm.limiting_potential()]
+
+    monkeypatch.setattr("reaction_web.enumeration.CHUNK_SIZE", 96)  # two rows of the first dimension per chunk
+    assert list(enm._chunk_bounds()) == [(0, 2), (2, 3)]
+    assert enm.max() == approx(expected[0])
+    assert (enm.argmin() == expected[1]).all()
+    assert enm.step(1) == approx(expected[2])
+    assert np.array_equal(enm.limiting_potential(), expected[3], equal_nan=True)
+
+
+@mark.parametrize("dense", [False, True])
+def test_Enumeration_topk(dense, monkeypatch):
+    enm = enumeration_factory("tests/data/enum_3_4_3.csv", dense=dense)
+    maxes = enm.max()
+    order = np.argsort(maxes, axis=None, kind="stable")
+
+    labels, indices, values = enm.topk("max", 5)
+    assert values == approx(maxes.ravel()[order[:5]])
+    assert maxes[tuple(indices.T)] == approx(values)
+    assert labels[0] == tuple(subs[i] for subs, i in zip(enm.path_names.values(), indices[0]))
+    assert enm[labels[0]].max()[1] == approx(values[0])
+
+    monkeypatch.setattr("reaction_web.enumeration.CHUNK_SIZE", 1)
+    assert enm.topk("max", 5)[2] == approx(values)
+    assert enm.topk(lambda sub: sub.max(), 5)[2] == approx(values)
+    assert enm.topk(maxes, 5)[2] == approx(values)
+    assert enm.topk(maxes, 3, largest=True)[2] == approx(np.sort(maxes, axis=None)[::-1][:3])
+    assert enm.topk(maxes, 100)[2] == approx(np.sort(maxes, axis=None))
+    assert enm.topk(maxes, 0)[1].shape == (0, 3)
+
+    with raises(ValueError):
+        enm.topk(maxes, -1)
+
+
+def test_Enumeration_topk_nan():
+    energies = np.array([[0, 1, 0], [0, -1, 2], [0, 0.5, 0]])
+    enm = Enumeration.from_energies(energies, {"r1": ("A", "B", "C")}, "XYZ", ne=[1, 0])
+    labels, indices, values = enm.topk("limiting_potential", 3)
+    assert labels == [("C",), ("A",)]
+    assert values == approx([0.5, 1])
+
+
+@mark.parametrize("dense", [False, True])
+def test_Enumeration_where(dense, monkeypatch):
+    monkeypatch.setattr("reaction_web.enumeration.CHUNK_SIZE", 1)
+    enm = enumeration_factory("tests/data/enum_3_4_3.csv", dense=dense)
+    barriers = enm.barrier()
+    threshold = np.median(barriers)
+
+    labels, indices, values = enm.where("barrier", threshold)
+    assert (indices == np.argwhere(barriers < threshold)).all()
+    assert values == approx(barriers[barriers < threshold])
+    assert len(labels) == len(values)
+
+    labels, indices, values = enm.where(barriers, threshold, largest=True)
+    assert (indices == np.argwhere(barriers > threshold)).all()
+    assert enm.where(barriers, -np.inf)[1].shape == (0, 3)
+
+
+def test_Enumeration_npy(tmp_path, dense_enumeration, data_enumeration):
+    filename = str(tmp_path / "enumeration.npy")
+    dense_enumeration.to_npy(filename)
+    assert (tmp_path / "enumeration.json").exists()
+
+    enm = Enumeration.from_npy(filename)
+    assert isinstance(enm.paths.energies, np.memmap)
+    assert enm.path_names == dense_enumeration.path_names
+    assert enm.paths.species == dense_enumeration.paths.species
+    assert enm.max() == approx(dense_enumeration.max())
+
+    sub_enm = enm["B", :, "G"]
+    assert isinstance(sub_enm.paths.energies, np.memmap)
+    assert sub_enm.min() == approx(dense_enumeration["B", :, "G"].min())
+    assert enm["A", "C", "F", "I", "M"].name == "('A', 'C', 'F', 'I', 'M')"
+
+    in_memory = Enumeration.from_npy(filename, mmap_mode=None)
+    assert not isinstance(in_memory.paths.energies, np.memmap)
+
+    with raises(TypeError):
+        data_enumeration.to_npy(filename)
+
+
+def test_Enumeration_npy_electrochemical(tmp_path):
+    energies = np.arange(12, dtype=np.float32).reshape(2, 3, 2)
+    enm = Enumeration.from_energies(energies, {"r1": ("A", "B"), "r2": ("C", "D", "E")}, ["X", "Y"], [1], [0.5])
+    filename = str(tmp_path / "electrochemical.npy")
+    enm.to_npy(filename)
+
+    loaded = Enumeration.from_npy(filename)
+    assert loaded.paths.energies.dtype == np.float32
+    assert loaded.paths.ne == approx([1])
+    assert loaded.paths.ref_pot == approx([0.5])
+    assert loaded.energies() == approx(enm.energies())
+
+
+@mark.parametrize("dense", [False, True])
+def test_Enumeration_convert(dense):
+    enm = enumeration_factory("tests/data/enum_3_4_3.csv", dense=dense, units="kcal/mol")
+    maxes = enm.max()
+    sub_enm = enm["B"]
+    assert sub_enm.units == "kcal/mol"
+    assert next(iter(enm)).units == "kcal/mol"
+
+    converted = enm.convert("kJ/mol")
+    assert converted.units == "kJ/mol"
+    assert converted.max() == approx(maxes * 4.184)
+    assert converted.convert("kcal/mol").max() == approx(maxes)
+    assert enm.units == "kcal/mol"
+    assert enm.max() == approx(maxes)
+
+    # views and copies from indexing are converted without touching the original
+    assert sub_enm.convert("kJ/mol").max() == approx(maxes[1] * 4.184)
+    assert enm[:, [2, 0]].convert("kJ/mol").max() == approx(maxes[:, [2, 0]] * 4.184)
+    assert enm.max() == approx(maxes)
+    assert sub_enm.max() == approx(maxes[1])
+
+    with raises(ValueError):
+        Enumeration(enm.paths, enm.path_names).convert("eV")
+
+
+def test_Enumeration_convert_special(tmp_path):
+    contributions = {"r1": {"A": [0, 1], "B": [0, 2]}}
+    enm = Enumeration.from_contributions([0, 1], contributions, "XY", units="eV")
+    enm = enm.convert("kcal/mol")
+    assert isinstance(enm.paths.energies, AdditiveEnergies)
+    assert enm.max() == approx(np.array([2, 3]) * 23.0605, rel=1e-5)
+
+    filename = str(tmp_path / "enumeration.npy")
+    enm.to_npy(filename)
+    loaded = Enumeration.from_npy(filename)
+    assert loaded.units == "kcal/mol"
+    assert loaded.convert("eV").max() == approx([2, 3])
+    assert Enumeration.from_npy(filename).max() == approx(enm.max())
+
+    electrochemical = Enumeration.from_energies(np.zeros((2, 2)), {"r1": ("A", "B")}, "XY", [1], units="eV")
+    with raises(ValueError):
+        electrochemical.convert("kcal/mol")
+
+    lazy = Enumeration.from_function(lambda labels: Path.from_energies("XY", [0, 1]), {"r1": ("A",)}, units="eV")
+    with raises(ValueError):
+        lazy.convert("kcal/mol")
+
+
+@fixture
+def missing_csv(tmp_path):
+    df = pd.read_csv("tests/data/enum_3_4_3.csv", skipinitialspace=True)
+    df = df[~((df["r0"] == "A") & (df["r1"] == "D") & (df["r2"] == "H"))]
+    df.to_csv(tmp_path / "missing.csv", index=False)
+    return str(tmp_path / "missing.csv")
+
+
+@mark.parametrize("dense", [False, True])
+def test_Enumeration_missing(missing_csv, dense):
+    with raises(KeyError):
+        enumeration_factory(missing_csv, dense=dense)
+
+    enm = enumeration_factory(missing_csv, dense=dense, allow_missing=True)
+    full = enumeration_factory("tests/data/enum_3_4_3.csv", dense=dense)
+    assert enm.shape == full.shape
+    assert enm["A", "D", "H"] is None
+    assert enm.missing().sum() == 1
+    idx = tuple(subs.index(label) for subs, label in zip(enm.path_names.values(), "ADH"))
+    assert enm.missing()[idx]
+
+    present = ~enm.missing()
+    full = full[tuple(list(subs) for subs in enm.path_names.values())]
+    for metric in ["min", "max", "barrier", "argmin", "argmax"]:
+        values = getattr(enm, metric)()
+        assert values[present] == approx(getattr(full, metric)()[present])
+    assert np.isnan(enm.max()[idx])
+    assert enm.argmax()[idx] == -1
+    span, tdi, tdts = enm.energetic_span()
+    assert np.isnan(span[idx]) and tdi[idx] == tdts[idx] == -1
+    assert np.isnan(enm.map(lambda path: path.max()[1])[idx])
+
+    labels, _, _ = enm.topk("max", enm.missing().size)
+    assert len(labels) == enm.missing().size - 1
+    assert ("A", "D", "H") not in labels
+    assert sum(path is None for path in enm["A", "D"]) == 1
+
+
+@mark.parametrize("dense", [False, True])
+def test_Enumeration_pickle(dense):
+    enm = enumeration_factory("tests/data/enum_3_4_3.csv", dense=dense, units="eV")
+    enm["A"]  # cache the label lookups
+    loaded = pickle.loads(pickle.dumps(enm))
+    assert loaded.dense == dense
+    assert (loaded.path_names, loaded.units) == (enm.path_names, enm.units)
+    assert loaded.max() == approx(enm.max())
+
+
+def test_Enumeration_potential():
+    energies = np.array([[[0, 1, 0.5], [0, 2, 3]], [[0, -1, -2], [0, 1, 1]]])
+    path_names = {"r1": ("A", "B"), "r2": ("C", "D")}
+    enm = Enumeration.from_energies(energies, path_names, "XYZ", ne=[1, 1], ref_pot=[0.5, 0.5])
+    assert isinstance(enm["A"]["C"][0], EReaction)
+    assert enm["A"]["C"].energies == approx([0.5, -1])
+
+    potential_energies = enm.potential_energies([0, 1])
+    assert potential_energies.shape == (2, 2, 2, 2)
+    assert potential_energies[0, 0, 1] == approx([-0.5, -2])
+
+    assert enm.limiting_potential() == approx(np.array([[0.5, 1.5], [-1.5, 0.5]]))
+
+    # Object array of Paths
+    paths = np.empty(4, dtype=object)
+    paths[:] = list(enm.paths.flat)
+    object_enm = Enumeration(paths.reshape(2, 2), path_names)
+    assert object_enm.potential_energies([0, 1]) == approx(potential_energies)
+    assert object_enm.limiting_potential() == approx(enm.limiting_potential())
+
+
+@mark.parametrize("dense", [False, True])
+def test_Enumeration_getitem_multi(dense):
+    enm = enumeration_factory("tests/data/enum_2_3_2_3_4.csv", dense=dense)
+
+    sub = enm["B", :, "G"]
+    assert isinstance(sub, Enumeration)
+    assert sub.path_names == {"r2": ("C", "D", "E"), "r4": ("H", "I", "J"), "r5": ("K", "L", "M", "N")}
+    path = sub[1, "I", -1]
+    assert isinstance(path, Path)
+    assert path.name == "('B', 'D', 'G', 'I', 'N')"
+    assert path.energies == approx(enm["B"]["D"]["G"]["I"]["N"].energies)
+
+    sub = enm[:, ["C", "E"], [True, False], 1:]
+    assert isinstance(sub, Enumeration)
+    assert sub.shape == (2, 2, 1, 2, 4)
+    assert sub.path_names["r2"] == ("C", "E")
+    assert sub.path_names["r3"] == ("F",)
+    assert sub.path_names["r4"] == ("I", "J")
+    assert sub.max() == approx(enm.max()[:, ::2, :1, 1:])
+
+    sub = enm[:, ["E", "C"]]
+    assert isinstance(sub, Enumeration)
+    assert sub.path_names["r2"] == ("E", "C")
+    assert sub.max() == approx(enm.max()[:, [2, 0]])
+
+    with raises(KeyError):
+        enm[:, "Z"]
+    with raises(IndexError):
+        enm[0, 0, 0, 0, 0, 0]
+    with raises(IndexError):
+        enm[:, [True, False]]
+
+
+def test_Enumeration_views(dense_enumeration):
+    sub = dense_enumeration["A", 1:, [True, False]]
+    assert isinstance(sub.paths, PathArray)
+    assert np.shares_memory(sub.paths.energies, dense_enumeration.paths.energies)
+
+    sub = dense_enumeration.sel(r2=["C", "E"], r4="I")
+    assert isinstance(sub, Enumeration)
+    assert isinstance(sub.paths, PathArray)
+    assert np.shares_memory(sub.paths.energies, dense_enumeration.paths.energies)
+    assert sub.path_names == {"r1": ("A", "B"), "r2": ("C", "E"), "r3": ("F", "G"), "r5": ("K", "L", "M", "N")}
+    path = sub["B", "E", "G", "K"]
+    assert isinstance(path, Path)
+    assert path.name == "('B', 'E', 'G', 'I', 'K')"
+
+
+def test_Enumeration_sel(data_enumeration):
+    path = data_enumeration.sel(r1="H", r2="I")
+    assert isinstance(path, Path)
+    assert path.name == "('H', 'I')"
+
+    sub = data_enumeration.sel(r2=["B", "I"])
+    assert isinstance(sub, Enumeration)
+    assert sub.shape == (2, 2)
+
+    with raises(KeyError):
+        data_enumeration.sel(r3="H")
@@ -0,0 +1,109 @@
+import numpy as np
+from pytest import approx, raises
+
+from reaction_web import AdditiveEnergies, Enumeration, LazyPathArray, Path
+
+
+def make_function(calls):
+    def function(labels):
+        calls.append(labels)
+        energy = sum(map(float, labels))
+        return Path.from_energies(["A", "B", "C"], [0, energy, -energy], name=str(labels))
+
+    return function
+
+
+def test_LazyPathArray():
+    calls = []
+    paths = LazyPathArray(make_function(calls), (("1", "2"), ("3", "4", "5")))
+    assert paths.shape == (2, 3)
+    assert paths.ndim == 2
+    assert len(paths) == 2
+    assert repr(paths) == "<LazyPathArray (2, 3)>"
+
+    view = paths[1]
+    assert view.shape == (3,)
+    assert view.fixed == ("2", None)
+    assert calls == []
+
+    path = view[-1]
+    assert isinstance(path, Path)
+    assert calls == [("2", "5")]
+    assert path.energies == approx([7, -14])
+
+    assert len(list(paths.flat)) == 6
+    assert len(calls) == 7
+
+    with raises(ValueError):
+        LazyPathArray(make_function(calls), (("1", "2"),), ("1", "2"))
+
+
+def test_LazyPathArray_cache():
+    calls = []
+    paths = LazyPathArray(make_function(calls), (("1", "2"), ("3", "4", "5")), cache_size=4)
+    paths[0, 0]
+    paths[:, 0][0]
+    assert calls == [("1", "3")]
+
+    list(paths.flat)
+    assert len(calls) == 6
+    paths[1, 2]
+    assert len(calls) == 6
+    paths[0, 0]  # evicted
+    assert len(calls) == 7
+
+
+def test_AdditiveEnergies():
+    base = [0, 1, 2]
+    contributions = [np.arange(6).reshape(2, 3), 10 * np.arange(9).reshape(3, 3)]
+    energies = AdditiveEnergies(base, contributions)
+    full = np.array(base) + contributions[0][:, None, :] + contributions[1][None, :, :]
+
+    assert energies.shape == (2, 3, 3)
+    assert energies.ndim == 3
+    assert len(energies) == 2
+    assert np.array(energies) == approx(full)
+    assert energies[...] == approx(full)
+    assert energies[1] == approx(full[1])
+    assert energies[:, [2, 0], 1] == approx(full[:, [2, 0], 1])
+    assert energies[..., ::2] == approx(full[..., ::2])
+    assert energies[[True, False], 1:] == approx(full[:1, 1:])
+
+    with raises(ValueError):
+        AdditiveEnergies(base, [np.zeros((2, 2))])
+
+
+def test_Enumeration_from_function():
+    calls = []
+    enm = Enumeration.from_function(make_function(calls), {"r1": ("1", "2"), "r2": ("3", "4", "5")}, cache_size=None)
+    assert enm.shape == (2, 3)
+
+    sub = enm["2"]
+    assert isinstance(sub, Enumeration)
+    assert sub.path_names == {"r2": ("3", "4", "5")}
+    assert calls == []
+
+    assert enm["2", "4"].energies == approx([6, -12])
+    assert enm.max() == approx(np.array([[4, 5, 6], [5, 6, 7]]))
+    assert enm.min() == approx(np.array([[-4, -5, -6], [-5, -6, -7]]))
+    assert len(calls) == 6
+    assert [len(list(sub)) for sub in enm] == [3, 3]
+
+
+def test_Enumeration_from_contributions():
+    contributions = {
+        "r1": {"H": [0, 0, 1], "C": [0, 1, 2]},
+        "r2": {"X": [0, 0, 0], "Y": [0, -1, 0], "Z": [0, 2, 4]},
+    }
+    enm = Enumeration.from_contributions([0, 1, 2], contributions, ["A", "B", "C"])
+    assert enm.dense
+    assert enm.shape == (2, 3)
+    assert enm.path_names == {"r1": ("H", "C"), "r2": ("X", "Y", "Z")}
+
+    path = enm["C", "Z"]
+    assert path.name == "('C', 'Z')"
+    assert path.energies == approx([4, 4])
+
+    assert enm.relative_step(-1) == approx(np.array([[3, 3, 7], [4, 4, 8]]))
+    assert enm.sel(r2="Y").max() == approx([3, 4])
+    assert enm.energies() == approx(np.diff(np.array(enm.paths.energies), axis=-1))
@@ -1,4 +1,10 @@
-from reaction_web import Molecule
+import pickle
+from dataclasses import FrozenInstanceError, asdict, fields, replace
+
+from pytest import raises
+
+from reaction_web import EReaction, FrozenMolecule, Molecule
+from reaction_web.molecule import energy_version
 
 
 def test_init():
@@ -7,3 +13,53 @@ def test_init():
     assert a.energy == -1
     assert str(a) == "<Mol a -1.0000>"
     assert repr(a) == "<Mol a -1.0000>"
+
+
+def test_slots():
+    a = Molecule("a", -1)
+    assert not hasattr(a, "__dict__")
+    with raises(AttributeError):
+        a.charge = 1  # type: ignore
+
+    assert pickle.loads(pickle.dumps(a)) == a
+
+
+def test_dataclass():
+    a = Molecule("a", -1)
+    assert [f.name for f in fields(a)] == ["name", "energy"]
+    assert asdict(a) == {"name": "a", "energy": -1}
+    assert replace(a, energy=0) == Molecule("a", 0)
+    assert a.energy == -1
+    assert replace(FrozenMolecule("a", -1), energy=0) == FrozenMolecule("a", 0)
+
+
+def test_interned_name():
+    a = Molecule("".join(["H", "2", "O"]), -1)
+    b = Molecule("".join(["H", "2", "O"]), -2)
+    assert a.name is b.name
+
+
+def test_FrozenMolecule():
+    a = FrozenMolecule("a", -1)
+    assert isinstance(a, Molecule)
+    assert a == FrozenMolecule("a", -1)
+    assert repr(a) == "<Mol a -1.0000>"
+    assert not hasattr(a, "__dict__")
+    assert len({a, FrozenMolecule("a", -1)}) == 1
+
+    with raises(FrozenInstanceError):
+        a.energy = 0
+
+
+def test_energy_version():
+    version = energy_version()
+    a = Molecule("a", -1)
+    r = EReaction([a], [Molecule("b", 0)], ne=1, ref_pot=0)
+    assert energy_version() == version  # constructing does not invalidate any cached energies
+    assert r.energy == 1
+
+    a.energy = 0
+    assert energy_version() == version + 1
+    assert r.energy == 0
+    r.u = 1
+    assert r.energy == -1
@@ -0,0 +1,165 @@
+import numpy as np
+from pytest import approx, fixture, raises
+
+from reaction_web import Molecule, Network, Path, Reaction, Web
+from reaction_web.network import state
+
+
+@fixture
+def network():
+    A, B, C, D = (Molecule(name, energy) for name, energy in zip("ABCD", [0, 1, 1.5, 0.5]))
+    reactions = [
+        Reaction([A], [B]),
+        Reaction([B], [D]),
+        Reaction([A], [C]),
+        Reaction([C], [D]),
+        Reaction([B], [C]),
+        Reaction([A], [D]),
+    ]
+    return Network(reactions, "test")
+
+
+def test_state():
+    assert state("H2O + CO") == ("CO", "H2O")
+    assert state(["H2O", "CO"]) == ("CO", "H2O")
+    assert state("A") == ("A",)
+
+
+def test_Network(network):
+    assert len(network) == 6
+    assert repr(network) == '<Network "test" (4 states, 6 reactions)>'
+    assert network.states == {("A",), ("B",), ("C",), ("D",)}
+    assert "A" in network
+    assert "E" not in network
+    assert [product for product, _ in network.successors("A")] == [("B",), ("C",), ("D",)]
+    assert network.successors("D") == []
+
+
+def test_Network_routes(network):
+    web = network.routes("A", "D", k=10)
+    assert isinstance(web, Web)
+    assert [path.name for path in web] == ["A -> D", "A -> B -> D", "A -> B -> C -> D", "A -> C -> D"]
+    assert [path.energies.max() for path in web] == approx([0.5, 1, 1, 1.5])
+
+    web = network.routes("A", "D", k=10, objective="max")
+    assert [path.name for path in web] == ["A -> D", "A -> B -> D", "A -> C -> D", "A -> B -> C -> D"]
+    assert [path.max()[1] for path in web] == approx([0.5, 1, 1.5, 1.5])
+
+    assert [path.name for path in network.routes("A", "D", k=2)] == ["A -> D", "A -> B -> D"]
+    assert [path.name for path in network.routes("B", "D")] == ["B -> D"]
+    assert len(network.routes("D", "A")) == 0
+
+    with raises(ValueError):
+        network.routes("A", "D", objective="span")
+
+
+def test_Network_reassign(network):
+    network.reactions = network.reactions[:2]
+    assert [path.name for path in network.routes("A", "D", k=10)] == ["A -> B -> D"]
+
+
+def test_Network_from_paths():
+    path1 = Path.from_energies(["CO + H2O", "COOH + H", "CO2 + H2"], [0, 0.5, -0.5], "carboxyl")
+    path2 = Path.from_energies(["CO + H2O", "COOH + H", "HCOOH"], [0, 0.5, -0.2], "formic")
+    path3 = Path.from_energies(["CO + H2O", "CO + H + OH", "CO2 + H2"], [0, 1, -0.5], "redox")
+    network = Network.from_paths(Web([path1, path2, path3]))
+    assert len(network) == 5
+    assert len(network.states) == 5
+
+    web = network.routes("H2O + CO", "H2 + CO2", k=2)
+    assert [path.name for path in web] == ["CO + H2O -> COOH + H -> CO2 + H2", "CO + H2O -> CO + H + OH -> CO2 + H2"]
+    assert web.energetic_span()[0] == approx([0.5, 1])
+
+
+def test_Network_large():
+    """
+    Grid of intermediates with an exponential number of linear paths
+    """
+    rng = np.random.default_rng(0)
+    n = 100
+    molecules = {(i, j): Molecule(f"{i},{j}", rng.normal()) for i in range(n) for j in range(n)}
+    reactions = [
+        Reaction([molecules[i, j]], [molecules[i + di, j + dj]])
+        for (i, j) in molecules
+        for di, dj in [(1, 0), (0, 1)]
+        if (i + di, j + dj) in molecules
+    ]
+    network = Network(reactions)
+    assert len(network) == 2 * n * (n - 1)
+
+    web = network.routes("0,0", f"{n - 1},{n - 1}", k=3)
+    assert len(web) == 3
+    barriers = [path.energies.max() for path in web]
+    assert barriers == sorted(barriers)
+    assert all(len(path) == 2 * (n - 1) for path in web)
+
+
+def test_Network_routes_max_crossing():
+    """
+    The route with the lower max early on (through A) reaches X with a higher cumulative energy and loses later
+    """
+
+    def reaction(reactant: str, product: str, energy: float) -> Reaction:
+        return Reaction([Molecule(reactant, 0)], [Molecule(product, energy)])
+
+    reactions = [
+        reaction("S", "A", 1),
+        reaction("A", "X", 0),
+        reaction("S", "B", 2),
+        reaction("B", "X", -12),
+        reaction("X", "T", 5),
+    ]
+    network = Network(reactions)
+
+    assert [path.name for path in network.routes("S", "T", objective="max")] == ["S -> B -> X -> T"]
+    web = network.routes("S", "T", k=2, objective="max")
+    assert [path.name for path in web] == ["S -> B -> X -> T", "S -> A -> X -> T"]
+    assert [path.max()[1] for path in web] == approx([2, 6])
+
+    # the source counts, as in Path.max
+    downhill = network.routes("B", "T", objective="max")
+    assert downhill[0].max()[1] == approx(0)
+
+
+def test_Network_routes_revisit():
+    """
+    Both labels that settle S2 pass through S1, so they cannot continue to S1 as S0 -> S2 can
+    """
+    edges = [("S0", "S1", 1), ("S0", "S2", 4), ("S1", "S2", 3), ("S1", "S3", 0)]
+    edges += [("S2", "S1", -3), ("S3", "S2", 3), ("S3", "S4", -3)]
+    network = Network([Reaction([Molecule(r, 0)], [Molecule(p, energy)]) for r, p, energy in edges])
+
+    web = network.routes("S0", "S4", k=2)
+    assert [path.name for path in web] == ["S0 -> S1 -> S3 -> S4", "S0 -> S2 -> S1 -> S3 -> S4"]
+
+
+def test_Network_routes_brute_force():
+    """
+    Compare with the scores of every simple path on random graphs with cycles
+    """
+
+    def simple_paths(edges, current, target, visited):
+        if current == target:
+            yield []
+            return
+        for reactant, product, energy in edges:
+            if reactant == current and product not in visited:
+                for rest in simple_paths(edges, product, target, visited | {product}):
+                    yield [energy, *rest]
+
+    scores = {"barrier": max, "max": lambda energies: max(0, *np.cumsum(energies))}
+    rng = np.random.default_rng(5)
+    for _ in range(100):
+        n = rng.integers(3, 8)
+        edges = [
+            (f"S{i}", f"S{j}", float(rng.integers(-4, 5)))
+            for i in range(n)
+            for j in range(n)
+            if i != j and rng.random() < 0.35
+        ]
+        network = Network([Reaction([Molecule(r, 0)], [Molecule(p, energy)]) for r, p, energy in edges])
+        paths = list(simple_paths(edges, "S0", f"S{n - 1}", {"S0"}))
+        for objective, score in scores.items():
+            expected = sorted(map(score, paths))[:6]
+            web = network.routes("S0", f"S{n - 1}", k=6, objective=objective)
+            assert [score(path.energies) for path in web] == approx(expected)
@@ -0,0 +1,70 @@
+import numpy as np
+from pytest import approx, raises
+
+from reaction_web import Enumeration
+from reaction_web.parallel import apply_shared, shared_array, split
+from reaction_web.tools.generate_paths import enumeration_factory
+
+
+def max_energy(path):
+    return path.max()[1]
+
+
+def last_two(enm):
+    return enm.energies()[..., -2:].sum(axis=-1)
+
+
+def fail(array):
+    raise RuntimeError("failed")
+
+
+def test_split():
+    assert split(10, 3) == [(0, 4), (4, 8), (8, 10)]
+    assert split(2, 4) == [(0, 1), (1, 2)]
+    assert split(0, 4) == []
+
+
+def test_shared_array():
+    array = np.arange(12.0).reshape(4, 3)
+    with shared_array(array, split(4, 3)) as spec:
+        assert apply_shared(spec, lambda shared: shared.sum(axis=0).tolist()) == approx(array.sum(axis=0))
+        assert not apply_shared(spec, lambda shared: shared.flags.writeable)
+        with raises(RuntimeError):
+            apply_shared(spec, fail)
+
+
+def test_Enumeration_map():
+    dense = enumeration_factory("tests/data/enum_3_4_3.csv", dense=True)
+    sparse = enumeration_factory("tests/data/enum_3_4_3.csv")
+
+    expected = dense.max()
+    assert dense.map(max_energy) == approx(expected)
+    assert dense.map(max_energy, workers=2) == approx(expected)
+    assert sparse.map(max_energy, workers=2) == approx(expected)
+    assert dense["B", 1:].map(max_energy, workers=2) == approx(expected[1, 1:])
+
+
+def test_Enumeration_reduce():
+    dense = enumeration_factory("tests/data/enum_3_4_3.csv", dense=True)
+    sparse = enumeration_factory("tests/data/enum_3_4_3.csv")
+
+    expected = dense.energies()[..., -2:].sum(axis=-1)
+    assert dense.reduce(last_two) == approx(expected)
+    assert dense.reduce(last_two, workers=2) == approx(expected)
+    assert sparse.reduce(last_two, workers=2) == approx(expected)
+
+    contributions = {"r1": {"A": [0, 1, 2], "B": [0, 0, 1]}, "r2": {"C": [0, 0, 0], "D": [1, 2, 3]}}
+    additive = Enumeration.from_contributions([0, 0, 0], contributions, "XYZ")
+    assert additive.reduce(last_two, workers=2) == approx(np.array([[2, 4], [1, 3]]))
+
+
+def test_Enumeration_lazy_workers():
+    dense = enumeration_factory("tests/data/enum_3_4_3.csv", dense=True)
+    lazy = enumeration_factory("tests/data/enum_3_4_3.csv", lazy=True)
+    cached = Enumeration.from_function(lazy.paths.function, lazy.path_names, cache_size=16)
+    assert cached["A", "D", "H"] is cached["A", "D", "H"]
+
+    for enm in [lazy, cached]:
+        assert enm.map(max_energy, workers=2) == approx(dense.max())
+        assert enm.reduce(last_two, workers=2) == approx(dense.energies()[..., -2:].sum(axis=-1))
+    assert cached["B", 1:].map(max_energy, workers=2) == approx(dense.max()[1, 1:])
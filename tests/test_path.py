@@ -1,3 +1,7 @@
+import copy
+import pickle
+
+import numpy as np
 from pytest import approx, fixture, raises
 
 from reaction_web import EReaction, Molecule, Path, Reaction
@@ -85,3 +89,72 @@ def test_minmax(path1, path2):
     assert path2.min() == (3, -5.5)
     assert path1.max() == (2, 1)
     assert path2.max() == (1, 2)
+
+
+def test_energy_cache(path1):
+    energies = path1.energies
+    assert path1.energies is energies
+    with raises(ValueError):
+        energies[0] = 5
+
+    path1[0].products[0].energy = 1
+    assert path1.energies == approx([0, 1, 0, -7.5])
+    assert path1.relative_energies == approx([0, 0, 1, 1, -6.5])
+
+    path1[3].u = 1
+    assert path1.max() == (2, 1)
+    assert path1.min() == (4, -7.5)
+
+    path1.reactions = path1.reactions[:2]
+    assert path1.relative_energies == approx([0, 0, 1])
+
+
+def test_potential_energies(path1, path2):
+    assert (path1.ne == [0, 0, 0, 1]).all()
+    assert (path1.u == 0).all()
+
+    energies = path1.potential_energies([0, 1, -2])
+    assert energies.shape == (3, 4)
+    assert energies[0] == approx(path1.energies)
+    assert energies[:, 3] == approx([-7.5, -8.5, -5.5])
+
+    path2[2].u = 1
+    assert path2.potential_energies([0])[0] == approx([2, 0, -7.5])
+
+
+def test_limiting_potential(path1):
+    # Uphill chemical step
+    assert np.isnan(path1.limiting_potential())
+
+    path = Path.from_energies("ABC", [0, 1, 0.5], ne=[1, 1], ref_pot=[0, 0])
+    assert path.limiting_potential() == approx(1)
+    assert (path.potential_energies([path.limiting_potential()]) <= 0).all()
+
+    assert Path.from_energies("AB", [0, -1]).limiting_potential() == -np.inf
+
+    # Reductive path, the second reaction is uphill above 0.1 V and the first above -0.3 V
+    path = Path.from_energies("ABC", [0, 0.3, 0.2], ne=[-1, -1], ref_pot=[0, 0])
+    assert path.limiting_potential() == approx(-0.3)
+    assert (path.potential_energies([-0.3]) <= 1e-12).all()
+    assert (path.potential_energies([-0.29]) > 0).any()
+
+
+def test_pickle(path1, path2):
+    for path in [path1, path2]:
+        path.energies  # cached energies are not pickled
+        loaded = pickle.loads(pickle.dumps(path))
+        assert "_energies" not in loaded.__dict__
+        assert loaded.name == path.name
+        assert loaded.energies == approx(path.energies)
+        assert loaded.steps == approx(path.steps)
+        assert [type(r) for r in loaded] == [type(r) for r in path]
+        assert loaded[-2].products[1] is loaded[-1].reactants[0]
+
+    # copies share the Reactions, and Paths pickled together share their Molecules
+    copied = copy.copy(path1)
+    assert copied.reactions is path1.reactions
+    shared = Molecule("H2", -1)
+    p1 = Path([Reaction([Molecule("A", 0)], [shared])])
+    p2 = Path([Reaction([shared], [Molecule("B", 0)])])
+    l1, l2 = pickle.loads(pickle.dumps([p1, p2]))
+    assert l1[0].products[0] is l2[0].reactants[0]
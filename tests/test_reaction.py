@@ -1,3 +1,6 @@
+import pickle
+from dataclasses import asdict, astuple, fields, replace
+
 from reaction_web import EReaction, Molecule, Reaction
 
 
@@ -31,3 +34,56 @@ def test_EReaction():
     reactants, products = r
     assert reactants == [a]
     assert products == [b]
+
+
+def test_energy_cache():
+    a = Molecule("a", -1)
+    b = Molecule("b", -2)
+    r = Reaction([a], [b])
+    er = EReaction([a], [b], ne=1, ref_pot=1)
+
+    assert r.energy == -1
+    assert er.energy == -2
+
+    b.energy = 1
+    assert r.energy == 2
+    assert er.energy == 1
+
+    er.u = 1
+    assert er.energy == 0
+
+    r.products = [a]
+    assert r.energy == 0
+
+
+def test_pickle():
+    a = Molecule("a", -1)
+    b = Molecule("b", -2)
+    r = EReaction([a], [b], ne=1, ref_pot=1)
+    assert r.energy == -2
+
+    r2 = pickle.loads(pickle.dumps(r))
+    assert r2 == r
+    assert not hasattr(r2, "__dict__")
+
+    r2.products[0].energy = 0
+    assert r2.energy == 0
+
+
+def test_dataclass():
+    a = Molecule("a", -1)
+    b = Molecule("b", -2)
+    r = EReaction([a], [b], ne=1, ref_pot=1)
+    assert [f.name for f in fields(r)] == ["reactants", "products", "ne", "ref_pot", "u"]
+    assert asdict(r) == {
+        "reactants": [{"name": "a", "energy": -1}],
+        "products": [{"name": "b", "energy": -2}],
+        "ne": 1,
+        "ref_pot": 1,
+        "u": 0,
+    }
+    assert astuple(Reaction([a], [b])) == ([("a", -1)], [("b", -2)])
+
+    r2 = replace(r, u=1)
+    assert r2.energy == -3
+    assert r.energy == -2
@@ -0,0 +1,94 @@
+import numpy as np
+from pytest import approx, fixture, raises
+
+from reaction_web import Enumeration, Molecule, Path, Reaction, SpeciesTable, Web
+from reaction_web.molecule import energy_version
+
+
+@fixture
+def table():
+    table = SpeciesTable()
+    table.add(Molecule("H2", -1))
+    table.add(Molecule("O", 0))
+    return table
+
+
+def test_SpeciesTable(table):
+    assert len(table) == 2
+    assert "H2" in table
+    assert table["H2"].energy == -1
+    assert [mol.name for mol in table] == ["H2", "O"]
+    assert table.add(Molecule("H2", -5)) is table["H2"]
+
+
+def test_track(table):
+    H = Molecule("H", 0)
+    r1 = Reaction([H] * 2, [Molecule("H2", -1)])
+    r2 = Reaction([Molecule("H2", -1), Molecule("O", 0)], [Molecule("H2O", -2)])
+    r3 = Reaction([H], [Molecule("H+", 1)])
+    p1 = Path([r1, r2], "Water")
+    p2 = Path([r3], "Proton")
+    web = Web([p1, p2])
+
+    table.track(web)
+    assert r1.products[0] is table["H2"]
+    assert r2.reactants[0] is table["H2"]
+    assert web.max() == ((1, 1), 1)
+
+    untracked = Path([Reaction([H], [Molecule("H2", 0)])])
+    assert untracked.energies == approx([0])
+
+    table.update("H2", -3)
+    assert r1.energy == -3
+    assert p1.energies == approx([-3, 1])
+    assert p1.relative_energies == approx([0, -3, -2])
+    assert web.relative_energies[0].compressed() == approx([0, -3, -2])
+    assert untracked.energies == approx([0])
+
+    # built from the shared Molecule without being tracked
+    shared = Path([Reaction([Molecule("A", 0)], [table["H2"]])])
+    shared_web = Web([shared])
+    assert shared.energies == approx([-3])
+    assert shared_web.energies[0].compressed() == approx([-3])
+    table.update("H2", -4)
+    assert shared.energies == approx([-4])
+    assert shared_web.energies[0].compressed() == approx([-4])
+    assert p1.energies == approx([-4, 2])
+
+    # only the energies that depend on the species are recomputed
+    version = energy_version()
+    energies, water_energies = p2.energies, p1.energies
+    table.update("H2", -5)
+    assert energy_version() == version
+    assert p2.energies is energies
+    assert p1.energies is not water_energies
+    assert p1.energies == approx([-5, 3])
+
+    # energies cached before the Molecule was registered
+    O2 = Molecule("O2", 0)
+    r4 = Reaction([O2], [Molecule("O", 0)])
+    assert r4.energy == 0
+    table.add(O2)
+    table.update("O2", 1)
+    assert r4.energy == -1
+
+    with raises(KeyError):
+        table.update("H2O", 0)
+    with raises(TypeError):
+        table.track(H)  # type: ignore
+
+
+def test_track_enumeration(table):
+    energies = np.array([[[0, -1, -1], [1, 0, -2]], [[0, 0, 0], [2, 1, 0]]], dtype=float)
+    path_names = {"r1": ("A", "B"), "r2": ("C", "D")}
+    enm = Enumeration.from_energies(energies.copy(), path_names, ["A", "B + H2", "2H2"])
+    enm_H2 = Enumeration.from_energies(energies[..., :2].copy(), path_names, ["A", "H2 + H2"])
+    table.track(enm)
+    table.track(enm_H2)
+
+    table.update("H2", 0)
+    assert enm.paths.energies[..., 0] == approx(energies[..., 0])
+    assert enm.paths.energies[..., 1] == approx(energies[..., 1] + 1)
+    assert enm.paths.energies[..., 2] == approx(energies[..., 2])
+    assert enm_H2.paths.energies[..., 1] == approx(energies[..., 1] + 2)
+    assert enm["B"]["D"].energies == approx([0, -2])
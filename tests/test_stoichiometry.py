@@ -0,0 +1,83 @@
+import numpy as np
+from pytest import approx, raises
+
+from reaction_web import EReaction, Molecule, Path, Reaction, StoichiometryMatrix, Web
+
+
+def molecules():
+    return {name: Molecule(name, energy) for name, energy in zip(["H", "H2", "O2", "H2O", "OH"], [1, -1, 0, -3, -1])}
+
+
+def test_StoichiometryMatrix():
+    mols = molecules()
+    H, H2, O2, H2O, OH = mols.values()
+    reactions = [
+        Reaction([H, H], [H2]),
+        Reaction([H2, H2, O2], [H2O, H2O]),
+        Reaction([H2O, H], [OH, H2]),
+        Reaction([H2O], [H2O]),
+        EReaction([OH], [O2], 1, 0.5, 0.25),
+    ]
+    S = StoichiometryMatrix.from_reactions(reactions)
+    assert repr(S) == "<StoichiometryMatrix (5, 5)>"
+    assert S.species == ("H", "H2", "O2", "H2O", "OH")
+    assert S.toarray() == approx(
+        np.array(
+            [
+                [-2, 1, 0, 0, 0],
+                [0, -2, -1, 2, 0],
+                [-1, 1, 0, -1, 1],
+                [0, 0, 0, 0, 0],
+                [0, 0, 1, 0, -1],
+            ]
+        )
+    )
+    assert S.energies == approx([1, -1, 0, -3, -1])
+    assert S.offsets == approx([0, 0, 0, 0, 0.75])
+    assert S.reaction_energies() == approx([reaction.energy for reaction in reactions])
+
+    energy_sets = np.random.default_rng(0).normal(size=(5, 100))
+    assert S @ energy_sets == approx(S.toarray() @ energy_sets - S.offsets[:, None])
+
+    for i, energies in enumerate(energy_sets.T[:3]):
+        for mol, energy in zip(mols.values(), energies):
+            mol.energy = energy
+        assert (S @ energy_sets)[:, i] == approx([reaction.energy for reaction in reactions])
+
+    energies = S.species_energies({"H": [0, 1], "O2": 2})
+    assert energies.shape == (5, 2)
+    assert energies[:, 1] == approx([1, -1, 2, -3, -1])
+    assert S.reaction_energies({"H": 2})[0] == approx(-5)
+
+    with raises(KeyError):
+        S.species_energies({"He": 1})
+    with raises(ValueError):
+        S @ np.zeros(4)
+
+
+def test_StoichiometryMatrix_conflicting_energies():
+    with raises(ValueError):
+        StoichiometryMatrix.from_reactions([Reaction([Molecule("A", 0)], [Molecule("A", 1)])])
+
+
+def test_Path_stoichiometry():
+    path = Path.from_energies("ABC", [0, 1, -1])
+    S = path.stoichiometry()
+    assert S.shape == (2, 3)
+    assert S @ S.energies == approx(path.energies)
+    assert S @ np.array([[0, 1], [1, 1], [2, 1]]) == approx(np.array([[1, 0], [1, 0]]))
+
+
+def test_Web_stoichiometry():
+    mols = molecules()
+    H, H2, O2, H2O, OH = mols.values()
+    path1 = Path([Reaction([H, H], [H2]), Reaction([H2, H2, O2], [H2O, H2O])], "water")
+    path2 = Path([Reaction([H2O, H], [OH, H2])], "hydroxyl")
+    web = Web([path1, path2])
+
+    S = web.stoichiometry()
+    assert S.shape == (3, 5)
+    assert web.splits.tolist() == [2]
+    energies = np.split(S.reaction_energies(), web.splits)
+    assert energies[0] == approx(path1.energies)
+    assert energies[1] == approx(path2.energies)
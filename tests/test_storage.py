@@ -0,0 +1,94 @@
+import numpy as np
+from pytest import approx, mark, raises
+
+from reaction_web import Enumeration, EReaction, FrozenMolecule, Molecule, Path, Reaction, Web
+from reaction_web.storage import load, save
+from reaction_web.tools.generate_paths import enumeration_factory
+
+
+def make_web():
+    H2O, H, OH = Molecule("H2O", -10), Molecule("H", -1), FrozenMolecule("OH", -8)
+    path1 = Path([Reaction([H2O], [H, OH]), EReaction([H, OH], [H2O], -1, 0.5, 0.1)], "split", [1, 2])
+    path2 = Path([Reaction([H2O, H2O], [H2O])], "dimer")
+    return Web([path1, path2], "water", "eV")
+
+
+def test_Path_save(tmp_path):
+    path = make_web()[0]
+    path.save(str(tmp_path / "path"))
+    loaded = Path.load(str(tmp_path / "path.npz"))
+    assert loaded.name == path.name
+    assert loaded.energies == approx(path.energies)
+    assert loaded.steps == approx(path.steps)
+    assert isinstance(loaded[0].products[1], FrozenMolecule)
+    assert isinstance(loaded[1], EReaction) and loaded[1].u == 0.1
+
+    with raises(TypeError):
+        Web.load(str(tmp_path / "path"))
+
+
+def test_Web_save(tmp_path):
+    web = make_web()
+    web.save(str(tmp_path / "web"))
+    loaded = Web.load(str(tmp_path / "web"))
+    assert (loaded.name, loaded.units) == ("water", "eV")
+    assert [path.name for path in loaded] == ["split", "dimer"]
+    assert np.ma.allclose(loaded.relative_energies, web.relative_energies)
+
+    # shared molecules stay shared
+    assert loaded[0][0].reactants[0] is loaded[1][0].products[0]
+    assert loaded[0][0].products[0] is loaded[0][1].reactants[0]
+
+
+@mark.parametrize("dense", [False, True])
+def test_Enumeration_save(tmp_path, dense):
+    enm = enumeration_factory("tests/data/enum_2_3_2_3_4.csv", dense=dense, units="kcal/mol")
+    enm.save(str(tmp_path / "enumeration"))
+    assert (tmp_path / "enumeration.npy").exists()
+
+    loaded = Enumeration.load(str(tmp_path / "enumeration"))
+    assert loaded.dense and isinstance(loaded.paths.energies, np.memmap)
+    assert loaded.units == "kcal/mol"
+    assert loaded.path_names == enm.path_names
+    assert loaded.max() == approx(enm.max())
+    assert loaded["A", "C", "F", "I", "M"].energies == approx(enm["A", "C", "F", "I", "M"].energies)
+
+
+def test_Enumeration_save_records(tmp_path):
+    paths = np.empty((2, 2), dtype=object)
+    web = make_web()
+    paths[0, 0], paths[0, 1], paths[1, 0] = (
+        web[0],
+        Path.from_energies("ABC", [0, 2, 1]),
+        Path.from_energies("ACB", [0, 1, 3]),
+    )
+    enm = Enumeration(paths, {"r1": ("A", "B"), "r2": ("C", "D")}, "eV")
+    save(enm, str(tmp_path / "records"))
+    assert (tmp_path / "records.npz").exists()
+
+    loaded = load(str(tmp_path / "records"))
+    assert isinstance(loaded, Enumeration)
+    assert not loaded.dense
+    assert loaded["B", "D"] is None
+    assert loaded.missing().tolist() == [[False, False], [False, True]]
+    assert loaded.max()[~loaded.missing()] == approx(enm.max()[~enm.missing()])
+    assert loaded["A", "C"].energies == approx(web[0].energies)
+    assert loaded["A", "C"].steps == approx(web[0].steps)
+
+    with raises(TypeError):
+        save(web.paths, str(tmp_path / "list"))
+
+
+def test_Enumeration_save_electrochemical(tmp_path):
+    energies = np.arange(12.0).reshape(2, 3, 2)
+    enm = Enumeration.from_energies(energies, {"r1": ("A", "B"), "r2": ("C", "D", "E")}, ["X", "Y"], [1], [0.5])
+    paths = np.empty(enm.shape, dtype=object)
+    for i, path in enumerate(enm.paths.flat):
+        paths.flat[i] = path
+    objects = Enumeration(paths, enm.path_names)
+    objects.save(str(tmp_path / "electrochemical"))
+    assert (tmp_path / "electrochemical.npy").exists()
+
+    loaded = Enumeration.load(str(tmp_path / "electrochemical"))
+    assert loaded.paths.ne.tolist() == [1]
+    assert loaded.limiting_potential() == approx(enm.limiting_potential())
@@ -1,4 +1,7 @@
-from pytest import fixture, raises
+import pickle
+
+import numpy as np
+from pytest import approx, fixture, raises
 
 from reaction_web import EReaction, Molecule, Path, Reaction, Web
 
@@ -72,3 +75,65 @@ def test_getitem(web):
 def test_minmax(web):
     assert web.min() == ((0, 4), -6.5)
     assert web.max() == ((1, 1), 2)
+
+
+def test_potential_energies(web):
+    energies = web.potential_energies([0, 1])
+    assert [e.shape for e in energies] == [(2, 4), (2, 3), (2, 3)]
+    assert energies[1][1] == approx([2, 0, -8.5])
+    assert np.isnan(web.limiting_potential()).all()
+
+
+def test_energies(web):
+    energies = web.energies
+    assert energies.shape == (3, 4)
+    assert energies.mask.tolist() == [[False] * 4, [False] * 3 + [True], [False] * 3 + [True]]
+    assert energies[0].compressed() == approx([-1, 2, 0, -7.5])
+    assert energies[1].compressed() == approx([2, 0, -7.5])
+
+    relative_energies = web.relative_energies
+    assert relative_energies.shape == (3, 5)
+    assert relative_energies[1].compressed() == approx(web[1].relative_energies)
+    assert relative_energies.max(axis=1).compressed() == approx([1, 2, 2])
+    assert relative_energies.mean(axis=0)[4] == approx(-6.5)
+
+    assert web.energies is energies
+    web[0][0].products[0].energy = 1
+    assert web.energies is not energies
+    assert web.max() == ((0, 2), 1)
+
+    web.paths = web.paths[1:]
+    assert web.energies.shape == (2, 3)
+
+
+def test_convert():
+    shared = Molecule("H2", 0.5)
+    path1 = Path([Reaction([Molecule("A", 0)], [Molecule("B", 1)]), Reaction([Molecule("B", 1)], [shared])])
+    path2 = Path([Reaction([Molecule("C", 0)], [shared])])
+    web = Web([path1, path2], units="eV")
+
+    with raises(ValueError):
+        Web([path1]).convert("kcal/mol")
+
+    converted = web.convert("kcal/mol")
+    assert converted.units == "kcal/mol"
+    assert converted[0].energies == approx(np.array([1, -0.5]) * 23.0605, rel=1e-5)
+    assert converted.max()[1] == approx(23.0605, rel=1e-5)
+    assert converted[0][1].products[0] is converted[1][0].products[0]
+    assert converted.convert("eV").max()[1] == approx(1)
+
+    # Webs sharing the Molecules are untouched
+    other = Web([path2], units="eV")
+    assert (web.units, other.units) == ("eV", "eV")
+    assert shared.energy == 0.5
+    assert other.energies[0].compressed() == approx([0.5])
+
+    eweb = Web([Path([EReaction([Molecule("A", 0)], [Molecule("B", 1)], 1, 0.5)])], units="eV")
+    with raises(ValueError):
+        eweb.convert("kcal/mol")
+
+
+def test_pickle(web):
+    loaded = pickle.loads(pickle.dumps(web))
+    assert (loaded.name, loaded.units, len(loaded)) == (web.name, web.units, len(web))
+    assert np.ma.allclose(loaded.relative_energies, web.relative_energies)
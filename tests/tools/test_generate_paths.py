@@ -1,8 +1,18 @@
+from functools import partial
+
+import numpy as np
 import pandas as pd
-from pytest import mark
+from pytest import approx, mark, raises
 
-from reaction_web import Enumeration
-from reaction_web.tools.generate_paths import enumeration_factory, find_r_groups, read_csv, read_multipath_csv
+from reaction_web import Enumeration, LazyPathArray, Path, PathArray
+from reaction_web.tools.generate_paths import (
+    enumeration_factory,
+    find_r_groups,
+    read_csv,
+    read_multipath_csv,
+    read_multipath_energies,
+    stream_multipath_energies,
+)
 
 
 def test_read_csv():
@@ -62,3 +72,180 @@ def test_enumeration_factory2():
     assert isinstance(enm, Enumeration)
     assert enm.paths.shape == (2, 2, 2)
     assert len(enm.path_names) == 3
+
+
+def test_read_multipath_energies():
+    energies, species, pi_dict = read_multipath_energies("tests/data/enum_2_3.csv", energy="e_energy")
+    assert energies.shape == (2, 3, 4)
+    assert species == ("A", "B", "C", "D")
+    assert pi_dict == {"r1": ("C", "H"), "r2": ("B", "H", "I")}
+
+    paths_dict, _ = read_multipath_csv("tests/data/enum_2_3.csv", energy="e_energy")
+    assert energies[1, 1] == approx(np.cumsum([1, *paths_dict[("H", "H")].energies]))
+
+
+def test_enumeration_factory_dense():
+    enm = enumeration_factory("tests/data/enum_2_2_2.csv", dense=True)
+    assert isinstance(enm, Enumeration)
+    assert isinstance(enm.paths, PathArray)
+    assert enm.paths.shape == (2, 2, 2)
+    assert len(enm.path_names) == 3
+
+
+def test_enumeration_factory_lazy(tmp_path):
+    enm = enumeration_factory("tests/data/enum_2_3_2_3_4.csv", lazy=True)
+    full = enumeration_factory("tests/data/enum_2_3_2_3_4.csv")
+    assert isinstance(enm.paths, LazyPathArray)
+    assert enm.path_names == full.path_names
+    assert enm.max() == approx(full.max())
+    assert enm["A", "C", "F", "I", "M"].name == full["A", "C", "F", "I", "M"].name
+
+    df = pd.read_csv("tests/data/enum_2_2_2.csv", skipinitialspace=True)
+    df.iloc[2:].to_csv(tmp_path / "missing.csv", index=False)
+    with raises(KeyError):
+        enumeration_factory(str(tmp_path / "missing.csv"), lazy=True)
+    missing = enumeration_factory(str(tmp_path / "missing.csv"), lazy=True, allow_missing=True)
+    assert missing.missing().sum() == 1
+    assert missing["H", "H", "H"] is None
+
+
+def test_enumeration_factory_int_labels(tmp_path):
+    df = pd.read_csv("tests/data/enum_2_2_2.csv", skipinitialspace=True)
+    df["r1"] = df["r1"].map({label: i + 1 for i, label in enumerate(sorted(df["r1"].unique()))})
+    df.to_csv(tmp_path / "int.csv", index=False)
+
+    for kwargs in [{"dense": True}, {"dense": True, "chunksize": 5}, {"lazy": True}, {}]:
+        enm = enumeration_factory(str(tmp_path / "int.csv"), **kwargs)
+        assert enm.path_names["r1"] == (1, 2)
+        assert all(type(label) is int for label in enm.path_names["r1"])
+        assert enm[0, 0, 0].name == "(1, 'C', 'H')"
+
+        enm.save(str(tmp_path / "enm"))
+        assert Enumeration.load(str(tmp_path / "enm")).path_names == enm.path_names
+        if kwargs.get("dense"):
+            enm.to_npy(str(tmp_path / "enm.npy"))
+            assert Enumeration.from_npy(str(tmp_path / "enm.npy")).path_names == enm.path_names
+
+
+def test_read_multipath_energies_report(tmp_path):
+    df = pd.read_csv("tests/data/enum_2_2_2.csv", skipinitialspace=True)
+    shuffled = df.sample(frac=1, random_state=0)
+    shuffled.to_csv(tmp_path / "shuffled.csv", index=False)
+    energies, species, pi_dict = read_multipath_energies(str(tmp_path / "shuffled.csv"))
+    expected, expected_species, expected_pi_dict = read_multipath_energies("tests/data/enum_2_2_2.csv")
+    assert energies == approx(expected)
+    assert (species, pi_dict) == (expected_species, expected_pi_dict)
+
+    pd.concat([df, df.iloc[3:4]]).to_csv(tmp_path / "duplicate.csv", index=False)
+    with raises(ValueError, match="1 duplicated"):
+        read_multipath_energies(str(tmp_path / "duplicate.csv"))
+
+    df.drop(index=3).to_csv(tmp_path / "incomplete.csv", index=False)
+    with raises(KeyError, match="1 incomplete"):
+        read_multipath_energies(str(tmp_path / "incomplete.csv"))
+    energies, _, _ = read_multipath_energies(str(tmp_path / "incomplete.csv"), allow_missing=True)
+    assert np.isnan(energies).any(axis=-1).sum() == 1
+
+
+def test_stream_multipath_energies(tmp_path):
+    expected, expected_species, expected_pi_dict = read_multipath_energies("tests/data/enum_2_2_2.csv")
+    df = pd.read_csv("tests/data/enum_2_2_2.csv", skipinitialspace=True)
+    df.sample(frac=1, random_state=0).to_csv(tmp_path / "shuffled.csv", index=False)
+
+    for out in [None, str(tmp_path / "energies.npy")]:
+        energies, species, pi_dict = stream_multipath_energies(str(tmp_path / "shuffled.csv"), chunksize=3, out=out)
+        assert energies == approx(expected)
+        assert (species, pi_dict) == (expected_species, expected_pi_dict)
+    assert isinstance(energies, np.memmap)
+
+    # duplicates in different chunks
+    pd.concat([df, df.iloc[3:4]]).to_csv(tmp_path / "duplicate.csv", index=False)
+    with raises(ValueError, match="1 duplicated"):
+        stream_multipath_energies(str(tmp_path / "duplicate.csv"), chunksize=5)
+
+    df.drop(index=3).to_csv(tmp_path / "incomplete.csv", index=False)
+    with raises(KeyError, match="1 incomplete"):
+        stream_multipath_energies(str(tmp_path / "incomplete.csv"), chunksize=5)
+
+    enm = enumeration_factory("tests/data/enum_2_2_2.csv", dense=True, chunksize=5, out=str(tmp_path / "enm.npy"))
+    loaded = Enumeration.from_npy(str(tmp_path / "enm.npy"))
+    assert loaded.path_names == enm.path_names
+    assert loaded.paths.energies == approx(expected)
+
+
+def test_enumeration_factory_files(tmp_path):
+    df = pd.read_csv("tests/data/enum_2_3_2_3_4.csv", skipinitialspace=True)
+    for i, (_, shard) in enumerate(df.groupby("r1")):
+        shard.to_csv(tmp_path / f"shard_{i}.csv", index=False)
+    files = [str(tmp_path / "shard_1.csv"), str(tmp_path / "shard_0.csv")]
+
+    full = enumeration_factory("tests/data/enum_2_3_2_3_4.csv", dense=True)
+    for infile in [str(tmp_path / "shard_*.csv"), files]:
+        enm = enumeration_factory(infile, dense=True, workers=2)
+        assert enm.path_names == full.path_names
+        assert enm.paths.energies == approx(full.paths.energies)
+
+    paths = enumeration_factory(files, workers=2)
+    assert paths["A", "C", "F", "I", "M"].name == full["A", "C", "F", "I", "M"].name
+    streamed = enumeration_factory(files, dense=True, chunksize=7)
+    assert streamed.paths.energies == approx(full.paths.energies)
+
+    with raises(FileNotFoundError):
+        enumeration_factory(str(tmp_path / "missing_*.csv"))
+
+
+def test_combine_steps(tmp_path):
+    rows = [
+        ("A", 1, "H", 0.0),
+        ("H2O", 2, "H", -1.0),
+        ("*OH", 2, "H", 3.0),
+        ("B", 3, "H", 1.0),
+        ("A", 1, "F", 0.0),
+        ("*OH", 2, "F", 1.0),
+        ("H2O", 2, "F", -1.0),
+        ("B", 3, "F", 2.0),
+    ]
+    pd.DataFrame(rows, columns=["name", "step", "r1", "energy"]).to_csv(tmp_path / "steps.csv", index=False)
+    infile = str(tmp_path / "steps.csv")
+
+    paths_dict, _ = read_multipath_csv(infile)
+    path = paths_dict[("H",)]
+    assert [mol.name for mol in path[0].products] == ["H2O", "*OH"]
+    assert path.energies == approx([2, -1])
+    assert paths_dict[("F",)].energies == approx([0, 2])
+
+    energies, species, pi_dict = read_multipath_energies(infile)
+    assert pi_dict == {"r1": ("F", "H")}
+    assert species == ("A", "*OH + H2O", "B")
+    assert energies == approx(np.array([[0, 0, 2], [0, 2, 1]]))
+
+    streamed, streamed_species, _ = stream_multipath_energies(infile, chunksize=3)
+    assert streamed == approx(energies)
+    assert streamed_species == species
+
+
+def test_combine_steps_checks(tmp_path):
+    # an exact duplicate row is not a second molecule on the step
+    df = pd.read_csv("tests/data/enum_2_3.csv", skipinitialspace=True)
+    pd.concat([df, df.iloc[[0]]]).to_csv(tmp_path / "duplicate.csv", index=False)
+    infile = str(tmp_path / "duplicate.csv")
+    for kwargs in [{}, {"lazy": True}, {"dense": True}, {"dense": True, "chunksize": 5}]:
+        with raises(ValueError, match="1 duplicated"):
+            enumeration_factory(infile, energy="e_energy", **kwargs)
+    with raises(ValueError, match="Duplicated"):
+        Path.from_steps(["A", "B", "B"], [0, 1, 1], [1, 2, 2])
+
+    # every path must have the same molecules on each step as the species
+    rows = [("A", 1, "H", 0.0), ("B", 2, "H", 1.0), ("A", 1, "F", 0.0), ("C", 2, "F", 1.0)]
+    pd.DataFrame(rows, columns=["name", "step", "r1", "energy"]).to_csv(tmp_path / "differ.csv", index=False)
+    rows = [("A", 1, "F", 0.0), ("B", 2, "F", 1.0), ("C", 2, "F", 1.0), ("A", 1, "H", 0.0), ("B", 2, "H", 1.0)]
+    pd.DataFrame(rows, columns=["name", "step", "r1", "energy"]).to_csv(tmp_path / "partial.csv", index=False)
+    for reader in [read_multipath_energies, partial(stream_multipath_energies, chunksize=2)]:
+        with raises(ValueError, match="differ from the species"):
+            reader(str(tmp_path / "differ.csv"))
+        with raises(ValueError, match="missing molecules"):
+            reader(str(tmp_path / "partial.csv"))
+
+    # Paths are independent of each other
+    paths_dict, _ = read_multipath_csv(str(tmp_path / "differ.csv"))
+    assert paths_dict[("F",)][0].products[0].name == "C"
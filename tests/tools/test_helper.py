@@ -1,6 +1,8 @@
+from itertools import permutations
+
 from pytest import approx, mark, raises
 
-from reaction_web.tools.helper import energy_conversion
+from reaction_web.tools.helper import energy_conversion, energy_conversions
 
 
 @mark.parametrize(
@@ -18,3 +20,8 @@ def test_energy_conversion(from_e, to_e, expected):
 def test_energy_conversion_raises():
     with raises(ValueError):
         energy_conversion("H", "kcal/mol")
+
+
+def test_energy_conversion_round_trip():
+    for from_e, to_e in permutations(energy_conversions, 2):
+        assert energy_conversion(from_e, to_e) * energy_conversion(to_e, from_e) == approx(1, rel=1e-15)